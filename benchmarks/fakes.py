@@ -0,0 +1,355 @@
+"""Local stand-ins for a Minecraft server and the mcsrvstat.us API.
+
+Both run in-process on the loopback interface, so benchmarks work offline.
+"""
+
+import asyncio
+import json
+import random
+import struct
+import time
+from dataclasses import dataclass, field
+
+import uvicorn
+from fastapi import FastAPI, HTTPException, Response
+
+# A 1x1 transparent PNG.
+AVATAR_PNG = bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+    "1f15c4890000000d49444154789c6300010000050001"
+    "0d0a2db40000000049454e44ae426082"
+)
+
+
+def encode_varint(value: int) -> bytes:
+    """Encode an integer as a protocol VarInt."""
+    encoded = bytearray()
+    value &= 0xFFFFFFFF
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            encoded.append(byte | 0x80)
+        else:
+            encoded.append(byte)
+            return bytes(encoded)
+
+
+async def read_varint(reader: asyncio.StreamReader) -> int:
+    """Read a protocol VarInt from a stream."""
+    value = 0
+    for position in range(5):
+        byte = (await reader.readexactly(1))[0]
+        value |= (byte & 0x7F) << (7 * position)
+        if not byte & 0x80:
+            return value
+    raise ValueError("VarInt is too big")
+
+
+def encode_packet(packet_id: int, payload: bytes) -> bytes:
+    """Frame a packet with its id and length prefix."""
+    data = encode_varint(packet_id) + payload
+    return encode_varint(len(data)) + data
+
+
+def encode_string(value: str) -> bytes:
+    """Encode a length-prefixed UTF-8 string."""
+    encoded = value.encode("utf-8")
+    return encode_varint(len(encoded)) + encoded
+
+
+@dataclass
+class FakeServerStats:
+    """Counters of the requests a fake has answered."""
+
+    status: int = 0
+    query: int = 0
+    query_handshake: int = 0
+    connections: int = 0
+    failures: int = 0
+    avatar: int = 0
+
+
+@dataclass
+class FakeMinecraftServer:
+    """A Java server speaking the Server List Ping and UDP Query protocols."""
+
+    host: str = "127.0.0.1"
+    delay: float = 0.0
+    failure_rate: float = 0.0
+    players_online: int = 5
+    players_max: int = 20
+    version: str = "1.21.10"
+    protocol: int = 773
+    software: str = "Paper on 1.21.10"
+    motd: str = "A fake Minecraft server"
+    map_name: str = "world"
+    plugins: list[str] = field(
+        default_factory=lambda: ["Essentials 2.20.1", "WorldEdit 7.3.0"]
+    )
+    challenge_lifetime: float = 30.0
+    stats: FakeServerStats = field(default_factory=FakeServerStats)
+    port: int = 0
+
+    def __post_init__(self) -> None:
+        self.challenge_token = 0
+        self.challenge_expires_at = 0.0
+        self.tcp_server: asyncio.Server | None = None
+        self.udp_transport: asyncio.DatagramTransport | None = None
+
+    @property
+    def player_names(self) -> list[str]:
+        return [f"Player{index}" for index in range(self.players_online)]
+
+    async def start(self) -> None:
+        """Listen for TCP status pings and UDP queries on the same port."""
+        self.tcp_server = await asyncio.start_server(
+            self._handle_connection, self.host, self.port
+        )
+        self.port = self.tcp_server.sockets[0].getsockname()[1]
+
+        loop = asyncio.get_running_loop()
+        self.udp_transport, _ = await loop.create_datagram_endpoint(
+            lambda: _QueryProtocol(self),
+            local_addr=(self.host, self.port),
+        )
+
+    async def stop(self) -> None:
+        if self.udp_transport:
+            self.udp_transport.close()
+        if self.tcp_server:
+            self.tcp_server.close()
+            await self.tcp_server.wait_closed()
+
+    def should_fail(self) -> bool:
+        if self.failure_rate and random.random() < self.failure_rate:
+            self.stats.failures += 1
+            return True
+        return False
+
+    def status_response(self) -> dict:
+        return {
+            "version": {"name": self.software, "protocol": self.protocol},
+            "players": {
+                "online": self.players_online,
+                "max": self.players_max,
+                "sample": [
+                    {"name": name, "id": f"00000000-0000-0000-0000-{index:012d}"}
+                    for index, name in enumerate(self.player_names[:12])
+                ],
+            },
+            "description": {"text": self.motd},
+        }
+
+    def current_challenge(self) -> int:
+        now = time.monotonic()
+        if now >= self.challenge_expires_at:
+            self.challenge_token = random.randint(1, 2**31 - 1)
+            self.challenge_expires_at = now + self.challenge_lifetime
+        return self.challenge_token
+
+    def query_response(self, session: bytes) -> bytes:
+        values = {
+            "hostname": self.motd,
+            "gametype": "SMP",
+            "game_id": "MINECRAFT",
+            "version": self.version,
+            "plugins": f"{self.software}: {'; '.join(self.plugins)}",
+            "map": self.map_name,
+            "numplayers": str(self.players_online),
+            "maxplayers": str(self.players_max),
+            "hostport": str(self.port),
+            "hostip": self.host,
+        }
+        body = b"".join(
+            key.encode("latin-1") + b"\x00" + value.encode("latin-1") + b"\x00"
+            for key, value in values.items()
+        )
+        players = b"".join(
+            name.encode("latin-1") + b"\x00" for name in self.player_names
+        )
+        return (
+            b"\x00"
+            + session
+            + b"splitnum\x00\x80\x00"
+            + body
+            + b"\x00\x01player_\x00\x00"
+            + players
+            + b"\x00"
+        )
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.stats.connections += 1
+        try:
+            # Handshake, the content does not matter for a status request.
+            await reader.readexactly(await read_varint(reader))
+
+            while True:
+                packet = await reader.readexactly(await read_varint(reader))
+                packet_id = packet[0]
+
+                if self.delay:
+                    await asyncio.sleep(self.delay)
+                if self.should_fail():
+                    return
+
+                if packet_id == 0x00:
+                    self.stats.status += 1
+                    payload = encode_string(json.dumps(self.status_response()))
+                    writer.write(encode_packet(0x00, payload))
+                elif packet_id == 0x01:
+                    writer.write(encode_packet(0x01, packet[1:9]))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+
+class _QueryProtocol(asyncio.DatagramProtocol):
+    def __init__(self, server: FakeMinecraftServer) -> None:
+        self.server = server
+        self.transport: asyncio.DatagramTransport | None = None
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self.transport = transport  # type: ignore[assignment]
+
+    def datagram_received(self, data: bytes, address: tuple[str, int]) -> None:
+        if len(data) < 7 or data[:2] != b"\xfe\xfd":
+            return
+        if self.server.should_fail():
+            return
+
+        packet_type, session = data[2], data[3:7]
+
+        if packet_type == 0x09:
+            self.server.stats.query_handshake += 1
+            token = str(self.server.current_challenge()).encode("ascii")
+            response = b"\x09" + session + token + b"\x00"
+        elif packet_type == 0x00 and len(data) >= 11:
+            (token,) = struct.unpack("!i", data[7:11])
+            if token != self.server.current_challenge():
+                return
+            self.server.stats.query += 1
+            response = self.server.query_response(session)
+        else:
+            return
+
+        loop = asyncio.get_running_loop()
+        loop.call_later(self.server.delay, self._send, response, address)
+
+    def _send(self, response: bytes, address: tuple[str, int]) -> None:
+        if self.transport and not self.transport.is_closing():
+            self.transport.sendto(response, address)
+
+
+@dataclass
+class FakeMcSrvStat:
+    """An HTTP stand-in for the mcsrvstat.us v3 API and the avatar service."""
+
+    server: FakeMinecraftServer
+    host: str = "127.0.0.1"
+    delay: float = 0.0
+    failure_rate: float = 0.0
+    cache_ttl: float = 0.0
+    slow_rate: float = 0.0
+    slow_delay: float = 0.0
+    stats: FakeServerStats = field(default_factory=FakeServerStats)
+    port: int = 0
+
+    def __post_init__(self) -> None:
+        self.uvicorn_server: uvicorn.Server | None = None
+        self.serve_task: asyncio.Task | None = None
+        self.app = FastAPI()
+        self.app.add_api_route("/3/{address}", self._status)
+        self.app.add_api_route("/avatar/{uuid}/32", self._avatar)
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self) -> None:
+        config = uvicorn.Config(
+            self.app,
+            host=self.host,
+            port=self.port,
+            log_config=None,
+            log_level="warning",
+            access_log=False,
+            lifespan="off",
+        )
+        self.uvicorn_server = uvicorn.Server(config)
+        self.serve_task = asyncio.create_task(self.uvicorn_server.serve())
+        while not self.uvicorn_server.started:
+            await asyncio.sleep(0.01)
+        self.port = self.uvicorn_server.servers[0].sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        if self.uvicorn_server and self.serve_task:
+            self.uvicorn_server.should_exit = True
+            await self.serve_task
+
+    async def _avatar(self, uuid: str) -> Response:
+        if self.delay:
+            await asyncio.sleep(self.delay)
+
+        self.stats.avatar += 1
+        return Response(content=AVATAR_PNG, media_type="image/png")
+
+    async def _status(self, address: str) -> dict:
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.slow_rate and random.random() < self.slow_rate:
+            await asyncio.sleep(self.slow_delay)
+        if self.failure_rate and random.random() < self.failure_rate:
+            self.stats.failures += 1
+            raise HTTPException(status_code=503)
+
+        self.stats.status += 1
+        now = int(time.time())
+        host, _, port = address.partition(":")
+        motd = self.server.motd
+
+        return {
+            "online": True,
+            "ip": self.server.host,
+            "port": int(port or self.server.port),
+            "hostname": host,
+            "debug": {
+                "ping": True,
+                "query": True,
+                "bedrock": False,
+                "srv": False,
+                "querymismatch": False,
+                "ipinsrv": False,
+                "cnameinsrv": False,
+                "animatedmotd": False,
+                "cachehit": False,
+                "cachetime": now,
+                "cacheexpire": int(now + self.cache_ttl),
+                "apiversion": 3,
+            },
+            "version": self.server.version,
+            "protocol": {"version": self.server.protocol, "name": self.server.version},
+            "software": self.server.software,
+            "map": {
+                "raw": self.server.map_name,
+                "clean": self.server.map_name,
+                "html": self.server.map_name,
+            },
+            "motd": {"raw": [motd], "clean": [motd], "html": [motd]},
+            "players": {
+                "online": self.server.players_online,
+                "max": self.server.players_max,
+                "list": [
+                    {"name": name, "uuid": f"00000000-0000-0000-0000-{index:012d}"}
+                    for index, name in enumerate(self.server.player_names)
+                ],
+            },
+            "plugins": [
+                {"name": plugin.split(" ")[0], "version": plugin.split(" ")[-1]}
+                for plugin in self.server.plugins
+            ],
+        }
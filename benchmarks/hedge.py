@@ -0,0 +1,211 @@
+"""Tail latency benchmark for hedged mcsrvstat requests.
+
+Fetches the status from a fake mcsrvstat.us that answers a share of the
+requests slowly, once with plain requests and once hedged, and compares the
+latency percentiles. Run with `uv run python -m benchmarks.hedge`.
+
+With `--check` it instead verifies the hedging against requests with
+injected latencies, failing if the hedge does not fire after the delay, the
+loser is not cancelled or the budget is exceeded.
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import sys
+import time
+
+from benchmarks.fakes import FakeMcSrvStat, FakeMinecraftServer
+from minecraft_dashboard.const import HEDGE_MIN_SAMPLES
+from minecraft_dashboard.hedge import HedgedRequest
+from minecraft_dashboard.utils import MinecraftUtils
+
+
+async def measure(
+    url: str, requests: int, hedge: HedgedRequest | None
+) -> tuple[list[float], int]:
+    """Fetch the status sequentially and return the latencies in ms and errors."""
+    latencies: list[float] = []
+    errors = 0
+
+    for _ in range(requests):
+        start = time.perf_counter()
+        if hedge:
+            result = await hedge.run(
+                lambda: MinecraftUtils._fetch_mcsrvstat_status(url, 10)
+            )
+        else:
+            result = await MinecraftUtils._fetch_mcsrvstat_status(url, 10)
+        latencies.append((time.perf_counter() - start) * 1000)
+        errors += result is None
+
+    return latencies, errors
+
+
+def print_result(
+    name: str, latencies: list[float], errors: int, hedge: HedgedRequest | None
+) -> None:
+    """Print the latency percentiles of a run."""
+    percentiles = statistics.quantiles(latencies, n=100)
+    line = (
+        f"{name:<8} p50 {percentiles[49]:7.1f}ms  p95 {percentiles[94]:7.1f}ms  "
+        f"p99 {percentiles[98]:7.1f}ms  max {max(latencies):7.1f}ms  "
+        f"errors {errors}"
+    )
+    if hedge:
+        data = hedge.to_data()
+        line += f"  hedged {data.hedge_rate:.1%}  won {data.hedge_wins}/{data.hedges}"
+    print(line)
+
+
+async def run(arguments: argparse.Namespace) -> None:
+    server = FakeMinecraftServer()
+    mcsrvstat = FakeMcSrvStat(
+        server,
+        delay=arguments.delay,
+        slow_rate=arguments.slow_rate,
+        slow_delay=arguments.slow_delay,
+    )
+    await mcsrvstat.start()
+    url = f"{mcsrvstat.url}/3/{server.host}:{server.port}"
+
+    try:
+        hedge = HedgedRequest("mcsrvstat", budget_ratio=arguments.budget)
+        # Learn the latency distribution before measuring.
+        await measure(url, arguments.warmup, hedge)
+        hedge.requests = hedge.hedges = hedge.hedge_wins = 0
+
+        plain_latencies, plain_errors = await measure(url, arguments.requests, None)
+        print_result("plain", plain_latencies, plain_errors, None)
+
+        hedged_latencies, hedged_errors = await measure(url, arguments.requests, hedge)
+        print_result("hedged", hedged_latencies, hedged_errors, hedge)
+    finally:
+        await mcsrvstat.stop()
+
+
+class FakeRequests:
+    """Requests that answer after injected latencies and record cancellations."""
+
+    def __init__(self, *latencies: float) -> None:
+        self.latencies = list(latencies)
+        self.started: list[float] = []
+        self.cancelled = 0
+
+    async def request(self) -> str:
+        latency = self.latencies[min(len(self.started), len(self.latencies) - 1)]
+        self.started.append(time.perf_counter())
+        try:
+            await asyncio.sleep(latency)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return "ok"
+
+
+def create_hedge(delay: float, budget_ratio: float) -> HedgedRequest[str]:
+    """Create a hedged request that already learned a latency of `delay`."""
+    hedge: HedgedRequest[str] = HedgedRequest(
+        "check", budget_ratio=budget_ratio, budget_burst=1.0
+    )
+    hedge.latencies.extend([delay] * HEDGE_MIN_SAMPLES)
+    return hedge
+
+
+async def check() -> list[str]:
+    """Verify the hedging and return the failed expectations."""
+    failures = []
+    delay = 0.05
+
+    # A slow primary is hedged after the delay and the faster hedge wins.
+    hedge = create_hedge(delay, budget_ratio=1.0)
+    requests = FakeRequests(1.0, 0.01)
+    start = time.perf_counter()
+    result = await hedge.run(requests.request)
+    elapsed = time.perf_counter() - start
+    await asyncio.sleep(0)
+    if result != "ok" or hedge.hedges != 1 or hedge.hedge_wins != 1:
+        failures.append(f"slow primary was not hedged: {hedge.to_data()}")
+    elif requests.started[1] - start < delay:
+        failures.append("hedge fired before the delay")
+    elif elapsed >= 0.5:
+        failures.append(f"hedged request took {elapsed:.3f}s")
+    if requests.cancelled != 1:
+        failures.append(f"losing primary was not cancelled ({requests.cancelled})")
+
+    # A fast primary is never hedged.
+    hedge = create_hedge(delay, budget_ratio=1.0)
+    await hedge.run(FakeRequests(0.001).request)
+    if hedge.hedges:
+        failures.append("fast primary was hedged")
+
+    # Hedges stay within the budget while the upstream is slow throughout.
+    hedge = create_hedge(0.001, budget_ratio=0.1)
+    for _ in range(100):
+        await hedge.run(FakeRequests(0.005).request)
+    if hedge.hedges > 100 * 0.1 + 1:
+        failures.append(f"{hedge.hedges} hedges in 100 requests exceed the budget")
+
+    # Cancelling the caller cancels the request it is waiting for.
+    hedge = create_hedge(delay, budget_ratio=1.0)
+    requests = FakeRequests(1.0)
+    task = asyncio.create_task(hedge.run(requests.request))
+    await asyncio.sleep(delay / 2)
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+    await asyncio.sleep(0)
+    if requests.cancelled != 1:
+        failures.append("cancelling the caller left the primary running")
+
+    return failures
+
+
+def create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Hedged request benchmark")
+    parser.add_argument(
+        "--check", action="store_true", help="Verify the hedging and exit"
+    )
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--warmup", type=int, default=50)
+    parser.add_argument(
+        "--delay", type=float, default=0.01, help="Fake upstream delay in seconds"
+    )
+    parser.add_argument(
+        "--slow-rate",
+        type=float,
+        default=0.03,
+        help="Share of requests the fake upstream answers slowly",
+    )
+    parser.add_argument(
+        "--slow-delay",
+        type=float,
+        default=0.5,
+        help="Extra delay of slow answers in seconds",
+    )
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=0.05,
+        help="Share of requests that may be hedged",
+    )
+    return parser
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.WARNING)
+    arguments = create_parser().parse_args()
+    if not arguments.check:
+        asyncio.run(run(arguments))
+        return
+
+    failures = asyncio.run(check())
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if failures:
+        sys.exit(1)
+    print("PASS: hedging fires after the delay, cancels the loser, keeps the budget")
+
+
+if __name__ == "__main__":
+    main()
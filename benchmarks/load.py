@@ -0,0 +1,310 @@
+"""End-to-end load benchmark for the dashboard API.
+
+Starts a fake Minecraft server and a fake mcsrvstat.us, boots the full
+FastAPI app against them and hits `/api/status` at increasing concurrency.
+Run with `uv run python -m benchmarks.load`.
+
+With `--workers N` the dashboard runs as a real uvicorn deployment with N
+worker processes and is benchmarked over HTTP instead of in-process.
+`--profile default tuned` compares uvicorn's stock settings with the tuned
+runtime profile over HTTP.
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import httpx
+
+from benchmarks.fakes import FakeMcSrvStat, FakeMinecraftServer
+from minecraft_dashboard.config import Config
+
+PROFILES = {
+    "default": {"api_loop": "asyncio", "api_http": "h11", "api_access_log": True},
+    "tuned": {"api_loop": "auto", "api_http": "auto", "api_access_log": False},
+}
+
+
+@dataclass
+class LevelResult:
+    """Measurements of a single concurrency level."""
+
+    concurrency: int
+    requests: int
+    errors: int
+    duration: float
+    latencies: list[float]
+    probes: int
+
+    @property
+    def throughput(self) -> float:
+        return self.requests / self.duration
+
+    def percentile(self, percentile: int) -> float:
+        if len(self.latencies) < 2:
+            return self.latencies[0] if self.latencies else 0.0
+        return statistics.quantiles(self.latencies, n=100)[percentile - 1]
+
+
+def create_config(
+    server: FakeMinecraftServer, mcsrvstat: FakeMcSrvStat, probe_interval: float
+) -> Config:
+    """Create a configuration pointing the dashboard at the fakes."""
+    config = Config()
+    config.minecraft_server_host = server.host
+    config.minecraft_server_port = server.port
+    config.mcsrvstat_url = mcsrvstat.url
+    config.avatar_url = f"{mcsrvstat.url}/avatar/{{uuid}}/32"
+    config.avatar_cache_path = None
+    config.ping_host_external = server.host
+    config.ping_port_external = server.port
+    config.minecraft_server_timeout = 2
+    config.minecraft_server_status_interval = probe_interval
+    config.minecraft_server_query_interval = probe_interval * 10
+    config.mcsrvstat_interval = probe_interval * 2
+    config.state_path = None
+    config.history_path = None
+    # Every request comes from the same address.
+    config.api_rate_limit = 0
+    config.api_max_concurrency = 0
+    return config
+
+
+def count_probes(server: FakeMinecraftServer, mcsrvstat: FakeMcSrvStat) -> int:
+    """Count every probe the fakes have answered so far."""
+    return server.stats.status + server.stats.query + mcsrvstat.stats.status
+
+
+async def run_level(
+    client: httpx.AsyncClient,
+    path: str,
+    concurrency: int,
+    total_requests: int,
+    server: FakeMinecraftServer,
+    mcsrvstat: FakeMcSrvStat,
+) -> LevelResult:
+    """Issue requests with a fixed number of concurrent workers."""
+    latencies: list[float] = []
+    errors = 0
+    remaining = total_requests
+
+    async def worker() -> None:
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            start = time.perf_counter()
+            try:
+                response = await client.get(path)
+                if response.status_code >= 400:
+                    errors += 1
+            except httpx.HTTPError:
+                errors += 1
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    probes_before = count_probes(server, mcsrvstat)
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    duration = time.perf_counter() - start
+
+    return LevelResult(
+        concurrency=concurrency,
+        requests=total_requests,
+        errors=errors,
+        duration=duration,
+        latencies=latencies,
+        probes=count_probes(server, mcsrvstat) - probes_before,
+    )
+
+
+def print_results(results: list[LevelResult]) -> None:
+    print(
+        f"{'concurrency':>11} {'req/s':>9} {'p50':>9} {'p99':>9} "
+        f"{'errors':>7} {'probes/req':>11}"
+    )
+    for result in results:
+        print(
+            f"{result.concurrency:>11} {result.throughput:>9.0f} "
+            f"{result.percentile(50):>7.2f}ms {result.percentile(99):>7.2f}ms "
+            f"{result.errors:>7} {result.probes / result.requests:>11.4f}"
+        )
+
+
+async def run_levels(
+    client: httpx.AsyncClient,
+    arguments: argparse.Namespace,
+    server: FakeMinecraftServer,
+    mcsrvstat: FakeMcSrvStat,
+) -> list[LevelResult]:
+    """Warm up and run every configured concurrency level."""
+    await client.get(arguments.path)
+
+    return [
+        await run_level(
+            client,
+            arguments.path,
+            concurrency,
+            arguments.requests,
+            server,
+            mcsrvstat,
+        )
+        for concurrency in arguments.concurrency
+    ]
+
+
+def get_free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def wait_until_healthy(client: httpx.AsyncClient, timeout: float = 30.0) -> None:
+    """Wait until every worker has booted and the first status is published."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            response = await client.get("/api/status")
+            if response.status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        await asyncio.sleep(0.1)
+    raise TimeoutError("The dashboard did not become healthy in time")
+
+
+async def run_workers(
+    arguments: argparse.Namespace,
+    server: FakeMinecraftServer,
+    mcsrvstat: FakeMcSrvStat,
+    profile: str,
+) -> list[LevelResult]:
+    """Benchmark a uvicorn deployment with a runtime profile over HTTP."""
+    config = create_config(server, mcsrvstat, arguments.probe_interval)
+    config.api_host = "127.0.0.1"
+    config.api_port = get_free_port()
+    config.api_workers = max(arguments.workers, 1)
+    config.log_path = None
+    config.log_level = "INFO"
+    for name, value in PROFILES[profile].items():
+        setattr(config, name, value)
+
+    with tempfile.TemporaryDirectory() as directory:
+        Path(directory, "config.yaml").write_text(config.to_yaml(), encoding="utf-8")
+        environment = os.environ | {
+            "PYTHONPATH": str(Path(__file__).parent.parent),
+        }
+        process = subprocess.Popen(
+            [sys.executable, "-m", "minecraft_dashboard"],
+            cwd=directory,
+            env=environment,
+            stdout=subprocess.DEVNULL,
+        )
+
+        try:
+            limits = httpx.Limits(max_connections=max(arguments.concurrency))
+            async with httpx.AsyncClient(
+                base_url=f"http://127.0.0.1:{config.api_port}", limits=limits
+            ) as client:
+                await wait_until_healthy(client)
+                return await run_levels(client, arguments, server, mcsrvstat)
+        finally:
+            process.terminate()
+            process.wait(timeout=30)
+
+
+async def run(arguments: argparse.Namespace) -> dict[str, list[LevelResult]]:
+    server = FakeMinecraftServer(
+        delay=arguments.delay,
+        failure_rate=arguments.failure_rate,
+        players_online=arguments.players,
+    )
+    mcsrvstat = FakeMcSrvStat(
+        server,
+        delay=arguments.mcsrvstat_delay,
+        failure_rate=arguments.failure_rate,
+    )
+    await server.start()
+    await mcsrvstat.start()
+
+    try:
+        if arguments.workers or arguments.profile:
+            return {
+                f"{profile} profile, {max(arguments.workers, 1)} workers": (
+                    await run_workers(arguments, server, mcsrvstat, profile)
+                )
+                for profile in arguments.profile or ["tuned"]
+            }
+
+        from minecraft_dashboard.__main__ import init_app
+
+        app = init_app(create_config(server, mcsrvstat, arguments.probe_interval))
+        async with app.router.lifespan_context(app):
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://dashboard"
+            ) as client:
+                return {
+                    "in-process": await run_levels(client, arguments, server, mcsrvstat)
+                }
+    finally:
+        await mcsrvstat.stop()
+        await server.stop()
+
+
+def create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="End-to-end load benchmark")
+    parser.add_argument("--path", default="/api/status")
+    parser.add_argument(
+        "--concurrency", type=int, nargs="+", default=[1, 4, 16, 64, 256]
+    )
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--players", type=int, default=20)
+    parser.add_argument(
+        "--delay", type=float, default=0.005, help="Fake server delay in seconds"
+    )
+    parser.add_argument(
+        "--mcsrvstat-delay",
+        type=float,
+        default=0.05,
+        help="Fake mcsrvstat delay in seconds",
+    )
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument(
+        "--probe-interval",
+        type=float,
+        default=1.0,
+        help="Status probe interval of the dashboard in seconds",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        help="Run the dashboard with this many uvicorn workers over HTTP",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="+",
+        choices=PROFILES,
+        help="Runtime profiles to compare over HTTP",
+    )
+    return parser
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.WARNING)
+    arguments = create_parser().parse_args()
+    for name, results in asyncio.run(run(arguments)).items():
+        print(name)
+        print_results(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Memory footprint benchmark of retained status snapshots.
+
+Parses a series of statuses of a busy server, with players joining and
+leaving between them, and keeps them once as pydantic models and once as
+slotted snapshots. Reports the bytes per retained status measured with
+tracemalloc. Run with `uv run python -m benchmarks.memory`.
+"""
+
+import argparse
+import base64
+import gc
+import random
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from minecraft_dashboard.models import (
+    MotdData,
+    PlayerData,
+    PlayersData,
+    PluginData,
+    ProtocolData,
+    Status,
+    StatusData,
+)
+from minecraft_dashboard.snapshot import StatusSnapshot
+
+
+def create_status_jsons(
+    count: int, players: int, plugins: int, icon_size: int
+) -> list[bytes]:
+    """Create serialized statuses the way peers or shared memory deliver them."""
+    random_generator = random.Random(0)
+    player_pool = [
+        PlayerData(
+            name=f"Player{index}", uuid=f"{index:08x}-0000-4000-8000-{index:012x}"
+        )
+        for index in range(players * 2)
+    ]
+    icon = "data:image/png;base64," + base64.b64encode(
+        random_generator.randbytes(icon_size)
+    ).decode("ascii")
+    status_jsons = []
+
+    for index in range(count):
+        online = random_generator.randint(players // 2, players)
+        status_data = StatusData(
+            latency=random_generator.randint(20, 80),
+            ip="127.0.0.1",
+            port=25565,
+            hostname="play.example.com",
+            version="1.21.4",
+            protocol=ProtocolData(version=769, name="1.21.4"),
+            icon=icon,
+            software="Paper",
+            map="world",
+            motd=MotdData(plain="A Minecraft Server", html="A Minecraft Server"),
+            players=PlayersData(
+                online=online,
+                max=players * 2,
+                player_list=random_generator.sample(player_pool, online),
+            ),
+            plugins=[
+                PluginData(name=f"Plugin{plugin}", version=f"1.{plugin}.0")
+                for plugin in range(plugins)
+            ],
+        )
+        status = Status(
+            data=status_data, data_external=status_data, polling_interval=5000
+        )
+        status_jsons.append(status.model_dump_json().encode("utf-8"))
+
+    return status_jsons
+
+
+def measure(status_jsons: list[bytes], convert: Callable[[bytes], Any]) -> float:
+    """Return the bytes retained per status by a conversion of the statuses."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        retained = [convert(status_json) for status_json in status_jsons]
+        gc.collect()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    del retained
+    return (after - before) / len(status_jsons)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Status memory footprint benchmark")
+    parser.add_argument("--count", type=int, default=1000)
+    parser.add_argument("--players", type=int, default=50)
+    parser.add_argument("--plugins", type=int, default=30)
+    parser.add_argument(
+        "--icon-size", type=int, default=3000, help="Server icon size in bytes"
+    )
+    arguments = parser.parse_args()
+
+    status_jsons = create_status_jsons(
+        arguments.count, arguments.players, arguments.plugins, arguments.icon_size
+    )
+    results = {
+        "pydantic": measure(status_jsons, Status.model_validate_json),
+        "snapshot": measure(
+            status_jsons,
+            lambda status_json: StatusSnapshot.from_model(
+                Status.model_validate_json(status_json)
+            ),
+        ),
+    }
+
+    print(f"{'representation':<15} {'bytes/status':>13} {'ratio':>7}")
+    for name, bytes_per_status in results.items():
+        print(
+            f"{name:<15} {bytes_per_status:>13,.0f} "
+            f"{bytes_per_status / results['pydantic']:>7.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,313 @@
+"""Long-running soak test of the dashboard for resource leaks.
+
+Boots the full app against the fake Minecraft server and fake mcsrvstat.us
+with an accelerated probe rate and light API traffic, lets players join and
+leave, and samples the traced Python memory, the live asyncio tasks, the
+open file descriptors and the objects tracked by the garbage collector.
+After the warmup the first sample becomes the baseline; the run fails when
+any of them grew beyond its threshold by the end. Run with
+`uv run python -m benchmarks.soak --duration 14400`.
+"""
+
+import argparse
+import asyncio
+import gc
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+
+import httpx
+
+from benchmarks.fakes import FakeMcSrvStat, FakeMinecraftServer
+from benchmarks.load import create_config
+
+API_PATHS = [
+    "/api/status",
+    "/api/status/wait?since=0&timeout=0",
+    "/api/health",
+    "/api/config",
+    "/api/metrics",
+    "/api/stats/unique-players?period=hour&count=24",
+]
+
+
+@dataclass
+class Sample:
+    """Resource usage of the process at one point of the soak test."""
+
+    elapsed: float
+    memory: int
+    rss: int | None
+    tasks: int
+    fds: int | None
+    gc_objects: int
+    gc_counts: tuple[int, int, int]
+    requests: int
+    errors: int
+
+
+@dataclass
+class Traffic:
+    """Counters of the API requests issued during the soak test."""
+
+    requests: int = 0
+    errors: int = 0
+
+
+def count_fds() -> int | None:
+    """Count the open file descriptors of the process, where the OS exposes them."""
+    for fd_path in ("/proc/self/fd", "/dev/fd"):
+        if os.path.isdir(fd_path):
+            return len(os.listdir(fd_path))
+    return None
+
+
+def get_rss() -> int | None:
+    """Get the resident set size of the process in bytes, on Linux."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        return None
+
+
+def take_snapshot() -> tracemalloc.Snapshot:
+    """Take a snapshot of the traced allocations."""
+    return tracemalloc.take_snapshot().filter_traces(
+        [tracemalloc.Filter(False, tracemalloc.__file__)]
+    )
+
+
+def take_sample(start: float, traffic: Traffic) -> Sample:
+    """Sample the resource usage after a full collection."""
+    # The second pass untracks the tuples of a snapshot taken just before.
+    gc.collect()
+    gc.collect()
+    return Sample(
+        elapsed=time.monotonic() - start,
+        memory=tracemalloc.get_traced_memory()[0],
+        rss=get_rss(),
+        tasks=len(asyncio.all_tasks()),
+        fds=count_fds(),
+        gc_objects=len(gc.get_objects()),
+        gc_counts=gc.get_count(),
+        requests=traffic.requests,
+        errors=traffic.errors,
+    )
+
+
+def print_sample(sample: Sample, baseline: Sample | None) -> None:
+    """Print a sample and its growth since the baseline."""
+
+    def growth(value: int | None, base_value: int | None) -> str:
+        if value is None or base_value is None:
+            return ""
+        return f"({value - base_value:+})"
+
+    base = baseline or sample
+    rss = f"{sample.rss / 1_048_576:.1f}MB" if sample.rss is not None else "n/a"
+    print(
+        f"{sample.elapsed:8.0f}s  "
+        f"traced {sample.memory / 1024:9.1f}KiB {growth(sample.memory, base.memory):<11} "
+        f"rss {rss:>8}  "
+        f"tasks {sample.tasks} {growth(sample.tasks, base.tasks):<5} "
+        f"fds {sample.fds} {growth(sample.fds, base.fds):<5} "
+        f"objects {sample.gc_objects} {growth(sample.gc_objects, base.gc_objects):<8} "
+        f"gc {sample.gc_counts}  "
+        f"requests {sample.requests} errors {sample.errors}",
+        flush=True,
+    )
+
+
+def print_top_allocations(
+    snapshot: tracemalloc.Snapshot, baseline: tracemalloc.Snapshot, top: int
+) -> None:
+    """Print the allocation sites that changed the most since the baseline."""
+    print(f"Top {top} allocation sites by change since the baseline:")
+    for statistic in snapshot.compare_to(baseline, "lineno")[:top]:
+        print(f"  {statistic}")
+
+
+def check_growth(
+    sample: Sample, baseline: Sample, arguments: argparse.Namespace
+) -> list[str]:
+    """Return the resources that grew beyond their threshold."""
+    limits = [
+        ("traced memory", sample.memory, baseline.memory, arguments.max_memory_growth),
+        ("asyncio tasks", sample.tasks, baseline.tasks, arguments.max_task_growth),
+        ("file descriptors", sample.fds, baseline.fds, arguments.max_fd_growth),
+        (
+            "gc objects",
+            sample.gc_objects,
+            baseline.gc_objects,
+            arguments.max_object_growth,
+        ),
+    ]
+    return [
+        f"{name} grew by {value - base_value} (limit {limit})"
+        for name, value, base_value, limit in limits
+        if value is not None and base_value is not None and value - base_value > limit
+    ]
+
+
+async def generate_traffic(
+    client: httpx.AsyncClient, traffic: Traffic, request_rate: float
+) -> None:
+    """Request the API paths in turn at a fixed rate."""
+    random_generator = random.Random(0)
+    while True:
+        path = API_PATHS[traffic.requests % len(API_PATHS)]
+        if traffic.requests % (len(API_PATHS) + 1) == 0:
+            index = random_generator.randrange(1000)
+            path = f"/api/avatar/{index:08x}-0000-4000-8000-{index:012x}"
+        traffic.requests += 1
+        try:
+            response = await client.get(path)
+            if response.status_code >= 400:
+                traffic.errors += 1
+        except httpx.HTTPError:
+            traffic.errors += 1
+        await asyncio.sleep(1 / request_rate)
+
+
+async def churn_players(
+    server: FakeMinecraftServer, players: int, interval: float
+) -> None:
+    """Let players join and leave the fake server."""
+    random_generator = random.Random(0)
+    while True:
+        await asyncio.sleep(interval)
+        server.players_online = random_generator.randint(0, players)
+
+
+async def run(arguments: argparse.Namespace) -> list[str]:
+    server = FakeMinecraftServer(
+        failure_rate=arguments.failure_rate, players_max=arguments.players
+    )
+    mcsrvstat = FakeMcSrvStat(server, failure_rate=arguments.failure_rate)
+    await server.start()
+    await mcsrvstat.start()
+
+    from minecraft_dashboard.__main__ import init_app
+
+    with tempfile.TemporaryDirectory() as directory:
+        config = create_config(server, mcsrvstat, arguments.probe_interval)
+        config.history_path = str(Path(directory) / "history")
+        config.state_path = str(Path(directory) / "state.json.gz")
+        app = init_app(config)
+        traffic = Traffic()
+        background_tasks: list[asyncio.Task] = []
+
+        try:
+            async with app.router.lifespan_context(app):
+                async with httpx.AsyncClient(
+                    transport=httpx.ASGITransport(app=app),
+                    base_url="http://dashboard",
+                ) as client:
+                    background_tasks = [
+                        asyncio.create_task(
+                            generate_traffic(client, traffic, arguments.request_rate)
+                        ),
+                        asyncio.create_task(
+                            churn_players(
+                                server, arguments.players, arguments.churn_interval
+                            )
+                        ),
+                    ]
+                    return await sample_loop(arguments, traffic)
+        finally:
+            for task in background_tasks:
+                task.cancel()
+            await asyncio.gather(*background_tasks, return_exceptions=True)
+            await mcsrvstat.stop()
+            await server.stop()
+
+
+async def sample_loop(arguments: argparse.Namespace, traffic: Traffic) -> list[str]:
+    """Sample the resources until the duration elapsed and check their growth."""
+    tracemalloc.start(arguments.frames)
+    start = time.monotonic()
+
+    await asyncio.sleep(arguments.warmup)
+    # Every sample is taken while exactly the baseline snapshot is alive, its
+    # own objects and memory would otherwise show up as growth.
+    baseline_snapshot = take_snapshot()
+    baseline = take_sample(start, traffic)
+    print_sample(baseline, None)
+
+    sample, snapshot = baseline, baseline_snapshot
+    while time.monotonic() - start < arguments.warmup + arguments.duration:
+        await asyncio.sleep(arguments.sample_interval)
+        snapshot = baseline_snapshot
+        sample = take_sample(start, traffic)
+        snapshot = take_snapshot()
+        print_sample(sample, baseline)
+
+    print_top_allocations(snapshot, baseline_snapshot, arguments.top)
+    tracemalloc.stop()
+    return check_growth(sample, baseline, arguments)
+
+
+def create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Soak test for resource leaks")
+    parser.add_argument(
+        "--duration", type=float, default=3600.0, help="Seconds after the warmup"
+    )
+    parser.add_argument(
+        "--warmup",
+        type=float,
+        default=60.0,
+        help="Seconds to fill the caches before the baseline sample",
+    )
+    parser.add_argument("--sample-interval", type=float, default=60.0)
+    parser.add_argument(
+        "--probe-interval",
+        type=float,
+        default=0.05,
+        help="Status probe interval of the dashboard in seconds",
+    )
+    parser.add_argument(
+        "--request-rate", type=float, default=50.0, help="API requests per second"
+    )
+    parser.add_argument("--players", type=int, default=50)
+    parser.add_argument(
+        "--churn-interval",
+        type=float,
+        default=1.0,
+        help="Seconds between player count changes",
+    )
+    parser.add_argument("--failure-rate", type=float, default=0.05)
+    parser.add_argument(
+        "--frames", type=int, default=5, help="Traceback frames kept by tracemalloc"
+    )
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument(
+        "--max-memory-growth",
+        type=int,
+        default=5 * 1_048_576,
+        help="Allowed growth of the traced memory in bytes",
+    )
+    parser.add_argument("--max-task-growth", type=int, default=2)
+    parser.add_argument("--max-fd-growth", type=int, default=4)
+    parser.add_argument("--max-object-growth", type=int, default=20_000)
+    return parser
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.WARNING)
+    failures = asyncio.run(run(create_parser().parse_args()))
+    if failures:
+        for failure in failures:
+            print(f"FAIL: {failure}")
+        sys.exit(1)
+    print("PASS: no resource grew beyond its threshold")
+
+
+if __name__ == "__main__":
+    main()
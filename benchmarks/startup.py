@@ -0,0 +1,111 @@
+"""Import-time and cold-start benchmark for minecraft-dashboard.
+
+Run with `uv run python -m benchmarks.startup`.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT_DIRECTORY = Path(__file__).resolve().parent.parent
+
+SCENARIOS: dict[str, list[str]] = {
+    "import": ["-c", "import minecraft_dashboard.__main__"],
+    "config": [
+        "-c",
+        "from minecraft_dashboard.config import Config; Config.load()",
+    ],
+    "openapi": ["-m", "minecraft_dashboard", "--generate-openapi", "openapi.json"],
+}
+
+
+def run_scenario(
+    arguments: list[str], working_directory: Path, runs: int
+) -> list[float]:
+    """Run a scenario in a fresh interpreter and return the wall times in ms."""
+    environment = {**os.environ, "PYTHONPATH": str(ROOT_DIRECTORY)}
+    timings: list[float] = []
+
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, *arguments],
+            cwd=working_directory,
+            env=environment,
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        timings.append((time.perf_counter() - start) * 1000)
+
+    return timings
+
+
+def print_import_times(working_directory: Path, limit: int) -> None:
+    """Print the modules with the highest cumulative import time."""
+    environment = {**os.environ, "PYTHONPATH": str(ROOT_DIRECTORY)}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *SCENARIOS["import"]],
+        cwd=working_directory,
+        env=environment,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+
+    entries: list[tuple[int, str]] = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        entries.append((int(cumulative), name.strip()))
+
+    print(f"\nTop {limit} imports by cumulative time:")
+    for cumulative, name in sorted(entries, reverse=True)[:limit]:
+        print(f"  {cumulative / 1000:8.1f} ms  {name}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Cold-start benchmark")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument(
+        "--scenario",
+        choices=sorted(SCENARIOS),
+        action="append",
+        help="Scenario to run, may be given multiple times (default: all)",
+    )
+    parser.add_argument(
+        "--importtime",
+        type=int,
+        metavar="LIMIT",
+        default=0,
+        help="Also print the slowest imports",
+    )
+    arguments = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        working_directory = Path(directory)
+
+        # Warm up the bytecode cache and create the config file so every
+        # measured run takes the steady-state path of a container restart.
+        run_scenario(SCENARIOS["config"], working_directory, 1)
+
+        print(f"{'scenario':<10} {'min':>9} {'median':>9} {'max':>9}")
+        for name in arguments.scenario or SCENARIOS:
+            timings = run_scenario(SCENARIOS[name], working_directory, arguments.runs)
+            print(
+                f"{name:<10} {min(timings):7.1f}ms {statistics.median(timings):7.1f}ms "
+                f"{max(timings):7.1f}ms"
+            )
+
+        if arguments.importtime:
+            print_import_times(working_directory, arguments.importtime)
+
+
+if __name__ == "__main__":
+    main()
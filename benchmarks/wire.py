@@ -0,0 +1,157 @@
+"""Size and encode time benchmark of the API wire formats.
+
+Encodes a status snapshot, a merged multi-server status and a chunk of
+history entries as JSON, MessagePack and CBOR and compares the payload sizes
+and encode and decode times. Run with
+`uv run --extra binary python -m benchmarks.wire`.
+"""
+
+import argparse
+import gzip
+import json
+import time
+from collections.abc import Callable
+from typing import Any
+
+from minecraft_dashboard.models import (
+    FederationData,
+    FederationPeerData,
+    HistoryEntryData,
+    MotdData,
+    PlayerData,
+    PlayersData,
+    PluginData,
+    Status,
+    StatusData,
+    WireFormat,
+)
+from minecraft_dashboard.utils import WireUtils
+
+
+def create_status(players: int) -> Status:
+    """Create a status snapshot of a busy server."""
+    status_data = StatusData(
+        latency=42,
+        ip="127.0.0.1",
+        port=25565,
+        hostname="play.example.com",
+        version="1.21.4",
+        software="Paper",
+        map="world",
+        motd=MotdData(plain="A Minecraft Server", html="A Minecraft Server"),
+        players=PlayersData(
+            online=players,
+            max=players * 2,
+            player_list=[
+                PlayerData(
+                    name=f"Player{index}",
+                    uuid=f"{index:08x}-0000-4000-8000-{index:012x}",
+                )
+                for index in range(players)
+            ],
+        ),
+        plugins=[
+            PluginData(name=f"Plugin{index}", version=f"1.{index}.0")
+            for index in range(30)
+        ],
+    )
+    return Status(data=status_data, data_external=status_data, polling_interval=5000)
+
+
+def create_payloads(players: int, peers: int, entries: int) -> dict[str, Any]:
+    """Create the JSON-compatible payloads to encode."""
+    status = create_status(players)
+    federation = FederationData(
+        local=status,
+        peers=[
+            FederationPeerData(
+                url=f"http://dashboard-{index}.example.com",
+                status=status,
+                updated_at=1_700_000_000.0 + index,
+                stale=False,
+            )
+            for index in range(peers)
+        ],
+        servers=peers + 1,
+    )
+    history = [
+        HistoryEntryData(
+            timestamp=1_700_000_000.0 + index * 5.0,
+            online=True,
+            players_online=index % players,
+            players_max=players * 2,
+            latency=40 + index % 17,
+            version="1.21.4",
+            online_external=True,
+            latency_external=55 + index % 13,
+        ).model_dump(mode="json")
+        for index in range(entries)
+    ]
+
+    return {
+        "status": status.model_dump(mode="json"),
+        "federation": federation.model_dump(mode="json"),
+        "history": history,
+    }
+
+
+def measure(function: Callable[[], Any], runs: int) -> float:
+    """Return the mean time of a function in microseconds."""
+    start = time.perf_counter()
+    for _ in range(runs):
+        function()
+    return (time.perf_counter() - start) / runs * 1_000_000
+
+
+def get_decoder(wire_format: WireFormat) -> Callable[[bytes], Any]:
+    """Get the decoder of a format."""
+    if wire_format == WireFormat.MSGPACK:
+        import msgpack
+
+        return msgpack.unpackb
+    if wire_format == WireFormat.CBOR:
+        import cbor2
+
+        return cbor2.loads
+    return json.loads
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Wire format benchmark")
+    parser.add_argument("--players", type=int, default=100)
+    parser.add_argument("--peers", type=int, default=8)
+    parser.add_argument("--entries", type=int, default=1000)
+    parser.add_argument("--runs", type=int, default=200)
+    arguments = parser.parse_args()
+
+    payloads = create_payloads(arguments.players, arguments.peers, arguments.entries)
+    wire_formats = [
+        wire_format for wire_format in WireFormat if WireUtils.is_available(wire_format)
+    ]
+
+    print(
+        f"{'payload':<11} {'format':<20} {'size':>9} {'gzip':>9} "
+        f"{'encode':>11} {'decode':>11}"
+    )
+    for name, payload in payloads.items():
+        for wire_format in wire_formats:
+            encoded = WireUtils.encode(payload, wire_format)
+            decode = get_decoder(wire_format)
+            encode_time = measure(
+                lambda payload=payload, wire_format=wire_format: WireUtils.encode(
+                    payload, wire_format
+                ),
+                arguments.runs,
+            )
+            decode_time = measure(
+                lambda decode=decode, encoded=encoded: decode(encoded), arguments.runs
+            )
+            print(
+                f"{name:<11} {wire_format:<20} {len(encoded):>9} "
+                f"{len(gzip.compress(encoded)):>9} "
+                f"{encode_time:>9.1f}us {decode_time:>9.1f}us"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,4 @@
-import { useEffect, useState } from 'react'
+import { useEffect, useRef, useState } from 'react'
 import { client } from './api/client'
 import './App.css'
 import Header from './components/Header'
@@ -104,8 +104,23 @@ const mockExternalData = {
   info: {}
 }
 
+// The server inlines the configuration and the latest status into the page,
+// so the first render does not have to wait for the API.
+const initialState = (() => {
+  try {
+    const element = document.getElementById('initial-state')
+    return element ? JSON.parse(element.textContent) : null
+  } catch (e) {
+    return null
+  }
+})()
+
+const initialStatus = initialState?.config && !initialState.config.use_mock_data &&
+  !initialState.config.simulate_offline ? initialState.status : null
+
 function App() {
   const [serverData, setServerData] = useState(() => {
+    if (initialStatus) return initialStatus.data
     try {
       const cached = sessionStorage.getItem('serverData')
       return cached ? JSON.parse(cached) : null
@@ -114,6 +129,7 @@ function App() {
     }
   })
   const [serverDataExternal, setServerExternalData] = useState(() => {
+    if (initialStatus) return initialStatus.data_external || initialStatus.data
     try {
       const cached = sessionStorage.getItem('serverDataExternal')
       return cached ? JSON.parse(cached) : null
@@ -122,6 +138,7 @@ function App() {
     }
   })
   const [loading, setLoading] = useState(() => {
+    if (initialStatus) return false
     try {
       return !sessionStorage.getItem('serverData')
     } catch (e) {
@@ -130,6 +147,8 @@ function App() {
   })
   const [error, setError] = useState(null)
   const [pollingInterval, setPollingInterval] = useState(5000)
+  const pollingIntervalHint = useRef(initialStatus?.polling_interval ?? null)
+  const initialStatusUsed = useRef(false)
   const [useMockData, setUseMockData] = useState(null)
   const [simulateOffline, setSimulateOffline] = useState(false)
   const [configLoaded, setConfigLoaded] = useState(false)
@@ -154,6 +173,24 @@ function App() {
   }, [useExternalData])
 
   useEffect(() => {
+    const applyConfig = (config) => {
+      setUseMockData(config.use_mock_data)
+      setPollingInterval(config.polling_interval)
+      setSimulateOffline(config.simulate_offline)
+
+      if (config.use_mock_data) {
+        setPageTitle(mockConfigData.page_title)
+        setHeaderTitle(mockConfigData.header_title)
+        setFrontendLinks(mockConfigData.frontend_links)
+      } else {
+        setPageTitle(config.page_title)
+        setHeaderTitle(config.header_title)
+        setFrontendLinks(config.frontend_links || [])
+      }
+
+      setConfigLoaded(true)
+    }
+
     const fetchConfig = async () => {
       try {
         const configResponse = await client.GET('/api/config')
@@ -162,28 +199,18 @@ function App() {
           throw new Error('Failed to fetch configuration')
         }
 
-        setUseMockData(configResponse.data.use_mock_data)
-        setPollingInterval(configResponse.data.polling_interval)
-        setSimulateOffline(configResponse.data.simulate_offline)
-
-        if (configResponse.data.use_mock_data) {
-          setPageTitle(mockConfigData.page_title)
-          setHeaderTitle(mockConfigData.header_title)
-          setFrontendLinks(mockConfigData.frontend_links)
-        } else {
-          setPageTitle(configResponse.data.page_title)
-          setHeaderTitle(configResponse.data.header_title)
-          setFrontendLinks(configResponse.data.frontend_links || [])
-        }
-
-        setConfigLoaded(true)
+        applyConfig(configResponse.data)
       } catch (err) {
         console.error('Failed to fetch config:', err)
         setConfigLoaded(true)
       }
     }
 
-    fetchConfig()
+    if (initialState?.config) {
+      applyConfig(initialState.config)
+    } else {
+      fetchConfig()
+    }
 
     const configIntervalId = setInterval(fetchConfig, 5000)
 
@@ -199,7 +226,10 @@ function App() {
     const minFetchInterval = 1000
 
     let initialDelay = 0
-    if (hasCache) {
+    if (initialStatus && !initialStatusUsed.current) {
+      initialStatusUsed.current = true
+      initialDelay = pollingIntervalHint.current ?? pollingInterval
+    } else if (hasCache) {
       initialDelay = 2000
     } else if (lastFetchTime) {
       const timeSinceLastFetch = now - parseInt(lastFetchTime, 10)
@@ -231,6 +261,7 @@ function App() {
 
           const internalData = statusResponse.data.data
           const externalData = statusResponse.data.data_external || internalData
+          pollingIntervalHint.current = statusResponse.data.polling_interval ?? null
 
           setServerData(internalData)
           setServerExternalData(externalData)
@@ -250,12 +281,21 @@ function App() {
       }
     }
 
-    const initialTimeout = setTimeout(fetchStatus, initialDelay)
-    const statusIntervalId = setInterval(fetchStatus, pollingInterval)
+    let cancelled = false
+    let statusTimeoutId = null
+
+    const pollStatus = async () => {
+      await fetchStatus()
+      if (!cancelled) {
+        statusTimeoutId = setTimeout(pollStatus, pollingIntervalHint.current ?? pollingInterval)
+      }
+    }
+
+    statusTimeoutId = setTimeout(pollStatus, initialDelay)
 
     return () => {
-      clearTimeout(initialTimeout)
-      clearInterval(statusIntervalId)
+      cancelled = true
+      clearTimeout(statusTimeoutId)
     }
   }, [useMockData, simulateOffline, pollingInterval, configLoaded])
 
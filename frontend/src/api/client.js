@@ -1,3 +1,3 @@
 export * from '../generated';
 export { default as client } from '../generated/client';
-
+export { decode, decodeAll, getMessagePack } from './msgpack';
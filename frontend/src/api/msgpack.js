@@ -0,0 +1,114 @@
+const textDecoder = new TextDecoder()
+
+function decodeValue(view, bytes, state) {
+  const type = view.getUint8(state.offset++)
+
+  if (type <= 0x7f) return type
+  if (type >= 0xe0) return type - 0x100
+  if ((type & 0xf0) === 0x80) return decodeMap(view, bytes, state, type & 0x0f)
+  if ((type & 0xf0) === 0x90) return decodeArray(view, bytes, state, type & 0x0f)
+  if ((type & 0xe0) === 0xa0) return decodeString(bytes, state, type & 0x1f)
+
+  switch (type) {
+    case 0xc0: return null
+    case 0xc2: return false
+    case 0xc3: return true
+    case 0xc4: return decodeBinary(bytes, state, readLength(view, state, 1))
+    case 0xc5: return decodeBinary(bytes, state, readLength(view, state, 2))
+    case 0xc6: return decodeBinary(bytes, state, readLength(view, state, 4))
+    case 0xca: return readNumber(state, 4, () => view.getFloat32(state.offset))
+    case 0xcb: return readNumber(state, 8, () => view.getFloat64(state.offset))
+    case 0xcc: return readNumber(state, 1, () => view.getUint8(state.offset))
+    case 0xcd: return readNumber(state, 2, () => view.getUint16(state.offset))
+    case 0xce: return readNumber(state, 4, () => view.getUint32(state.offset))
+    case 0xcf: return readNumber(state, 8, () => Number(view.getBigUint64(state.offset)))
+    case 0xd0: return readNumber(state, 1, () => view.getInt8(state.offset))
+    case 0xd1: return readNumber(state, 2, () => view.getInt16(state.offset))
+    case 0xd2: return readNumber(state, 4, () => view.getInt32(state.offset))
+    case 0xd3: return readNumber(state, 8, () => Number(view.getBigInt64(state.offset)))
+    case 0xd9: return decodeString(bytes, state, readLength(view, state, 1))
+    case 0xda: return decodeString(bytes, state, readLength(view, state, 2))
+    case 0xdb: return decodeString(bytes, state, readLength(view, state, 4))
+    case 0xdc: return decodeArray(view, bytes, state, readLength(view, state, 2))
+    case 0xdd: return decodeArray(view, bytes, state, readLength(view, state, 4))
+    case 0xde: return decodeMap(view, bytes, state, readLength(view, state, 2))
+    case 0xdf: return decodeMap(view, bytes, state, readLength(view, state, 4))
+    default: throw new Error(`Unsupported MessagePack type 0x${type.toString(16)}`)
+  }
+}
+
+function readNumber(state, size, read) {
+  const value = read()
+  state.offset += size
+  return value
+}
+
+function readLength(view, state, size) {
+  if (size === 1) return readNumber(state, 1, () => view.getUint8(state.offset))
+  if (size === 2) return readNumber(state, 2, () => view.getUint16(state.offset))
+  return readNumber(state, 4, () => view.getUint32(state.offset))
+}
+
+function decodeString(bytes, state, length) {
+  const value = textDecoder.decode(bytes.subarray(state.offset, state.offset + length))
+  state.offset += length
+  return value
+}
+
+function decodeBinary(bytes, state, length) {
+  const value = bytes.slice(state.offset, state.offset + length)
+  state.offset += length
+  return value
+}
+
+function decodeArray(view, bytes, state, length) {
+  const value = new Array(length)
+  for (let index = 0; index < length; index++) {
+    value[index] = decodeValue(view, bytes, state)
+  }
+  return value
+}
+
+function decodeMap(view, bytes, state, length) {
+  const value = {}
+  for (let index = 0; index < length; index++) {
+    const key = decodeValue(view, bytes, state)
+    value[key] = decodeValue(view, bytes, state)
+  }
+  return value
+}
+
+// Decodes every MessagePack value in a buffer, a stream of concatenated
+// values like the history export yields more than one.
+export function decodeAll(buffer) {
+  const bytes = new Uint8Array(buffer)
+  const view = new DataView(bytes.buffer, bytes.byteOffset, bytes.byteLength)
+  const state = { offset: 0 }
+  const values = []
+  while (state.offset < bytes.length) {
+    values.push(decodeValue(view, bytes, state))
+  }
+  return values
+}
+
+export function decode(buffer) {
+  return decodeAll(buffer)[0]
+}
+
+// Fetches an API path as MessagePack, falling back to JSON if the server
+// answers with it because the encoder is not installed.
+export async function getMessagePack(path, init = {}) {
+  const baseUrl = import.meta.env.VITE_API_URL || ''
+  const response = await fetch(`${baseUrl}${path}`, {
+    ...init,
+    headers: { ...init.headers, Accept: 'application/msgpack, application/json;q=0.5' }
+  })
+
+  if (!response.ok) {
+    throw new Error(`Request to ${path} failed with ${response.status}`)
+  }
+  if (!response.headers.get('content-type')?.startsWith('application/msgpack')) {
+    return response.json()
+  }
+  return decode(await response.arrayBuffer())
+}
@@ -5,6 +5,7 @@ function PlayerListCard({ players }) {
     const playerList = players?.player_list || []
     const online = players?.online || 0
     const max = players?.max || 0
+    const baseUrl = import.meta.env.VITE_API_URL || ''
 
     return (
         <Card
@@ -17,7 +18,7 @@ function PlayerListCard({ players }) {
                         <div key={player.uuid} className="player-item">
                             <div className="player-avatar">
                                 <img
-                                    src={`https://crafthead.net/avatar/${player.uuid}/32`}
+                                    src={`${baseUrl}/api/avatar/${player.uuid}`}
                                     alt={player.name}
                                     onError={(e) => {
                                         e.target.src = 'data:image/svg+xml,%3Csvg xmlns="http://www.w3.org/2000/svg" width="32" height="32"%3E%3Crect fill="%238b5cf6" width="32" height="32"/%3E%3C/svg%3E'
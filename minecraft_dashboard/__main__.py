@@ -1,34 +1,78 @@
 """Main module for minecraft-dashboard."""
 
 import argparse
+import json
 import logging
+import os
 import sys
 from contextlib import asynccontextmanager
 from pathlib import Path
 
-import uvicorn
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.openapi.docs import get_swagger_ui_html
+from fastapi.responses import HTMLResponse
 from fastapi.staticfiles import StaticFiles
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
+from minecraft_dashboard.alerts import AlertEngine
 from minecraft_dashboard.api import DashboardApi
+from minecraft_dashboard.avatar import AvatarCache
 from minecraft_dashboard.config import Config
-from minecraft_dashboard.utils import LoggingUtils, OpenApiUtils
+from minecraft_dashboard.const import (
+    ENV_SHARED_SNAPSHOT,
+    FEDERATION_SNAPSHOT_SUFFIX,
+    STATUS_TIMESTAMP_HEADER,
+    STATUS_VERSION_HEADER,
+)
+from minecraft_dashboard.federation import FederationAggregator
+from minecraft_dashboard.history import HistoryStore
+from minecraft_dashboard.limiter import RateLimiter
+from minecraft_dashboard.page import IndexPage
+from minecraft_dashboard.prober import StatusProber
+from minecraft_dashboard.shared import SharedSnapshot
+from minecraft_dashboard.utils import (
+    LoggingUtils,
+    OpenApiUtils,
+    RuntimeUtils,
+    StateUtils,
+)
 from minecraft_dashboard.watcher import ConfigurationWatcher
 
 api_instance: DashboardApi
+api_app: FastAPI
+status_prober: StatusProber
 configuration_watcher: ConfigurationWatcher
+openapi_json: bytes | None = None
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    global configuration_watcher
+    state_path = (
+        Path(api_instance.config.state_path) if api_instance.config.state_path else None
+    )
+
+    if state_path:
+        status = StateUtils.load(state_path)
+        if status:
+            status_prober.restore_status(status)
+    await status_prober.start()
+    if api_instance.federation:
+        await api_instance.federation.start()
     if configuration_watcher:
         await configuration_watcher.start()
     yield
     if configuration_watcher:
         await configuration_watcher.stop()
+    if api_instance.federation:
+        await api_instance.federation.stop()
+    await status_prober.stop()
+    await api_instance.avatars.close()
+    if state_path and status_prober.is_leader:
+        StateUtils.save(
+            state_path,
+            status_prober.status.to_model() if status_prober.status else None,
+        )
 
 
 app = FastAPI(
@@ -36,6 +80,10 @@ app = FastAPI(
     description="API for monitoring Minecraft server status",
     version="0.0.0",
     lifespan=lifespan,
+    # Served from the cached specification of the mounted API below.
+    openapi_url=None,
+    docs_url=None,
+    redoc_url=None,
 )
 
 app.add_middleware(
@@ -44,34 +92,92 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", STATUS_TIMESTAMP_HEADER, STATUS_VERSION_HEADER],
 )
 
 
+@app.get("/openapi.json", include_in_schema=False)
+async def get_openapi() -> Response:
+    """Serve the OpenAPI specification, generated once and cached as bytes."""
+    global openapi_json
+    if openapi_json is None:
+        openapi_json = json.dumps(
+            OpenApiUtils.get_openapi_spec(app, api_app, "/api")
+        ).encode("utf-8")
+
+    return Response(content=openapi_json, media_type="application/json")
+
+
+@app.get("/docs", include_in_schema=False)
+async def get_docs() -> HTMLResponse:
+    """Serve the Swagger UI for the cached OpenAPI specification."""
+    return get_swagger_ui_html(
+        openapi_url="/openapi.json", title=f"{app.title} - Swagger UI"
+    )
+
+
 class SPAStaticFiles(StaticFiles):
+    def __init__(self, *, index_page: IndexPage, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.index_page = index_page
+
     async def get_response(self, path: str, scope):
+        if path in ("", ".", "index.html"):
+            return self.index_page.response(Request(scope))
         try:
             return await super().get_response(path, scope)
         except (HTTPException, StarletteHTTPException) as ex:
             if ex.status_code == 404:
-                return await super().get_response("index.html", scope)
+                return self.index_page.response(Request(scope))
             else:
                 raise ex
 
 
-def main():
-    global api_instance, configuration_watcher
+def init_app(
+    config: Config,
+    shared_snapshot: SharedSnapshot | None = None,
+    federation_snapshot: SharedSnapshot | None = None,
+) -> FastAPI:
+    """Wire the prober, the API and the configuration watcher into the app."""
+    global api_instance, api_app, status_prober, configuration_watcher, openapi_json
 
-    parser = argparse.ArgumentParser(description="Minecraft Dashboard Server")
-    parser.add_argument(
-        "--generate-openapi",
-        type=str,
-        metavar="OUTPUT_PATH",
-        help="Generate OpenAPI specification file and exit",
+    history = HistoryStore(Path(config.history_path)) if config.history_path else None
+    status_prober = StatusProber(config, shared_snapshot, history, AlertEngine(config))
+    api_app = FastAPI()
+    rate_limiter = RateLimiter(api_app, config)
+    api_instance = DashboardApi(
+        config,
+        status_prober,
+        AvatarCache(config),
+        history,
+        rate_limiter,
+        FederationAggregator(config, federation_snapshot),
     )
-    arguments = parser.parse_args()
+    api_app.include_router(api_instance.router)
+    app.mount("/api", rate_limiter)
+    openapi_json = None
 
-    config = Config.load()
+    configuration_watcher = ConfigurationWatcher(
+        config, api_instance.reload_configuration
+    )
 
+    static_dir = Path(__file__).parent / "static"
+    if static_dir.exists():
+        app.mount(
+            "/",
+            SPAStaticFiles(
+                directory=static_dir,
+                html=False,
+                index_page=IndexPage(static_dir / "index.html", api_instance),
+            ),
+            name="static",
+        )
+
+    return app
+
+
+def init_logging(config: Config) -> None:
+    """Initialize logging from the configuration."""
     LoggingUtils.init(
         Path(config.log_path) if config.log_path else None,
         config.log_level,
@@ -81,26 +187,67 @@ def main():
         config.log_filemode,
     )
 
-    api_instance = DashboardApi(config)
-    api_app = FastAPI()
-    api_app.include_router(api_instance.router)
-    app.mount("/api", api_app)
 
-    configuration_watcher = ConfigurationWatcher(
-        config, api_instance.reload_configuration
+def create_worker_app() -> FastAPI:
+    """Create the app inside a uvicorn worker process of a multi-worker deployment."""
+    config = Config.load(save_after_load=False)
+    init_logging(config)
+
+    name = os.environ[ENV_SHARED_SNAPSHOT]
+    return init_app(
+        config,
+        SharedSnapshot(name),
+        SharedSnapshot(f"{name}{FEDERATION_SNAPSHOT_SUFFIX}"),
     )
 
-    static_dir = Path(__file__).parent / "static"
-    if static_dir.exists():
-        app.mount("/", SPAStaticFiles(directory=static_dir, html=False), name="static")
+
+def main():
+    parser = argparse.ArgumentParser(description="Minecraft Dashboard Server")
+    parser.add_argument(
+        "--generate-openapi",
+        type=str,
+        metavar="OUTPUT_PATH",
+        help="Generate OpenAPI specification file and exit",
+    )
+    arguments = parser.parse_args()
 
     if arguments.generate_openapi:
+        # Only the routes matter, skip the configuration file and logging.
+        init_app(Config())
         output_path = Path(arguments.generate_openapi)
-        OpenApiUtils.generate_openapi_spec(app, output_path)
+        OpenApiUtils.generate_openapi_spec(app, api_app, "/api", output_path)
         sys.exit(0)
 
+    config = Config.load()
+    init_logging(config)
+
+    import uvicorn
+
     logging.info("Starting minecraft-dashboard...")
-    uvicorn.run(app, host=config.api_host, port=config.api_port, log_config=None)
+    options = RuntimeUtils.get_uvicorn_options(config)
+    RuntimeUtils.log_self_check(options)
+
+    if config.api_workers <= 1:
+        init_app(config)
+        uvicorn.run(app, **options)
+        return
+
+    # Every worker serves requests, but only one of them probes the server
+    # and shares the serialized status with the others, the same goes for
+    # pulling the federation peers.
+    shared_snapshot = SharedSnapshot.create()
+    federation_snapshot = SharedSnapshot.create(FEDERATION_SNAPSHOT_SUFFIX)
+    os.environ[ENV_SHARED_SNAPSHOT] = shared_snapshot.name
+    try:
+        uvicorn.run(
+            "minecraft_dashboard.__main__:create_worker_app",
+            factory=True,
+            workers=config.api_workers,
+            **options,
+        )
+    finally:
+        federation_snapshot.close()
+        shared_snapshot.close()
 
 
 if __name__ == "__main__":
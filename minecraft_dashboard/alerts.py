@@ -0,0 +1,358 @@
+"""Alert rule engine module for minecraft-dashboard."""
+
+import asyncio
+import logging
+import sys
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from minecraft_dashboard.config import Config
+from minecraft_dashboard.const import ALERT_QUEUE_SIZE, ALERT_WINDOW_SLOTS
+from minecraft_dashboard.models import (
+    AlertData,
+    AlertRuleData,
+    AlertRuleType,
+    AlertSinkData,
+    AlertSinkType,
+    AlertState,
+    Status,
+)
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = logging.getLogger(__name__)
+
+
+class AlertRule(ABC):
+    """Condition over the status stream, updated with every probe result.
+
+    Rules keep a constant amount of state and never look back at the
+    history, a window is a fixed ring of slots that expire as a whole.
+    """
+
+    def __init__(self, data: AlertRuleData) -> None:
+        """Initialize the alert rule."""
+        self.data = data
+        self.is_firing = False
+
+    @abstractmethod
+    def update(self, status: Status, timestamp: float) -> str | None:
+        """Feed a probe result, returning a description while the rule fires."""
+
+
+class OfflineRule(AlertRule):
+    """Fires after a number of consecutive offline probes."""
+
+    def __init__(self, data: AlertRuleData) -> None:
+        """Initialize the offline rule."""
+        super().__init__(data)
+        self.offline_checks = 0
+
+    def update(self, status: Status, timestamp: float) -> str | None:
+        """Count consecutive offline probes."""
+        self.offline_checks = 0 if status.data else self.offline_checks + 1
+        if self.offline_checks < self.data.checks:
+            return None
+        return f"Server offline for {self.offline_checks} consecutive checks"
+
+
+class WindowRule(AlertRule):
+    """Aggregates probe results into the slots of a sliding time window."""
+
+    def __init__(self, data: AlertRuleData) -> None:
+        """Initialize the window rule."""
+        super().__init__(data)
+        self.slot_length = max(data.window / ALERT_WINDOW_SLOTS, 1.0)
+        self.slots: list[list[float]] = [
+            self.create_slot() for _ in range(ALERT_WINDOW_SLOTS)
+        ]
+        self.slot_indices = [-1] * ALERT_WINDOW_SLOTS
+
+    @abstractmethod
+    def create_slot(self) -> list[float]:
+        """Create the aggregate of an empty slot."""
+
+    def get_slot(self, timestamp: float) -> list[float]:
+        """Get the slot of a timestamp, resetting it if it expired."""
+        slot_index = int(timestamp // self.slot_length)
+        position = slot_index % ALERT_WINDOW_SLOTS
+        if self.slot_indices[position] != slot_index:
+            self.slot_indices[position] = slot_index
+            self.slots[position] = self.create_slot()
+        return self.slots[position]
+
+    def get_active_slots(self, timestamp: float) -> list[list[float]]:
+        """Get the slots within the window."""
+        oldest_index = int(timestamp // self.slot_length) - ALERT_WINDOW_SLOTS
+        return [
+            slot
+            for slot, slot_index in zip(self.slots, self.slot_indices)
+            if slot_index > oldest_index
+        ]
+
+
+class LatencyRule(WindowRule):
+    """Fires when a latency percentile within the window exceeds the threshold.
+
+    The percentile exceeds the threshold exactly when more than the rest of
+    the probes were slower than it, so counting those is enough.
+    """
+
+    def create_slot(self) -> list[float]:
+        """Count the probes and the probes slower than the threshold."""
+        return [0, 0]
+
+    def update(self, status: Status, timestamp: float) -> str | None:
+        """Count the probe and check the share of slow probes."""
+        if status.data and status.data.latency is not None and status.data.latency >= 0:
+            slot = self.get_slot(timestamp)
+            slot[0] += 1
+            slot[1] += status.data.latency > self.data.threshold
+
+        slots = self.get_active_slots(timestamp)
+        probes = sum(slot[0] for slot in slots)
+        slow_probes = sum(slot[1] for slot in slots)
+        if not probes or slow_probes / probes <= 1 - self.data.percentile:
+            return None
+        return (
+            f"Latency p{self.data.percentile * 100:g} above "
+            f"{self.data.threshold:g} ms over {self.data.window:g} s "
+            f"({slow_probes:g} of {probes:g} checks slower)"
+        )
+
+
+class PlayersDropRule(WindowRule):
+    """Fires when the player count fell by a fraction of its peak in the window."""
+
+    def create_slot(self) -> list[float]:
+        """Track the peak player count."""
+        return [0]
+
+    def update(self, status: Status, timestamp: float) -> str | None:
+        """Update the peak and compare the current player count against it."""
+        players = (
+            status.data.players.online if status.data and status.data.players else 0
+        )
+        slot = self.get_slot(timestamp)
+        slot[0] = max(slot[0], players)
+
+        peak = max(slot[0] for slot in self.get_active_slots(timestamp))
+        if not peak or players >= peak * (1 - self.data.threshold):
+            return None
+        return (
+            f"Players dropped from {peak:g} to {players} within {self.data.window:g} s"
+        )
+
+
+RULE_TYPES: dict[AlertRuleType, type[AlertRule]] = {
+    AlertRuleType.OFFLINE: OfflineRule,
+    AlertRuleType.LATENCY: LatencyRule,
+    AlertRuleType.PLAYERS_DROP: PlayersDropRule,
+}
+
+
+class AlertSink(ABC):
+    """Delivers alert notifications to a channel."""
+
+    def __init__(self, data: AlertSinkData) -> None:
+        """Initialize the alert sink."""
+        self.data = data
+
+    @abstractmethod
+    async def send(self, alert: AlertData) -> None:
+        """Deliver an alert."""
+
+    async def close(self) -> None:
+        """Release the resources of the sink."""
+
+
+class WebhookSink(AlertSink):
+    """Posts alerts as JSON to a webhook."""
+
+    def __init__(self, data: AlertSinkData) -> None:
+        """Initialize the webhook sink."""
+        super().__init__(data)
+        self.client: httpx.AsyncClient | None = None
+
+    async def send(self, alert: AlertData) -> None:
+        """Post an alert to the webhook."""
+        import httpx
+
+        if self.client is None:
+            self.client = httpx.AsyncClient(timeout=10.0)
+
+        response = await self.client.post(
+            self.data.target or "",
+            content=alert.model_dump_json(),
+            headers={"Content-Type": "application/json"},
+        )
+        response.raise_for_status()
+
+    async def close(self) -> None:
+        """Close the connection pool."""
+        if self.client:
+            await self.client.aclose()
+            self.client = None
+
+
+class FileSink(AlertSink):
+    """Appends alerts to an NDJSON file."""
+
+    async def send(self, alert: AlertData) -> None:
+        """Append an alert to the file."""
+        await asyncio.to_thread(self._write, alert.model_dump_json())
+
+    def _write(self, line: str) -> None:
+        """Append a line to the file."""
+        path = Path(self.data.target or "alerts.ndjson")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("a", encoding="utf-8") as alert_file:
+            alert_file.write(line + "\n")
+
+
+class StdoutSink(AlertSink):
+    """Prints alerts as JSON lines to stdout."""
+
+    async def send(self, alert: AlertData) -> None:
+        """Print an alert."""
+        sys.stdout.write(alert.model_dump_json() + "\n")
+        sys.stdout.flush()
+
+
+SINK_TYPES: dict[AlertSinkType, type[AlertSink]] = {
+    AlertSinkType.WEBHOOK: WebhookSink,
+    AlertSinkType.FILE: FileSink,
+    AlertSinkType.STDOUT: StdoutSink,
+}
+
+
+class AlertEngine:
+    """Evaluates the configured rules on every probe result.
+
+    Notifications are sent when a rule starts or stops firing. They are
+    handed to a bounded queue and delivered by a background task, so a slow
+    sink never holds up the probe loop; when the queue is full they are
+    dropped and counted.
+    """
+
+    def __init__(self, config: Config) -> None:
+        """Initialize the alert engine."""
+        self.config = config
+        self.rules = self._create_rules(config.alert_rules, [])
+        self.sinks = self._create_sinks(config.alert_sinks)
+        self.queue: asyncio.Queue[AlertData] = asyncio.Queue(ALERT_QUEUE_SIZE)
+        self.dispatch_task: asyncio.Task | None = None
+        self.closing_tasks: set[asyncio.Task] = set()
+        self.dropped = 0
+
+    def reload_configuration(self, new_configuration: Config) -> None:
+        """Reload the rules and sinks, keeping the state of unchanged rules."""
+        self.config = new_configuration
+        self.rules = self._create_rules(new_configuration.alert_rules, self.rules)
+        if new_configuration.alert_sinks != [sink.data for sink in self.sinks]:
+            previous_sinks = self.sinks
+            self.sinks = self._create_sinks(new_configuration.alert_sinks)
+            for sink in previous_sinks:
+                task = asyncio.create_task(sink.close())
+                self.closing_tasks.add(task)
+                task.add_done_callback(self.closing_tasks.discard)
+
+    @staticmethod
+    def _create_rules(
+        rules_data: list[AlertRuleData], previous_rules: list[AlertRule]
+    ) -> list[AlertRule]:
+        """Create the configured rules, reusing unchanged previous ones."""
+        previous = {id(rule): rule for rule in previous_rules}
+        rules = []
+
+        for rule_data in rules_data:
+            rule = next(
+                (rule for rule in previous.values() if rule.data == rule_data), None
+            )
+            if rule:
+                del previous[id(rule)]
+                rules.append(rule)
+                continue
+
+            try:
+                rules.append(RULE_TYPES[AlertRuleType(rule_data.type)](rule_data))
+            except ValueError:
+                logger.error(f"Unknown type of alert rule {rule_data.name}")
+
+        return rules
+
+    @staticmethod
+    def _create_sinks(sinks_data: list[AlertSinkData]) -> list[AlertSink]:
+        """Create the configured sinks."""
+        sinks = []
+        for sink_data in sinks_data:
+            try:
+                sinks.append(SINK_TYPES[AlertSinkType(sink_data.type)](sink_data))
+            except ValueError:
+                logger.error(f"Unknown type of alert sink {sink_data.type}")
+        return sinks
+
+    async def start(self) -> None:
+        """Start delivering notifications in the background."""
+        self.dispatch_task = asyncio.create_task(self._dispatch_loop())
+
+    async def stop(self) -> None:
+        """Deliver the queued notifications and stop."""
+        if self.dispatch_task:
+            try:
+                async with asyncio.timeout(5.0):
+                    await self.queue.join()
+            except TimeoutError:
+                logger.warning(f"Dropping {self.queue.qsize()} undelivered alerts")
+            self.dispatch_task.cancel()
+            try:
+                await self.dispatch_task
+            except asyncio.CancelledError:
+                pass
+        for sink in self.sinks:
+            await sink.close()
+
+    def evaluate(self, status: Status, timestamp: float | None = None) -> None:
+        """Update every rule with a probe result and queue state changes."""
+        timestamp = timestamp or time.time()
+
+        for rule in self.rules:
+            message = rule.update(status, timestamp)
+            is_firing = message is not None
+            if is_firing == rule.is_firing:
+                continue
+
+            rule.is_firing = is_firing
+            alert = AlertData(
+                rule=rule.data.name,
+                state=AlertState.FIRING if is_firing else AlertState.RESOLVED,
+                message=message or f"{rule.data.name} resolved",
+                timestamp=timestamp,
+            )
+            logger.info(f"Alert {alert.rule} {alert.state}: {alert.message}")
+
+            try:
+                self.queue.put_nowait(alert)
+            except asyncio.QueueFull:
+                self.dropped += 1
+
+    async def _dispatch_loop(self) -> None:
+        """Deliver queued notifications to all sinks."""
+        while True:
+            alert = await self.queue.get()
+            sinks = self.sinks
+            try:
+                results = await asyncio.gather(
+                    *(sink.send(alert) for sink in sinks), return_exceptions=True
+                )
+                for sink, result in zip(sinks, results):
+                    if isinstance(result, Exception):
+                        logger.warning(
+                            f"Failed to deliver alert {alert.rule} "
+                            f"to {sink.data.type}: {result}"
+                        )
+            finally:
+                self.queue.task_done()
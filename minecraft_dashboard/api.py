@@ -1,31 +1,87 @@
 """API module for minecraft-dashboard."""
 
+import hashlib
+from typing import Annotated
+
 from classy_fastapi import get
 from classy_fastapi.routable import Routable
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
 
+from minecraft_dashboard.archive import MAX_TIMESTAMP
+from minecraft_dashboard.avatar import AvatarCache
 from minecraft_dashboard.config import Config
+from minecraft_dashboard.const import (
+    STATUS_TIMESTAMP_HEADER,
+    STATUS_VERSION_HEADER,
+    STATUS_WAIT_TIMEOUT,
+    STATUS_WAIT_TIMEOUT_MAX,
+)
+from minecraft_dashboard.federation import FederationAggregator
+from minecraft_dashboard.history import HISTORY_FIELDS, HistoryStore
+from minecraft_dashboard.limiter import RateLimiter
 from minecraft_dashboard.models import (
     ConfigData,
+    FederationData,
     HealthCheckData,
+    HistoryExportFormat,
+    MetricsData,
+    StatsPeriod,
     Status,
+    UniquePlayersData,
+    WireFormat,
 )
-from minecraft_dashboard.utils import MinecraftUtils
+from minecraft_dashboard.prober import StatusProber
+from minecraft_dashboard.utils import LoggingUtils, MinecraftUtils, WireUtils
 
 router = APIRouter()
 
+BINARY_CONTENT = {"content": {WireFormat.MSGPACK: {}, WireFormat.CBOR: {}}}
+HISTORY_EXPORT_MEDIA_TYPES = {
+    HistoryExportFormat.CSV: "text/csv",
+    HistoryExportFormat.NDJSON: "application/x-ndjson",
+    HistoryExportFormat.MSGPACK: "application/msgpack",
+    HistoryExportFormat.CBOR: "application/cbor-seq",
+}
+HISTORY_EXPORT_WIRE_FORMATS = {
+    HistoryExportFormat.MSGPACK: WireFormat.MSGPACK,
+    HistoryExportFormat.CBOR: WireFormat.CBOR,
+}
+
 
 class DashboardApi(Routable):
     """Dashboard API class."""
 
-    def __init__(self, config: Config) -> None:
+    def __init__(
+        self,
+        config: Config,
+        prober: StatusProber,
+        avatars: AvatarCache,
+        history: HistoryStore | None = None,
+        rate_limiter: RateLimiter | None = None,
+        federation: FederationAggregator | None = None,
+    ) -> None:
         """Initialize the Dashboard API."""
         super().__init__()
         self.config = config
+        self.prober = prober
+        self.avatars = avatars
+        self.history = history
+        self.rate_limiter = rate_limiter
+        self.federation = federation
+        self.config_json, self.config_etag = self._serialize_config()
 
     def reload_configuration(self, new_configuration: Config) -> None:
         """Reload the configuration."""
         self.config = new_configuration
+        self.config_json, self.config_etag = self._serialize_config()
+        self.prober.reload_configuration(new_configuration)
+        self.avatars.reload_configuration(new_configuration)
+        if self.rate_limiter:
+            self.rate_limiter.reload_configuration(new_configuration)
+        if self.federation:
+            self.federation.reload_configuration(new_configuration)
 
     @get(
         "/health",
@@ -44,22 +100,43 @@ class DashboardApi(Routable):
         tags=["Config"],
         status_code=200,
         response_model=ConfigData,
+        responses={304: {"description": "The configuration did not change"}},
     )
-    async def get_config(self) -> ConfigData:
+    async def get_config(self, request: Request) -> Response:
         """Get dashboard configuration endpoint."""
+        headers = {"ETag": self.config_etag, "Cache-Control": "no-cache"}
+
+        if request.headers.get("if-none-match") == self.config_etag:
+            return Response(status_code=304, headers=headers)
+
+        return Response(
+            content=self.config_json,
+            media_type="application/json",
+            headers=headers,
+        )
+
+    def _serialize_config(self) -> tuple[bytes, str]:
+        """Serialize the frontend configuration once per load and tag it."""
         host_external = self.config.effective_minecraft_server_host_external
         port_external = self.config.effective_minecraft_server_port_external
         server_address = f"{host_external}:{port_external}"
 
-        return ConfigData(
-            use_mock_data=self.config.frontend_use_mock_data,
-            polling_interval=self.config.frontend_polling_interval,
-            simulate_offline=self.config.frontend_simulate_offline,
-            page_title=self.config.frontend_page_title,
-            header_title=self.config.frontend_header_title,
-            server_address=server_address,
-            frontend_links=self.config.frontend_links,
+        config_json = (
+            ConfigData(
+                use_mock_data=self.config.frontend_use_mock_data,
+                polling_interval=self.config.frontend_polling_interval,
+                simulate_offline=self.config.frontend_simulate_offline,
+                page_title=self.config.frontend_page_title,
+                header_title=self.config.frontend_header_title,
+                server_address=server_address,
+                frontend_links=self.config.frontend_links,
+            )
+            .model_dump_json()
+            .encode("utf-8")
         )
+        etag = f'"{hashlib.blake2b(config_json, digest_size=8).hexdigest()}"'
+
+        return config_json, etag
 
     @get(
         "/status",
@@ -67,15 +144,268 @@ class DashboardApi(Routable):
         tags=["Status"],
         status_code=200,
         response_model=Status,
+        responses={
+            200: BINARY_CONTENT,
+            304: {"description": "The status did not change"},
+            404: {"description": "No status was recorded before `at`"},
+        },
+    )
+    async def get_status(
+        self,
+        request: Request,
+        at: Annotated[
+            float | None, Query(ge=0, le=MAX_TIMESTAMP, allow_inf_nan=False)
+        ] = None,
+    ) -> Response:
+        """Get the status of the Minecraft server.
+
+        With `at`, a Unix timestamp, get the status as it was recorded last at
+        or before that moment instead.
+        """
+        if at is not None:
+            return await self._archived_status_response(request, at)
+
+        await self.prober.ready.wait()
+        wire_format = WireUtils.negotiate(request.headers.get("accept"))
+        etag = self.prober.get_status_etag(wire_format)
+
+        if request.headers.get("if-none-match") == etag:
+            return Response(
+                status_code=304,
+                headers={
+                    "ETag": etag,
+                    "Vary": "Accept",
+                    STATUS_VERSION_HEADER: str(self.prober.version),
+                },
+            )
+
+        return self._status_response(wire_format)
+
+    @get(
+        "/status/wait",
+        summary="Wait for the status of the Minecraft server to change",
+        tags=["Status"],
+        status_code=200,
+        response_model=Status,
+        responses={
+            200: BINARY_CONTENT,
+            304: {"description": "The status did not change in time"},
+        },
+    )
+    async def wait_for_status(
+        self, request: Request, since: int = 0, timeout: float = STATUS_WAIT_TIMEOUT
+    ) -> Response:
+        """Return the status once its version differs from `since`."""
+        timeout = min(max(timeout, 0.0), STATUS_WAIT_TIMEOUT_MAX)
+
+        if not await self.prober.wait_for_change(since, timeout):
+            return Response(
+                status_code=304,
+                headers={STATUS_VERSION_HEADER: str(self.prober.version)},
+            )
+
+        return self._status_response(WireUtils.negotiate(request.headers.get("accept")))
+
+    async def _archived_status_response(
+        self, request: Request, timestamp: float
+    ) -> Response:
+        """Rebuild a past status and tag it with the time it was recorded."""
+        if not self.history:
+            raise HTTPException(status_code=404, detail="History is disabled")
+
+        snapshot = await self.history.snapshots.get(timestamp)
+        if snapshot is None:
+            raise HTTPException(
+                status_code=404, detail="No status was recorded before this time"
+            )
+
+        recorded_at, status = snapshot
+        response = self._model_response(request, status)
+        response.headers[STATUS_TIMESTAMP_HEADER] = str(recorded_at)
+        return response
+
+    def _status_response(self, wire_format: WireFormat) -> Response:
+        """Wrap the encoded status and its version in a response."""
+        return Response(
+            content=self.prober.get_status_encoded(wire_format),
+            media_type=wire_format,
+            headers={
+                "ETag": self.prober.get_status_etag(wire_format),
+                "Vary": "Accept",
+                STATUS_VERSION_HEADER: str(self.prober.version),
+            },
+        )
+
+    @staticmethod
+    def _model_response(request: Request, model: BaseModel) -> Response:
+        """Encode a model in the format the client accepts."""
+        wire_format = WireUtils.negotiate(request.headers.get("accept"))
+        if wire_format == WireFormat.JSON:
+            content = model.model_dump_json().encode("utf-8")
+        else:
+            content = WireUtils.encode(model.model_dump(mode="json"), wire_format)
+
+        return Response(
+            content=content, media_type=wire_format, headers={"Vary": "Accept"}
+        )
+
+    @get(
+        "/federation/status",
+        summary="Get the merged status of this dashboard and its peers",
+        tags=["Federation"],
+        status_code=200,
+        response_model=FederationData,
+        responses={200: BINARY_CONTENT},
+    )
+    async def get_federation_status(self, request: Request) -> Response:
+        """Merge the local status with the last status pulled from every peer."""
+        if not self.federation:
+            raise HTTPException(status_code=404, detail="Federation is disabled")
+
+        return self._model_response(
+            request, self.federation.get_data(await self.prober.get_status())
+        )
+
+    @get(
+        "/avatar/{uuid}",
+        summary="Get the avatar of a player",
+        tags=["Avatar"],
+        status_code=200,
+        response_class=Response,
+        responses={200: {"content": {"image/png": {}}}},
+    )
+    async def get_avatar(self, uuid: str) -> Response:
+        """Get the avatar of a player through the avatar cache."""
+        normalized_uuid = AvatarCache.normalize_uuid(uuid)
+        if not normalized_uuid:
+            raise HTTPException(status_code=404, detail="Unknown player")
+
+        avatar = await self.avatars.get(normalized_uuid)
+        if avatar is None:
+            raise HTTPException(status_code=502, detail="Avatar unavailable")
+
+        return Response(
+            content=avatar,
+            media_type="image/png",
+            headers={
+                "Cache-Control": f"public, max-age={int(self.config.avatar_cache_ttl)}"
+            },
+        )
+
+    @get(
+        "/history/export",
+        summary="Export the status history",
+        tags=["History"],
+        status_code=200,
+        response_class=StreamingResponse,
+        responses={
+            200: {
+                "content": {
+                    media_type: {} for media_type in HISTORY_EXPORT_MEDIA_TYPES.values()
+                }
+            },
+        },
+    )
+    async def export_history(
+        self,
+        request: Request,
+        format: HistoryExportFormat | None = None,
+        start: Annotated[
+            float | None, Query(ge=0, le=MAX_TIMESTAMP, allow_inf_nan=False)
+        ] = None,
+        end: Annotated[
+            float | None, Query(ge=0, le=MAX_TIMESTAMP, allow_inf_nan=False)
+        ] = None,
+        fields: str | None = None,
+    ) -> StreamingResponse:
+        """Stream the status history between two Unix timestamps.
+
+        Without a format, MessagePack or CBOR is picked from the Accept header
+        and CSV otherwise.
+        """
+        if not self.history:
+            raise HTTPException(status_code=404, detail="History is disabled")
+
+        if start is not None and end is not None and start > end:
+            raise HTTPException(status_code=422, detail="The start is after the end")
+
+        if format is None:
+            format = {
+                WireFormat.MSGPACK: HistoryExportFormat.MSGPACK,
+                WireFormat.CBOR: HistoryExportFormat.CBOR,
+            }.get(
+                WireUtils.negotiate(request.headers.get("accept")),
+                HistoryExportFormat.CSV,
+            )
+        wire_format = HISTORY_EXPORT_WIRE_FORMATS.get(format)
+        if wire_format and not WireUtils.is_available(wire_format):
+            raise HTTPException(
+                status_code=400, detail=f"The {format} format is not installed"
+            )
+
+        selected_fields = fields.split(",") if fields else HISTORY_FIELDS
+        unknown_fields = set(selected_fields) - set(HISTORY_FIELDS)
+        if unknown_fields:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown fields: {', '.join(sorted(unknown_fields))}",
+            )
+
+        compress = WireUtils.accepts_encoding(
+            request.headers.get("accept-encoding"), "gzip"
+        )
+        headers = {
+            "Content-Disposition": f'attachment; filename="history.{format}"',
+            "Vary": "Accept, Accept-Encoding",
+        }
+        if compress:
+            headers["Content-Encoding"] = "gzip"
+
+        return StreamingResponse(
+            self.history.export(format, selected_fields, start, end, compress),
+            media_type=HISTORY_EXPORT_MEDIA_TYPES[format],
+            headers=headers,
+        )
+
+    @get(
+        "/stats/unique-players",
+        summary="Get the estimated unique players",
+        tags=["Stats"],
+        status_code=200,
+        response_model=UniquePlayersData,
+        responses={200: BINARY_CONTENT},
+    )
+    async def get_unique_players(
+        self,
+        request: Request,
+        period: StatsPeriod = StatsPeriod.DAY,
+        count: int = 1,
+    ) -> Response:
+        """Estimate the unique players of the latest hours, days or months."""
+        if not self.history:
+            raise HTTPException(status_code=404, detail="History is disabled")
+
+        return self._model_response(
+            request, await self.history.unique_players.get(period, count)
+        )
+
+    @get(
+        "/metrics",
+        summary="Get dashboard metrics",
+        tags=["Metrics"],
+        status_code=200,
+        response_model=MetricsData,
     )
-    async def get_status(self) -> Status:
-        """Get the status of the Minecraft server."""
-        return await MinecraftUtils.get_status(
-            self.config.minecraft_server_host,
-            self.config.minecraft_server_port,
-            self.config.effective_minecraft_server_host_external,
-            self.config.effective_minecraft_server_port_external,
-            self.config.minecraft_server_timeout,
-            self.config.ping_host_external,
-            self.config.ping_port_external,
+    async def get_metrics(self) -> MetricsData:
+        """Get dashboard metrics endpoint."""
+        return MetricsData(
+            circuits=self.prober.get_circuit_metrics(),
+            hedges=[MinecraftUtils.mcsrvstat_hedge.to_data()],
+            log_records_dropped=LoggingUtils.get_dropped(),
+            log_records_suppressed=LoggingUtils.get_suppressed(),
+            requests_rate_limited=self.rate_limiter.rate_limited
+            if self.rate_limiter
+            else 0,
+            requests_shed=self.rate_limiter.shed if self.rate_limiter else 0,
+            alerts_dropped=self.prober.alerts.dropped if self.prober.alerts else 0,
         )
@@ -0,0 +1,316 @@
+"""Status snapshot archive module for minecraft-dashboard."""
+
+import asyncio
+import bisect
+import json
+import logging
+import struct
+import threading
+import time
+import zlib
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from minecraft_dashboard.cache import LruCache
+from minecraft_dashboard.const import (
+    STATUS_ARCHIVE_BLOCK_AGE,
+    STATUS_ARCHIVE_BLOCK_SIZE,
+    STATUS_ARCHIVE_CACHE_SIZE,
+    STATUS_ARCHIVE_DAYS,
+)
+from minecraft_dashboard.models import Status
+
+logger = logging.getLogger(__name__)
+
+BLOCK_HEADER = struct.Struct("<dI")
+# The latest moment a day can be derived for.
+MAX_TIMESTAMP = datetime(9999, 12, 31, tzinfo=UTC).timestamp()
+
+type ArchiveRecord = tuple[float, dict[str, Any]]
+
+
+class StatusArchive:
+    """Full status history, stored as keyframes followed by deltas.
+
+    Every changed status is recorded as a JSON merge patch against the
+    previous one, so a probe that only changed the latency costs a few
+    bytes. Records are grouped into blocks that start with a full keyframe
+    and are compressed as a whole, one file of blocks per UTC day. Each block
+    header holds the timestamp of its first record, so a past status is found
+    by a binary search over the block index and rebuilt from one block,
+    applying at most a block worth of patches.
+
+    The open block is also appended to a tail file record by record, so
+    processes that do not probe themselves see the latest records and a
+    crash loses none of them. Days beyond the retention are deleted.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the status archive."""
+        self.path = path
+        self.previous: dict[str, Any] | None = None
+        self.block: list[ArchiveRecord] = []
+        self.block_started = 0.0
+        self.flushing: list[ArchiveRecord] = []
+        self.indices: dict[str, tuple[int, list[float], list[int]]] = {}
+        self.index_lock = threading.Lock()
+        self.blocks: LruCache[tuple[str, int], list[ArchiveRecord]] = LruCache(
+            STATUS_ARCHIVE_CACHE_SIZE
+        )
+        self.repaired_days: set[str] = set()
+        self.is_writer = False
+
+    @staticmethod
+    def get_day(timestamp: float) -> str:
+        """Get the UTC day a timestamp belongs to."""
+        return datetime.fromtimestamp(timestamp, UTC).date().isoformat()
+
+    def get_day_path(self, day: str) -> Path:
+        """Get the file the blocks of a day are stored in."""
+        return self.path / f"{day}.snapshots"
+
+    @property
+    def tail_path(self) -> Path:
+        """Get the file the records of the open block are appended to."""
+        return self.path / "tail.ndjson"
+
+    @staticmethod
+    def create_patch(source: dict[str, Any], target: dict[str, Any]) -> dict[str, Any]:
+        """Create the JSON merge patch that turns one status into another."""
+        patch: dict[str, Any] = {key: None for key in source.keys() - target.keys()}
+        for key, value in target.items():
+            previous = source.get(key)
+            if value == previous:
+                continue
+            if isinstance(value, dict) and isinstance(previous, dict):
+                patch[key] = StatusArchive.create_patch(previous, value)
+            else:
+                patch[key] = value
+        return patch
+
+    @staticmethod
+    def apply_patch(target: dict[str, Any], patch: dict[str, Any]) -> dict[str, Any]:
+        """Apply a JSON merge patch to a status."""
+        result = dict(target)
+        for key, value in patch.items():
+            if value is None:
+                result.pop(key, None)
+            elif isinstance(value, dict) and isinstance(result.get(key), dict):
+                result[key] = StatusArchive.apply_patch(result[key], value)
+            else:
+                result[key] = value
+        return result
+
+    async def append(self, status: Status, timestamp: float) -> None:
+        """Record a status unless it equals the previous one."""
+        state = status.model_dump(mode="json", exclude_none=True)
+        if state == self.previous:
+            return
+
+        if not self.is_writer:
+            self.is_writer = True
+            await self._recover()
+
+        if not self.block:
+            self.block_started = time.monotonic()
+            record = (timestamp, state)
+        else:
+            record = (timestamp, self.create_patch(self.previous or {}, state))
+        self.block.append(record)
+        self.previous = state
+
+        try:
+            await asyncio.to_thread(self._append_tail, record, len(self.block) == 1)
+        except OSError as exception:
+            logger.warning(f"Failed to record status snapshot: {exception}")
+
+        if (
+            len(self.block) >= STATUS_ARCHIVE_BLOCK_SIZE
+            or time.monotonic() - self.block_started >= STATUS_ARCHIVE_BLOCK_AGE
+        ):
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Compress the open block and append it to the file of its day."""
+        if not self.block:
+            return
+
+        self.flushing = self.block
+        self.block = []
+        try:
+            await asyncio.to_thread(self._write, self.flushing)
+            await asyncio.to_thread(self.tail_path.unlink, missing_ok=True)
+        except OSError as exception:
+            logger.warning(f"Failed to archive status snapshots: {exception}")
+        finally:
+            self.flushing = []
+
+    async def get(self, timestamp: float) -> tuple[float, Status] | None:
+        """Rebuild the status recorded last at or before a timestamp.
+
+        Return the time it was recorded at along with it, or None if nothing
+        was recorded before.
+        """
+        # The writer keeps the open block and the one being written in memory,
+        # everyone else reads the open block from the tail file.
+        open_blocks = (
+            (self.block, self.flushing)
+            if self.is_writer
+            else (await asyncio.to_thread(self._read_tail),)
+        )
+        block = next(
+            (block for block in open_blocks if block and block[0][0] <= timestamp),
+            None,
+        ) or await self._find_block(timestamp)
+        if block is None:
+            return None
+
+        position = bisect.bisect_right(block, timestamp, key=lambda record: record[0])
+        state: dict[str, Any] = {}
+        for _, patch in block[:position]:
+            state = self.apply_patch(state, patch)
+
+        return block[position - 1][0], Status.model_validate(state)
+
+    async def _find_block(self, timestamp: float) -> list[ArchiveRecord] | None:
+        """Find the persisted block holding the last record before a timestamp."""
+        day = self.get_day(timestamp)
+        days = sorted(
+            (day_path.stem for day_path in self.path.glob("*.snapshots")),
+            reverse=True,
+        )
+
+        for candidate in days:
+            if candidate > day:
+                continue
+
+            _, timestamps, offsets = await asyncio.to_thread(
+                self._load_index, candidate
+            )
+            position = bisect.bisect_right(timestamps, timestamp) - 1
+            if position < 0:
+                continue
+
+            key = (candidate, offsets[position])
+            block = self.blocks.get(key)
+            if block is None:
+                block = await asyncio.to_thread(self._read_block, *key)
+                self.blocks.put(key, block)
+            return block
+
+        return None
+
+    def _load_index(self, day: str) -> tuple[int, list[float], list[int]]:
+        """Index the blocks of a day, scanning only what was appended since."""
+        with self.index_lock:
+            size, timestamps, offsets = self.indices.get(day, (0, [], []))
+            try:
+                with self.get_day_path(day).open("rb") as day_file:
+                    day_file.seek(size)
+                    data = day_file.read()
+            except FileNotFoundError:
+                data = b""
+
+            position = 0
+            while position + BLOCK_HEADER.size <= len(data):
+                first_timestamp, length = BLOCK_HEADER.unpack_from(data, position)
+                end = position + BLOCK_HEADER.size + length
+                if end > len(data):
+                    # A block that is still being written or was cut off.
+                    break
+                timestamps.append(first_timestamp)
+                offsets.append(size + position)
+                position = end
+
+            index = (size + position, timestamps, offsets)
+            self.indices[day] = index
+            return index
+
+    async def _recover(self) -> None:
+        """Archive the open block a previous writer left in the tail file."""
+        block = await asyncio.to_thread(self._read_tail)
+        if not block:
+            return
+
+        self.flushing = block
+        try:
+            await asyncio.to_thread(self._write, block)
+            await asyncio.to_thread(self.tail_path.unlink, missing_ok=True)
+        except OSError as exception:
+            logger.warning(f"Failed to recover status snapshots: {exception}")
+        finally:
+            self.flushing = []
+
+    def _append_tail(self, record: ArchiveRecord, is_keyframe: bool) -> None:
+        """Append a record to the tail file, starting it over on a keyframe."""
+        self.path.mkdir(parents=True, exist_ok=True)
+        mode = "w" if is_keyframe else "a"
+        with self.tail_path.open(mode, encoding="utf-8") as tail:
+            tail.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+    def _read_tail(self) -> list[ArchiveRecord]:
+        """Read the records of the open block from the tail file."""
+        try:
+            lines = self.tail_path.read_text(encoding="utf-8").splitlines()
+        except FileNotFoundError:
+            return []
+
+        block = []
+        for line in lines:
+            try:
+                timestamp, patch = json.loads(line)
+            except ValueError:
+                # A line that is still being written or was cut off.
+                break
+            block.append((timestamp, patch))
+        return block
+
+    def _read_block(self, day: str, offset: int) -> list[ArchiveRecord]:
+        """Read and decompress a block."""
+        with self.get_day_path(day).open("rb") as day_file:
+            day_file.seek(offset)
+            _, length = BLOCK_HEADER.unpack(day_file.read(BLOCK_HEADER.size))
+            data = zlib.decompress(day_file.read(length))
+        return [
+            (timestamp, patch)
+            for timestamp, patch in map(json.loads, data.splitlines())
+        ]
+
+    def _write(self, block: list[ArchiveRecord]) -> None:
+        """Append a compressed block to the file of the day it started on."""
+        day = self.get_day(block[0][0])
+        day_path = self.get_day_path(day)
+        self.path.mkdir(parents=True, exist_ok=True)
+
+        if day not in self.repaired_days:
+            # Drop a block cut off by a crash, the reader would stop at it.
+            size = self._load_index(day)[0]
+            if day_path.exists() and day_path.stat().st_size > size:
+                with day_path.open("r+b") as day_file:
+                    day_file.truncate(size)
+            self.repaired_days.add(day)
+
+        data = zlib.compress(
+            "\n".join(
+                json.dumps(record, separators=(",", ":")) for record in block
+            ).encode("utf-8")
+        )
+        with day_path.open("ab") as day_file:
+            day_file.write(BLOCK_HEADER.pack(block[0][0], len(data)) + data)
+
+        self._delete_expired(block[0][0])
+
+    def _delete_expired(self, timestamp: float) -> None:
+        """Delete the days beyond the retention."""
+        cutoff = self.get_day(
+            (
+                datetime.fromtimestamp(timestamp, UTC)
+                - timedelta(days=STATUS_ARCHIVE_DAYS)
+            ).timestamp()
+        )
+        for day_path in self.path.glob("*.snapshots"):
+            if day_path.stem < cutoff:
+                day_path.unlink(missing_ok=True)
+                with self.index_lock:
+                    self.indices.pop(day_path.stem, None)
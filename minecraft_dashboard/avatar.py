@@ -0,0 +1,163 @@
+"""Player avatar proxy module for minecraft-dashboard."""
+
+import asyncio
+import logging
+import os
+import re
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from minecraft_dashboard.cache import LruCache
+from minecraft_dashboard.config import Config
+from minecraft_dashboard.const import AVATAR_MEMORY_CACHE_SIZE
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = logging.getLogger(__name__)
+
+UUID_PATTERN = re.compile(r"^[0-9a-f]{8}-?([0-9a-f]{4}-?){3}[0-9a-f]{12}$")
+
+
+class AvatarCache:
+    """Proxies player avatars through a memory and a size-bounded disk cache.
+
+    Concurrent requests for the same player share a single upstream fetch.
+    An expired disk entry is still served when the upstream is unreachable.
+    """
+
+    def __init__(self, config: Config) -> None:
+        """Initialize the avatar cache."""
+        self.config = config
+        self.memory: LruCache[str, tuple[bytes, float]] = LruCache(
+            AVATAR_MEMORY_CACHE_SIZE
+        )
+        self.pending: dict[str, asyncio.Task[bytes | None]] = {}
+        self.client: httpx.AsyncClient | None = None
+        self.disk_size: int | None = None
+        self.fetches = 0
+
+    @property
+    def cache_dir(self) -> Path | None:
+        """Get the directory of the disk cache, if enabled."""
+        if not self.config.avatar_cache_path:
+            return None
+        return Path(self.config.avatar_cache_path)
+
+    def reload_configuration(self, new_configuration: Config) -> None:
+        """Reload the configuration and drop avatars of the previous upstream."""
+        if new_configuration.avatar_url != self.config.avatar_url:
+            self.memory.clear()
+        self.config = new_configuration
+        self.disk_size = None
+
+    async def close(self) -> None:
+        """Close the upstream connection pool."""
+        if self.client:
+            await self.client.aclose()
+            self.client = None
+
+    @staticmethod
+    def normalize_uuid(uuid: str) -> str | None:
+        """Normalize a player UUID, returning None if it is not one."""
+        uuid = uuid.lower()
+        if not UUID_PATTERN.match(uuid):
+            return None
+        return uuid.replace("-", "")
+
+    async def get(self, uuid: str) -> bytes | None:
+        """Get the avatar of a player, fetching it only once at a time."""
+        entry = self.memory.get(uuid)
+        if entry and entry[1] > time.time():
+            return entry[0]
+
+        # The fetch runs as its own task, so a client hanging up does not
+        # cancel it for the other requests waiting on the same avatar.
+        task = self.pending.get(uuid)
+        if task is None:
+            task = asyncio.create_task(self._load(uuid, entry[0] if entry else None))
+            self.pending[uuid] = task
+            task.add_done_callback(lambda _: self.pending.pop(uuid, None))
+
+        return await asyncio.shield(task)
+
+    async def _load(self, uuid: str, stale: bytes | None) -> bytes | None:
+        """Load an avatar from disk, falling back to the upstream."""
+        path = self.cache_dir / f"{uuid}.png" if self.cache_dir else None
+
+        if path:
+            cached = await asyncio.to_thread(self._read, path)
+            if cached:
+                avatar, expires_at = cached
+                if expires_at > time.time():
+                    self.memory.put(uuid, (avatar, expires_at))
+                    return avatar
+                stale = stale or avatar
+
+        try:
+            avatar = await self._fetch(uuid)
+        except Exception as exception:
+            logger.warning(f"Failed to fetch avatar of {uuid}: {exception}")
+            return stale
+
+        expires_at = time.time() + self.config.avatar_cache_ttl
+        self.memory.put(uuid, (avatar, expires_at))
+        if path:
+            await asyncio.to_thread(self._write, path, avatar)
+        return avatar
+
+    async def _fetch(self, uuid: str) -> bytes:
+        """Fetch an avatar from the upstream service."""
+        import httpx
+
+        if self.client is None:
+            self.client = httpx.AsyncClient(
+                timeout=self.config.minecraft_server_timeout
+            )
+
+        self.fetches += 1
+        response = await self.client.get(self.config.avatar_url.format(uuid=uuid))
+        response.raise_for_status()
+        return response.content
+
+    def _read(self, path: Path) -> tuple[bytes, float] | None:
+        """Read a disk cache entry and its expiry time, marking it as used."""
+        try:
+            modified_at = path.stat().st_mtime
+            avatar = path.read_bytes()
+            # The access time orders the eviction, the write time the expiry.
+            os.utime(path, (time.time(), modified_at))
+        except FileNotFoundError:
+            return None
+        return avatar, modified_at + self.config.avatar_cache_ttl
+
+    def _write(self, path: Path, avatar: bytes) -> None:
+        """Write a disk cache entry and evict the oldest ones over the size limit."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if self.disk_size is None:
+            self.disk_size = sum(
+                entry.stat().st_size for entry in path.parent.iterdir()
+            )
+
+        previous_size = path.stat().st_size if path.exists() else 0
+        temporary_path = path.with_suffix(".tmp")
+        temporary_path.write_bytes(avatar)
+        temporary_path.replace(path)
+        self.disk_size += len(avatar) - previous_size
+
+        if self.disk_size > self.config.avatar_cache_max_size:
+            self._evict(path.parent)
+
+    def _evict(self, directory: Path) -> None:
+        """Remove the least recently used entries until the cache fits."""
+        entries = sorted(
+            (stat.st_atime, stat.st_size, entry)
+            for entry in directory.glob("*.png")
+            for stat in (entry.stat(),)
+        )
+        for _, size, entry in entries:
+            if self.disk_size <= self.config.avatar_cache_max_size:
+                break
+            entry.unlink(missing_ok=True)
+            self.disk_size -= size
@@ -0,0 +1,49 @@
+"""Bounded in-memory cache module for minecraft-dashboard."""
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+
+
+class LruCache[K: Hashable, V]:
+    """A size-bounded mapping that evicts the least recently used entry."""
+
+    def __init__(self, max_size: int) -> None:
+        """Initialize the cache."""
+        self.max_size = max_size
+        self.entries: OrderedDict[K, V] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, key: K) -> V | None:
+        """Get a cached value and mark it as recently used."""
+        try:
+            value = self.entries[key]
+        except KeyError:
+            self.misses += 1
+            return None
+
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: K, value: V) -> None:
+        """Cache a value, evicting the least recently used one if full."""
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def get_or_create(self, key: K, factory: Callable[[], V]) -> V:
+        """Get a cached value, creating and caching it on a miss."""
+        value = self.get(key)
+        if value is None:
+            value = factory()
+            self.put(key, value)
+        return value
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self.entries.clear()
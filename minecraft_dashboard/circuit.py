@@ -0,0 +1,107 @@
+"""Circuit breaker module for minecraft-dashboard."""
+
+import logging
+import time
+
+from minecraft_dashboard.models import CircuitData, CircuitMetricsData, CircuitState
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    """Short-circuits probes of a target while it keeps failing."""
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int,
+        backoff_base: float,
+        backoff_max: float,
+    ) -> None:
+        """Initialize the circuit breaker."""
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.state = CircuitState.CLOSED
+        self.consecutive_failures = 0
+        self.consecutive_opens = 0
+        self.retry_at = 0.0
+        self.retry_timestamp = 0.0
+        self.short_circuited = 0
+        self.opened = 0
+
+    def configure(
+        self,
+        failure_threshold: int,
+        backoff_base: float,
+        backoff_max: float,
+    ) -> None:
+        """Apply new thresholds without resetting the current state."""
+        self.failure_threshold = failure_threshold
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+    def allow(self) -> bool:
+        """Return whether a probe may be sent to the target right now."""
+        if self.state == CircuitState.CLOSED:
+            return True
+
+        if self.state == CircuitState.OPEN and time.monotonic() >= self.retry_at:
+            # Let exactly one trial probe through, concurrent callers keep
+            # getting the fast offline answer until it reports back.
+            self.state = CircuitState.HALF_OPEN
+            return True
+
+        self.short_circuited += 1
+        return False
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful probe."""
+        if self.state != CircuitState.CLOSED:
+            logger.info(f"Circuit '{self.name}' closed")
+
+        self.state = CircuitState.CLOSED
+        self.consecutive_failures = 0
+        self.consecutive_opens = 0
+
+    def record_failure(self) -> None:
+        """Count a failed probe and open the circuit once the threshold is hit."""
+        self.consecutive_failures += 1
+
+        if (
+            self.state != CircuitState.HALF_OPEN
+            and self.consecutive_failures < self.failure_threshold
+        ):
+            return
+
+        backoff = min(
+            self.backoff_base * 2**self.consecutive_opens,
+            self.backoff_max,
+        )
+        self.state = CircuitState.OPEN
+        self.retry_at = time.monotonic() + backoff
+        self.retry_timestamp = time.time() + backoff
+        self.consecutive_opens += 1
+        self.opened += 1
+
+        logger.warning(
+            f"Circuit '{self.name}' opened after {self.consecutive_failures} "
+            f"failures, retrying in {backoff:.0f}s"
+        )
+
+    def to_data(self) -> CircuitData:
+        """Get the current state of the circuit."""
+        return CircuitData(
+            name=self.name,
+            state=self.state,
+            consecutive_failures=self.consecutive_failures,
+            retry_at=self.retry_timestamp if self.state == CircuitState.OPEN else None,
+            opened=self.opened,
+        )
+
+    def to_metrics(self) -> CircuitMetricsData:
+        """Get the current state of the circuit along with its counters."""
+        return CircuitMetricsData(
+            **self.to_data().model_dump(), short_circuited=self.short_circuited
+        )
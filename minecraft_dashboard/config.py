@@ -10,76 +10,169 @@ from dataclass_wizard import JSONWizard, YAMLWizard
 from pydantic.dataclasses import dataclass
 
 from minecraft_dashboard.const import (
+    CONF_ACCESS_LOG,
+    CONF_ALERT_RULES,
+    CONF_ALERT_SINKS,
+    CONF_AVATAR_CACHE_MAX_SIZE,
+    CONF_AVATAR_CACHE_PATH,
+    CONF_AVATAR_CACHE_TTL,
+    CONF_AVATAR_URL,
+    CONF_BACKLOG,
+    CONF_CIRCUIT_BACKOFF_BASE,
+    CONF_CIRCUIT_BACKOFF_MAX,
+    CONF_CIRCUIT_FAILURE_THRESHOLD,
     CONF_CONFIG_FILE_PATH,
+    CONF_FEDERATION_INTERVAL,
+    CONF_FEDERATION_PEERS,
+    CONF_FEDERATION_STALE_AFTER,
+    CONF_FEDERATION_TIMEOUT,
     CONF_FRONTEND_HEADER_TITLE,
     CONF_FRONTEND_LINKS,
     CONF_FRONTEND_PAGE_TITLE,
     CONF_FRONTEND_POLLING_INTERVAL,
+    CONF_FRONTEND_POLLING_INTERVAL_MAX,
     CONF_FRONTEND_SIMULATE_OFFLINE,
     CONF_FRONTEND_USE_MOCK_DATA,
+    CONF_HISTORY_PATH,
     CONF_HOST,
+    CONF_HTTP,
+    CONF_KEEP_ALIVE_TIMEOUT,
+    CONF_LIMIT_CONCURRENCY,
     CONF_LOG_DATE_FORMAT,
     CONF_LOG_FILEMODE,
     CONF_LOG_FORMAT_CONSOLE,
     CONF_LOG_FORMAT_FILE,
     CONF_LOG_LEVEL,
     CONF_LOG_PATH,
+    CONF_LOOP,
+    CONF_MAX_CONCURRENCY,
+    CONF_MCSRVSTAT_INTERVAL,
+    CONF_MCSRVSTAT_URL,
     CONF_MINECRAFT_SERVER_HOST,
     CONF_MINECRAFT_SERVER_HOST_EXTERNAL,
     CONF_MINECRAFT_SERVER_PORT,
     CONF_MINECRAFT_SERVER_PORT_EXTERNAL,
+    CONF_MINECRAFT_SERVER_QUERY_INTERVAL,
+    CONF_MINECRAFT_SERVER_STATUS_INTERVAL,
     CONF_MINECRAFT_SERVER_TIMEOUT,
     CONF_PING_HOST_EXTERNAL,
     CONF_PING_PORT_EXTERNAL,
     CONF_PORT,
+    CONF_RATE_LIMIT,
+    CONF_RATE_LIMIT_BURST,
+    CONF_STATE_PATH,
+    CONF_WORKERS,
+    DEFAULT_ACCESS_LOG,
+    DEFAULT_ALERT_RULES,
+    DEFAULT_ALERT_SINKS,
+    DEFAULT_AVATAR_CACHE_MAX_SIZE,
+    DEFAULT_AVATAR_CACHE_PATH,
+    DEFAULT_AVATAR_CACHE_TTL,
+    DEFAULT_AVATAR_URL,
+    DEFAULT_BACKLOG,
+    DEFAULT_CIRCUIT_BACKOFF_BASE,
+    DEFAULT_CIRCUIT_BACKOFF_MAX,
+    DEFAULT_CIRCUIT_FAILURE_THRESHOLD,
     DEFAULT_CONFIG_FILE_PATH,
+    DEFAULT_FEDERATION_INTERVAL,
+    DEFAULT_FEDERATION_PEERS,
+    DEFAULT_FEDERATION_STALE_AFTER,
+    DEFAULT_FEDERATION_TIMEOUT,
     DEFAULT_FRONTEND_HEADER_TITLE,
     DEFAULT_FRONTEND_LINKS,
     DEFAULT_FRONTEND_PAGE_TITLE,
     DEFAULT_FRONTEND_POLLING_INTERVAL,
+    DEFAULT_FRONTEND_POLLING_INTERVAL_MAX,
     DEFAULT_FRONTEND_SIMULATE_OFFLINE,
     DEFAULT_FRONTEND_USE_MOCK_DATA,
+    DEFAULT_HISTORY_PATH,
     DEFAULT_HOST,
+    DEFAULT_HTTP,
+    DEFAULT_KEEP_ALIVE_TIMEOUT,
+    DEFAULT_LIMIT_CONCURRENCY,
     DEFAULT_LOG_DATE_FORMAT,
     DEFAULT_LOG_FILEMODE,
     DEFAULT_LOG_FORMAT_CONSOLE,
     DEFAULT_LOG_FORMAT_FILE,
     DEFAULT_LOG_LEVEL,
     DEFAULT_LOG_PATH,
+    DEFAULT_LOOP,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_MCSRVSTAT_INTERVAL,
+    DEFAULT_MCSRVSTAT_URL,
     DEFAULT_MINECRAFT_SERVER_HOST,
     DEFAULT_MINECRAFT_SERVER_HOST_EXTERNAL,
     DEFAULT_MINECRAFT_SERVER_PORT,
     DEFAULT_MINECRAFT_SERVER_PORT_EXTERNAL,
+    DEFAULT_MINECRAFT_SERVER_QUERY_INTERVAL,
+    DEFAULT_MINECRAFT_SERVER_STATUS_INTERVAL,
     DEFAULT_MINECRAFT_SERVER_TIMEOUT,
     DEFAULT_PING_HOST_EXTERNAL,
     DEFAULT_PING_PORT_EXTERNAL,
     DEFAULT_PORT,
+    DEFAULT_RATE_LIMIT,
+    DEFAULT_RATE_LIMIT_BURST,
+    DEFAULT_STATE_PATH,
+    DEFAULT_WORKERS,
+    ENV_ACCESS_LOG,
+    ENV_ALERT_RULES,
+    ENV_ALERT_SINKS,
+    ENV_AVATAR_CACHE_MAX_SIZE,
+    ENV_AVATAR_CACHE_PATH,
+    ENV_AVATAR_CACHE_TTL,
+    ENV_AVATAR_URL,
+    ENV_BACKLOG,
+    ENV_CIRCUIT_BACKOFF_BASE,
+    ENV_CIRCUIT_BACKOFF_MAX,
+    ENV_CIRCUIT_FAILURE_THRESHOLD,
     ENV_CONFIG_FILE_PATH,
+    ENV_FEDERATION_INTERVAL,
+    ENV_FEDERATION_PEERS,
+    ENV_FEDERATION_STALE_AFTER,
+    ENV_FEDERATION_TIMEOUT,
     ENV_FRONTEND_HEADER_TITLE,
     ENV_FRONTEND_LINKS,
     ENV_FRONTEND_PAGE_TITLE,
     ENV_FRONTEND_POLLING_INTERVAL,
+    ENV_FRONTEND_POLLING_INTERVAL_MAX,
     ENV_FRONTEND_SIMULATE_OFFLINE,
     ENV_FRONTEND_USE_MOCK_DATA,
+    ENV_HISTORY_PATH,
     ENV_HOST,
+    ENV_HTTP,
+    ENV_KEEP_ALIVE_TIMEOUT,
+    ENV_LIMIT_CONCURRENCY,
     ENV_LOG_DATE_FORMAT,
     ENV_LOG_FILEMODE,
     ENV_LOG_FORMAT_CONSOLE,
     ENV_LOG_FORMAT_FILE,
     ENV_LOG_LEVEL,
     ENV_LOG_PATH,
+    ENV_LOOP,
+    ENV_MAX_CONCURRENCY,
+    ENV_MCSRVSTAT_INTERVAL,
+    ENV_MCSRVSTAT_URL,
     ENV_MINECRAFT_SERVER_HOST,
     ENV_MINECRAFT_SERVER_HOST_EXTERNAL,
     ENV_MINECRAFT_SERVER_PORT,
     ENV_MINECRAFT_SERVER_PORT_EXTERNAL,
+    ENV_MINECRAFT_SERVER_QUERY_INTERVAL,
+    ENV_MINECRAFT_SERVER_STATUS_INTERVAL,
     ENV_MINECRAFT_SERVER_TIMEOUT,
     ENV_PING_HOST_EXTERNAL,
     ENV_PING_PORT_EXTERNAL,
     ENV_PORT,
+    ENV_RATE_LIMIT,
+    ENV_RATE_LIMIT_BURST,
+    ENV_STATE_PATH,
+    ENV_WORKERS,
 )
-from minecraft_dashboard.models import FrontendLinkData
+from minecraft_dashboard.models import AlertRuleData, AlertSinkData, FrontendLinkData
 from minecraft_dashboard.utils import DataclassUtils
 
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, "CDumper", yaml.Dumper)
+
 
 @dataclass
 class Config(YAMLWizard, JSONWizard):
@@ -97,6 +190,56 @@ class Config(YAMLWizard, JSONWizard):
         DEFAULT_HOST,
     )
     api_port: int = DataclassUtils.field(CONF_PORT, ENV_PORT, DEFAULT_PORT)
+    api_workers: int = DataclassUtils.field(
+        CONF_WORKERS,
+        ENV_WORKERS,
+        DEFAULT_WORKERS,
+    )
+    api_loop: str = DataclassUtils.field(
+        CONF_LOOP,
+        ENV_LOOP,
+        DEFAULT_LOOP,
+    )
+    api_http: str = DataclassUtils.field(
+        CONF_HTTP,
+        ENV_HTTP,
+        DEFAULT_HTTP,
+    )
+    api_keep_alive_timeout: int = DataclassUtils.field(
+        CONF_KEEP_ALIVE_TIMEOUT,
+        ENV_KEEP_ALIVE_TIMEOUT,
+        DEFAULT_KEEP_ALIVE_TIMEOUT,
+    )
+    api_backlog: int = DataclassUtils.field(
+        CONF_BACKLOG,
+        ENV_BACKLOG,
+        DEFAULT_BACKLOG,
+    )
+    api_limit_concurrency: int | None = DataclassUtils.field(
+        CONF_LIMIT_CONCURRENCY,
+        ENV_LIMIT_CONCURRENCY,
+        DEFAULT_LIMIT_CONCURRENCY,
+    )
+    api_access_log: bool = DataclassUtils.field(
+        CONF_ACCESS_LOG,
+        ENV_ACCESS_LOG,
+        DEFAULT_ACCESS_LOG,
+    )
+    api_rate_limit: float = DataclassUtils.field(
+        CONF_RATE_LIMIT,
+        ENV_RATE_LIMIT,
+        DEFAULT_RATE_LIMIT,
+    )
+    api_rate_limit_burst: int = DataclassUtils.field(
+        CONF_RATE_LIMIT_BURST,
+        ENV_RATE_LIMIT_BURST,
+        DEFAULT_RATE_LIMIT_BURST,
+    )
+    api_max_concurrency: int = DataclassUtils.field(
+        CONF_MAX_CONCURRENCY,
+        ENV_MAX_CONCURRENCY,
+        DEFAULT_MAX_CONCURRENCY,
+    )
     log_path: str | None = DataclassUtils.field(
         CONF_LOG_PATH,
         ENV_LOG_PATH,
@@ -192,6 +335,106 @@ class Config(YAMLWizard, JSONWizard):
         ENV_FRONTEND_LINKS,
         DEFAULT_FRONTEND_LINKS,
     )
+    state_path: str | None = DataclassUtils.field(
+        CONF_STATE_PATH,
+        ENV_STATE_PATH,
+        DEFAULT_STATE_PATH,
+    )
+    circuit_failure_threshold: int = DataclassUtils.field(
+        CONF_CIRCUIT_FAILURE_THRESHOLD,
+        ENV_CIRCUIT_FAILURE_THRESHOLD,
+        DEFAULT_CIRCUIT_FAILURE_THRESHOLD,
+    )
+    circuit_backoff_base: float = DataclassUtils.field(
+        CONF_CIRCUIT_BACKOFF_BASE,
+        ENV_CIRCUIT_BACKOFF_BASE,
+        DEFAULT_CIRCUIT_BACKOFF_BASE,
+    )
+    circuit_backoff_max: float = DataclassUtils.field(
+        CONF_CIRCUIT_BACKOFF_MAX,
+        ENV_CIRCUIT_BACKOFF_MAX,
+        DEFAULT_CIRCUIT_BACKOFF_MAX,
+    )
+    minecraft_server_status_interval: float = DataclassUtils.field(
+        CONF_MINECRAFT_SERVER_STATUS_INTERVAL,
+        ENV_MINECRAFT_SERVER_STATUS_INTERVAL,
+        DEFAULT_MINECRAFT_SERVER_STATUS_INTERVAL,
+    )
+    minecraft_server_query_interval: float = DataclassUtils.field(
+        CONF_MINECRAFT_SERVER_QUERY_INTERVAL,
+        ENV_MINECRAFT_SERVER_QUERY_INTERVAL,
+        DEFAULT_MINECRAFT_SERVER_QUERY_INTERVAL,
+    )
+    mcsrvstat_interval: float = DataclassUtils.field(
+        CONF_MCSRVSTAT_INTERVAL,
+        ENV_MCSRVSTAT_INTERVAL,
+        DEFAULT_MCSRVSTAT_INTERVAL,
+    )
+    frontend_polling_interval_max: int = DataclassUtils.field(
+        CONF_FRONTEND_POLLING_INTERVAL_MAX,
+        ENV_FRONTEND_POLLING_INTERVAL_MAX,
+        DEFAULT_FRONTEND_POLLING_INTERVAL_MAX,
+    )
+    mcsrvstat_url: str = DataclassUtils.field(
+        CONF_MCSRVSTAT_URL,
+        ENV_MCSRVSTAT_URL,
+        DEFAULT_MCSRVSTAT_URL,
+    )
+    avatar_url: str = DataclassUtils.field(
+        CONF_AVATAR_URL,
+        ENV_AVATAR_URL,
+        DEFAULT_AVATAR_URL,
+    )
+    avatar_cache_path: str | None = DataclassUtils.field(
+        CONF_AVATAR_CACHE_PATH,
+        ENV_AVATAR_CACHE_PATH,
+        DEFAULT_AVATAR_CACHE_PATH,
+    )
+    avatar_cache_max_size: int = DataclassUtils.field(
+        CONF_AVATAR_CACHE_MAX_SIZE,
+        ENV_AVATAR_CACHE_MAX_SIZE,
+        DEFAULT_AVATAR_CACHE_MAX_SIZE,
+    )
+    avatar_cache_ttl: float = DataclassUtils.field(
+        CONF_AVATAR_CACHE_TTL,
+        ENV_AVATAR_CACHE_TTL,
+        DEFAULT_AVATAR_CACHE_TTL,
+    )
+    history_path: str | None = DataclassUtils.field(
+        CONF_HISTORY_PATH,
+        ENV_HISTORY_PATH,
+        DEFAULT_HISTORY_PATH,
+    )
+    federation_peers: list[str] = DataclassUtils.field(
+        CONF_FEDERATION_PEERS,
+        ENV_FEDERATION_PEERS,
+        DEFAULT_FEDERATION_PEERS,
+    )
+    federation_interval: float = DataclassUtils.field(
+        CONF_FEDERATION_INTERVAL,
+        ENV_FEDERATION_INTERVAL,
+        DEFAULT_FEDERATION_INTERVAL,
+    )
+    federation_timeout: float = DataclassUtils.field(
+        CONF_FEDERATION_TIMEOUT,
+        ENV_FEDERATION_TIMEOUT,
+        DEFAULT_FEDERATION_TIMEOUT,
+    )
+    federation_stale_after: float = DataclassUtils.field(
+        CONF_FEDERATION_STALE_AFTER,
+        ENV_FEDERATION_STALE_AFTER,
+        DEFAULT_FEDERATION_STALE_AFTER,
+    )
+    alert_rules: list[AlertRuleData] = DataclassUtils.field(
+        CONF_ALERT_RULES,
+        ENV_ALERT_RULES,
+        DEFAULT_ALERT_RULES,
+    )
+    alert_sinks: list[AlertSinkData] = DataclassUtils.field(
+        CONF_ALERT_SINKS,
+        ENV_ALERT_SINKS,
+        DEFAULT_ALERT_SINKS,
+    )
 
     @property
     def effective_minecraft_server_host_external(self) -> str:
@@ -203,13 +446,20 @@ class Config(YAMLWizard, JSONWizard):
         """Get the effective external port, falling back to internal port if not set."""
         return self.minecraft_server_port_external or self.minecraft_server_port
 
-    def save(self) -> None:
-        """Write the configuration to a file."""
+    def save(self, current_content: str | None = None) -> None:
+        """Write the configuration to a file, skipping the write if nothing changed."""
+        content = self.to_yaml(Dumper=YAML_DUMPER)
+
+        if current_content is None and self.config_file_path.exists():
+            current_content = self.config_file_path.read_text(encoding="utf-8")
+
+        if content == current_content:
+            return
 
         self.config_file_path.parent.mkdir(parents=True, exist_ok=True)
 
         with self.config_file_path.open("w", encoding="utf-8") as config_file:
-            config_file.write(self.to_yaml())
+            config_file.write(content)
 
     @classmethod
     def init(cls) -> Config:
@@ -227,11 +477,11 @@ class Config(YAMLWizard, JSONWizard):
         if not config.config_file_path.exists():
             return cls.init()
 
-        with config.config_file_path.open("r", encoding="utf-8") as config_file:
-            config_dict: dict[str, Any] = yaml.safe_load(config_file)
+        content = config.config_file_path.read_text(encoding="utf-8")
+        config_dict: dict[str, Any] = yaml.load(content, Loader=YAML_LOADER)
 
         config = cls.from_dict(config_dict)
         DataclassUtils.check_config_env_mismatch(config)
         if save_after_load:
-            config.save()
+            config.save(content)
         return config
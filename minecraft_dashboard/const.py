@@ -1,4 +1,4 @@
-from minecraft_dashboard.models import FrontendLinkData
+from minecraft_dashboard.models import AlertRuleData, AlertSinkData, FrontendLinkData
 
 ENV_CONFIG_FILE_PATH = "MINECRAFT_DASHBOARD_CONFIG_FILE_PATH"
 ENV_HOST = "MINECRAFT_DASHBOARD_HOST"
@@ -29,6 +29,41 @@ ENV_FRONTEND_SIMULATE_OFFLINE = "MINECRAFT_DASHBOARD_FRONTEND_SIMULATE_OFFLINE"
 ENV_FRONTEND_PAGE_TITLE = "MINECRAFT_DASHBOARD_FRONTEND_PAGE_TITLE"
 ENV_FRONTEND_HEADER_TITLE = "MINECRAFT_DASHBOARD_FRONTEND_HEADER_TITLE"
 ENV_FRONTEND_LINKS = "MINECRAFT_DASHBOARD_FRONTEND_LINKS"
+ENV_STATE_PATH = "MINECRAFT_DASHBOARD_STATE_PATH"
+ENV_CIRCUIT_FAILURE_THRESHOLD = "MINECRAFT_DASHBOARD_CIRCUIT_FAILURE_THRESHOLD"
+ENV_CIRCUIT_BACKOFF_BASE = "MINECRAFT_DASHBOARD_CIRCUIT_BACKOFF_BASE"
+ENV_CIRCUIT_BACKOFF_MAX = "MINECRAFT_DASHBOARD_CIRCUIT_BACKOFF_MAX"
+ENV_MINECRAFT_SERVER_STATUS_INTERVAL = (
+    "MINECRAFT_DASHBOARD_MINECRAFT_SERVER_STATUS_INTERVAL"
+)
+ENV_MINECRAFT_SERVER_QUERY_INTERVAL = (
+    "MINECRAFT_DASHBOARD_MINECRAFT_SERVER_QUERY_INTERVAL"
+)
+ENV_MCSRVSTAT_INTERVAL = "MINECRAFT_DASHBOARD_MCSRVSTAT_INTERVAL"
+ENV_MCSRVSTAT_URL = "MINECRAFT_DASHBOARD_MCSRVSTAT_URL"
+ENV_WORKERS = "MINECRAFT_DASHBOARD_WORKERS"
+ENV_AVATAR_URL = "MINECRAFT_DASHBOARD_AVATAR_URL"
+ENV_AVATAR_CACHE_PATH = "MINECRAFT_DASHBOARD_AVATAR_CACHE_PATH"
+ENV_AVATAR_CACHE_MAX_SIZE = "MINECRAFT_DASHBOARD_AVATAR_CACHE_MAX_SIZE"
+ENV_AVATAR_CACHE_TTL = "MINECRAFT_DASHBOARD_AVATAR_CACHE_TTL"
+ENV_HISTORY_PATH = "MINECRAFT_DASHBOARD_HISTORY_PATH"
+ENV_RATE_LIMIT = "MINECRAFT_DASHBOARD_RATE_LIMIT"
+ENV_RATE_LIMIT_BURST = "MINECRAFT_DASHBOARD_RATE_LIMIT_BURST"
+ENV_MAX_CONCURRENCY = "MINECRAFT_DASHBOARD_MAX_CONCURRENCY"
+ENV_FEDERATION_PEERS = "MINECRAFT_DASHBOARD_FEDERATION_PEERS"
+ENV_FEDERATION_INTERVAL = "MINECRAFT_DASHBOARD_FEDERATION_INTERVAL"
+ENV_FEDERATION_TIMEOUT = "MINECRAFT_DASHBOARD_FEDERATION_TIMEOUT"
+ENV_FEDERATION_STALE_AFTER = "MINECRAFT_DASHBOARD_FEDERATION_STALE_AFTER"
+ENV_ALERT_RULES = "MINECRAFT_DASHBOARD_ALERT_RULES"
+ENV_ALERT_SINKS = "MINECRAFT_DASHBOARD_ALERT_SINKS"
+ENV_LOOP = "MINECRAFT_DASHBOARD_LOOP"
+ENV_HTTP = "MINECRAFT_DASHBOARD_HTTP"
+ENV_KEEP_ALIVE_TIMEOUT = "MINECRAFT_DASHBOARD_KEEP_ALIVE_TIMEOUT"
+ENV_BACKLOG = "MINECRAFT_DASHBOARD_BACKLOG"
+ENV_LIMIT_CONCURRENCY = "MINECRAFT_DASHBOARD_LIMIT_CONCURRENCY"
+ENV_ACCESS_LOG = "MINECRAFT_DASHBOARD_ACCESS_LOG"
+ENV_SHARED_SNAPSHOT = "MINECRAFT_DASHBOARD_SHARED_SNAPSHOT"
+ENV_FRONTEND_POLLING_INTERVAL_MAX = "MINECRAFT_DASHBOARD_FRONTEND_POLLING_INTERVAL_MAX"
 
 CONF_CONFIG_FILE_PATH = "config_file_path"
 CONF_HOST = "api_host"
@@ -53,6 +88,36 @@ CONF_FRONTEND_SIMULATE_OFFLINE = "frontend_simulate_offline"
 CONF_FRONTEND_PAGE_TITLE = "frontend_page_title"
 CONF_FRONTEND_HEADER_TITLE = "frontend_header_title"
 CONF_FRONTEND_LINKS = "frontend_links"
+CONF_STATE_PATH = "state_path"
+CONF_CIRCUIT_FAILURE_THRESHOLD = "circuit_failure_threshold"
+CONF_CIRCUIT_BACKOFF_BASE = "circuit_backoff_base"
+CONF_CIRCUIT_BACKOFF_MAX = "circuit_backoff_max"
+CONF_MINECRAFT_SERVER_STATUS_INTERVAL = "minecraft_server_status_interval"
+CONF_MINECRAFT_SERVER_QUERY_INTERVAL = "minecraft_server_query_interval"
+CONF_MCSRVSTAT_INTERVAL = "mcsrvstat_interval"
+CONF_MCSRVSTAT_URL = "mcsrvstat_url"
+CONF_WORKERS = "api_workers"
+CONF_AVATAR_URL = "avatar_url"
+CONF_AVATAR_CACHE_PATH = "avatar_cache_path"
+CONF_AVATAR_CACHE_MAX_SIZE = "avatar_cache_max_size"
+CONF_AVATAR_CACHE_TTL = "avatar_cache_ttl"
+CONF_HISTORY_PATH = "history_path"
+CONF_RATE_LIMIT = "api_rate_limit"
+CONF_RATE_LIMIT_BURST = "api_rate_limit_burst"
+CONF_MAX_CONCURRENCY = "api_max_concurrency"
+CONF_FEDERATION_PEERS = "federation_peers"
+CONF_FEDERATION_INTERVAL = "federation_interval"
+CONF_FEDERATION_TIMEOUT = "federation_timeout"
+CONF_FEDERATION_STALE_AFTER = "federation_stale_after"
+CONF_ALERT_RULES = "alert_rules"
+CONF_ALERT_SINKS = "alert_sinks"
+CONF_LOOP = "api_loop"
+CONF_HTTP = "api_http"
+CONF_KEEP_ALIVE_TIMEOUT = "api_keep_alive_timeout"
+CONF_BACKLOG = "api_backlog"
+CONF_LIMIT_CONCURRENCY = "api_limit_concurrency"
+CONF_ACCESS_LOG = "api_access_log"
+CONF_FRONTEND_POLLING_INTERVAL_MAX = "frontend_polling_interval_max"
 
 DEFAULT_CONFIG_FILE_PATH = "config.yaml"
 DEFAULT_HOST = "0.0.0.0"
@@ -77,3 +142,67 @@ DEFAULT_FRONTEND_SIMULATE_OFFLINE = False
 DEFAULT_FRONTEND_PAGE_TITLE = "Minecraft Server Dashboard"
 DEFAULT_FRONTEND_HEADER_TITLE = "Minecraft Server Dashboard"
 DEFAULT_FRONTEND_LINKS: list[FrontendLinkData] = []
+DEFAULT_STATE_PATH = "minecraft_dashboard.state"
+DEFAULT_CIRCUIT_FAILURE_THRESHOLD = 2
+DEFAULT_CIRCUIT_BACKOFF_BASE = 5.0
+DEFAULT_CIRCUIT_BACKOFF_MAX = 60.0
+DEFAULT_MINECRAFT_SERVER_STATUS_INTERVAL = 5.0
+DEFAULT_MINECRAFT_SERVER_QUERY_INTERVAL = 300.0
+DEFAULT_MCSRVSTAT_INTERVAL = 60.0
+DEFAULT_MCSRVSTAT_URL = "https://api.mcsrvstat.us"
+DEFAULT_WORKERS = 1
+DEFAULT_AVATAR_URL = "https://crafthead.net/avatar/{uuid}/32"
+DEFAULT_AVATAR_CACHE_PATH = "avatar_cache"
+DEFAULT_AVATAR_CACHE_MAX_SIZE = 50 * 1024 * 1024
+DEFAULT_AVATAR_CACHE_TTL = 86400.0
+DEFAULT_HISTORY_PATH = "history"
+DEFAULT_RATE_LIMIT = 10.0
+DEFAULT_RATE_LIMIT_BURST = 100
+DEFAULT_MAX_CONCURRENCY = 256
+DEFAULT_FEDERATION_PEERS: list[str] = []
+DEFAULT_FEDERATION_INTERVAL = 5.0
+DEFAULT_FEDERATION_TIMEOUT = 2.0
+DEFAULT_FEDERATION_STALE_AFTER = 30.0
+DEFAULT_ALERT_RULES: list[AlertRuleData] = []
+DEFAULT_ALERT_SINKS: list[AlertSinkData] = []
+DEFAULT_LOOP = "auto"
+DEFAULT_HTTP = "auto"
+DEFAULT_KEEP_ALIVE_TIMEOUT = 5
+DEFAULT_BACKLOG = 2048
+DEFAULT_LIMIT_CONCURRENCY = None
+DEFAULT_ACCESS_LOG = False
+DEFAULT_FRONTEND_POLLING_INTERVAL_MAX = 60000
+
+DNS_CACHE_TTL = 300
+MCSRVSTAT_CACHE_TTL = 60
+POLLING_INTERVAL_STABLE_STEP = 60
+SHARED_SNAPSHOT_SIZE = 1024 * 1024
+SHARED_SNAPSHOT_SYNC_INTERVAL = 0.25
+FEDERATION_SNAPSHOT_SUFFIX = "_federation"
+LOG_QUEUE_SIZE = 10000
+LOG_RATE_LIMIT_WINDOW = 60
+MEMO_CACHE_SIZE = 32
+AVATAR_MEMORY_CACHE_SIZE = 256
+HISTORY_EXPORT_CHUNK_SIZE = 1000
+STATUS_VERSION_HEADER = "X-Status-Version"
+STATUS_WAIT_TIMEOUT = 30.0
+STATUS_WAIT_TIMEOUT_MAX = 60.0
+RATE_LIMIT_MAX_CLIENTS = 10000
+QUERY_CHALLENGE_TTL = 25
+HYPERLOGLOG_PRECISION = 12
+UNIQUE_PLAYERS_HOURS = 48
+UNIQUE_PLAYERS_DAYS = 62
+UNIQUE_PLAYERS_MONTHS = 24
+UNIQUE_PLAYERS_SAVE_INTERVAL = 60
+HEDGE_BUDGET_RATIO = 0.05
+HEDGE_BUDGET_BURST = 2.0
+HEDGE_LATENCY_SAMPLES = 200
+HEDGE_MIN_SAMPLES = 20
+HEDGE_PERCENTILE = 0.95
+ALERT_QUEUE_SIZE = 1000
+ALERT_WINDOW_SLOTS = 10
+STATUS_ARCHIVE_BLOCK_SIZE = 120
+STATUS_ARCHIVE_BLOCK_AGE = 300
+STATUS_ARCHIVE_CACHE_SIZE = 16
+STATUS_ARCHIVE_DAYS = 31
+STATUS_TIMESTAMP_HEADER = "X-Status-Timestamp"
@@ -0,0 +1,218 @@
+"""Peer dashboard federation module for minecraft-dashboard."""
+
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING
+
+from pydantic import TypeAdapter
+
+from minecraft_dashboard.config import Config
+from minecraft_dashboard.models import FederationData, FederationPeerData, Status
+from minecraft_dashboard.shared import SharedSnapshot
+from minecraft_dashboard.snapshot import StatusSnapshot
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = logging.getLogger(__name__)
+
+PEERS_ADAPTER = TypeAdapter(list[FederationPeerData])
+
+
+class FederationPeer:
+    """Last known status of a peer dashboard and the tag to revalidate it."""
+
+    def __init__(self, url: str) -> None:
+        """Initialize the peer."""
+        self.url = url.rstrip("/")
+        self.status: StatusSnapshot | None = None
+        self.etag: str | None = None
+        self.updated_at: float | None = None
+        self.error: str | None = None
+
+    def to_data(self, stale_after: float) -> FederationPeerData:
+        """Convert the peer state to its API model."""
+        stale = self.updated_at is None or time.time() - self.updated_at > stale_after
+        return FederationPeerData(
+            url=self.url,
+            status=self.status.to_model() if self.status else None,
+            updated_at=self.updated_at,
+            stale=stale,
+            error=self.error,
+        )
+
+
+class FederationAggregator:
+    """Pulls the status of peer dashboards in the background and merges them.
+
+    All peers share one keep-alive connection pool and are revalidated with
+    their last ETag, so an unchanged peer costs a 304 without a body. Every
+    pull is bounded by its own timeout and the merged view is served from
+    memory, a slow or unreachable peer is only flagged stale.
+
+    With several workers only the one elected through the shared snapshot
+    pulls the peers, it publishes their state there for the others.
+    """
+
+    def __init__(
+        self, config: Config, shared_snapshot: SharedSnapshot | None = None
+    ) -> None:
+        """Initialize the federation aggregator."""
+        self.config = config
+        self.shared_snapshot = shared_snapshot
+        self.is_leader = shared_snapshot is None
+        self.version = 0
+        self.peers = {url: FederationPeer(url) for url in config.federation_peers}
+        self.client: httpx.AsyncClient | None = None
+        self.is_running = False
+        self.pull_task: asyncio.Task | None = None
+        self.not_modified = 0
+
+    def reload_configuration(self, new_configuration: Config) -> None:
+        """Reload the configuration, keeping the state of remaining peers."""
+        self.config = new_configuration
+        self.peers = {
+            url: self.peers.get(url) or FederationPeer(url)
+            for url in new_configuration.federation_peers
+        }
+
+    async def start(self) -> None:
+        """Start pulling peers in the background."""
+        self.is_running = True
+        self.pull_task = asyncio.create_task(self._pull_loop())
+
+    async def stop(self) -> None:
+        """Stop pulling peers and close the connection pool."""
+        self.is_running = False
+        if self.pull_task:
+            self.pull_task.cancel()
+            try:
+                await self.pull_task
+            except asyncio.CancelledError:
+                pass
+        if self.client:
+            await self.client.aclose()
+            self.client = None
+
+    async def _pull_loop(self) -> None:
+        """Pull all peers at the configured interval."""
+        while self.is_running:
+            if not self.is_leader:
+                if not self.shared_snapshot.try_acquire_leadership():
+                    await asyncio.sleep(self.config.federation_interval)
+                    continue
+
+                logger.info("Elected as the federation process")
+                self.is_leader = True
+
+            if self.peers:
+                await self.refresh()
+                self._publish()
+            await asyncio.sleep(self.config.federation_interval)
+
+    async def refresh(self) -> None:
+        """Pull all peers concurrently."""
+        await asyncio.gather(*(self._pull(peer) for peer in self.peers.values()))
+
+    async def _pull(self, peer: FederationPeer) -> None:
+        """Pull the status of a peer unless it did not change."""
+        import httpx
+
+        if self.client is None:
+            # Keep connections open across pulls instead of reconnecting.
+            keepalive_expiry = (
+                self.config.federation_interval + self.config.federation_timeout
+            )
+            self.client = httpx.AsyncClient(
+                limits=httpx.Limits(keepalive_expiry=keepalive_expiry)
+            )
+
+        headers = {"If-None-Match": peer.etag} if peer.etag else {}
+
+        try:
+            async with asyncio.timeout(self.config.federation_timeout):
+                response = await self.client.get(
+                    f"{peer.url}/api/status", headers=headers
+                )
+                if response.status_code == 304:
+                    self.not_modified += 1
+                else:
+                    response.raise_for_status()
+                    peer.status = StatusSnapshot.from_model(
+                        Status.model_validate_json(response.content)
+                    )
+                    peer.etag = response.headers.get("etag")
+        except Exception as exception:
+            if peer.error is None:
+                logger.warning(f"Failed to pull peer {peer.url}: {exception!r}")
+            peer.error = repr(exception)
+            return
+
+        peer.updated_at = time.time()
+        peer.error = None
+
+    def _publish(self) -> None:
+        """Share the state of the peers with the other workers."""
+        if not self.shared_snapshot:
+            return
+
+        peers = [
+            peer.to_data(self.config.federation_stale_after)
+            for peer in self.peers.values()
+        ]
+        try:
+            self.version = self.shared_snapshot.write(PEERS_ADAPTER.dump_json(peers))
+        except ValueError as exception:
+            logger.warning(f"Failed to share the federation state: {exception}")
+
+    def _follow(self) -> None:
+        """Pick up the state of the peers the elected worker published."""
+        if self.is_leader or not self.shared_snapshot:
+            return
+
+        snapshot = self.shared_snapshot.read(self.version)
+        if not snapshot:
+            return
+
+        self.version, payload = snapshot
+        peers = {peer.url: peer for peer in self.peers.values()}
+        for peer_data in PEERS_ADAPTER.validate_json(payload):
+            peer = peers.get(peer_data.url)
+            if peer is None:
+                continue
+            peer.status = (
+                StatusSnapshot.from_model(peer_data.status)
+                if peer_data.status
+                else None
+            )
+            peer.updated_at = peer_data.updated_at
+            peer.error = peer_data.error
+
+    def get_data(self, local_status: Status) -> FederationData:
+        """Merge the local status with the last status of every peer.
+
+        The totals only count peers that are not stale.
+        """
+        self._follow()
+        peers = [
+            peer.to_data(self.config.federation_stale_after)
+            for peer in self.peers.values()
+        ]
+        statuses = [local_status] + [
+            peer.status for peer in peers if peer.status and not peer.stale
+        ]
+        players = [
+            status.data.players
+            for status in statuses
+            if status.data and status.data.players
+        ]
+
+        return FederationData(
+            local=local_status,
+            peers=peers,
+            servers=len(statuses),
+            servers_online=sum(1 for status in statuses if status.data),
+            players_online=sum(player.online for player in players),
+            players_max=sum(player.max for player in players),
+        )
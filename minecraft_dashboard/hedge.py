@@ -0,0 +1,118 @@
+"""Hedged request module for minecraft-dashboard."""
+
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+
+from minecraft_dashboard.const import (
+    HEDGE_BUDGET_BURST,
+    HEDGE_BUDGET_RATIO,
+    HEDGE_LATENCY_SAMPLES,
+    HEDGE_MIN_SAMPLES,
+    HEDGE_PERCENTILE,
+)
+from minecraft_dashboard.models import HedgeData
+
+logger = logging.getLogger(__name__)
+
+
+class HedgedRequest[T]:
+    """Sends a second request when the first one is slower than usual.
+
+    The hedge is fired once the first request has been running for the
+    observed p95 latency, whichever succeeds first wins and the other one is
+    cancelled. Every request earns a fraction of a hedge token, so hedges
+    stay within a small share of the traffic even while the upstream is slow
+    across the board. Results of None count as failures.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        budget_ratio: float = HEDGE_BUDGET_RATIO,
+        budget_burst: float = HEDGE_BUDGET_BURST,
+    ) -> None:
+        """Initialize the hedged request."""
+        self.name = name
+        self.budget_ratio = budget_ratio
+        self.budget_burst = budget_burst
+        self.latencies: deque[float] = deque(maxlen=HEDGE_LATENCY_SAMPLES)
+        self.tokens = 0.0
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    @property
+    def delay(self) -> float | None:
+        """Get the delay before hedging, None until enough latencies are known."""
+        if len(self.latencies) < HEDGE_MIN_SAMPLES:
+            return None
+        latencies = sorted(self.latencies)
+        index = math.ceil(HEDGE_PERCENTILE * len(latencies)) - 1
+        return latencies[index]
+
+    async def run(self, request: Callable[[], Awaitable[T | None]]) -> T | None:
+        """Run the request, hedging it if it takes longer than the p95 latency."""
+        self.requests += 1
+        self.tokens = min(self.tokens + self.budget_ratio, self.budget_burst)
+
+        delay = self.delay
+        primary = self._start(request)
+        pending = {primary}
+
+        try:
+            done, _ = await asyncio.wait(pending, timeout=delay)
+            if not done and self.tokens >= 1:
+                self.tokens -= 1
+                self.hedges += 1
+                logger.debug(f"Hedging {self.name} request after {delay * 1000:.0f} ms")
+                pending.add(self._start(request))
+
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    result, latency = task.result()
+                    if result is None:
+                        continue
+                    self.latencies.append(latency)
+                    if task is not primary:
+                        self.hedge_wins += 1
+                    return result
+            return None
+        finally:
+            for task in pending:
+                task.cancel()
+
+    @staticmethod
+    def _start(
+        request: Callable[[], Awaitable[T | None]],
+    ) -> asyncio.Task[tuple[T | None, float]]:
+        """Start a request in a task that also measures its latency."""
+
+        async def measure() -> tuple[T | None, float]:
+            start = time.perf_counter()
+            try:
+                result = await request()
+            except Exception as exception:
+                logger.debug(f"Hedged request failed: {exception}")
+                result = None
+            return result, time.perf_counter() - start
+
+        return asyncio.create_task(measure())
+
+    def to_data(self) -> HedgeData:
+        """Convert the hedging statistics to their API model."""
+        delay = self.delay
+        return HedgeData(
+            name=self.name,
+            requests=self.requests,
+            hedges=self.hedges,
+            hedge_wins=self.hedge_wins,
+            hedge_rate=self.hedges / self.requests if self.requests else 0.0,
+            delay=delay * 1000 if delay is not None else None,
+        )
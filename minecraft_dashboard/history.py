@@ -0,0 +1,199 @@
+"""Status history store module for minecraft-dashboard."""
+
+import asyncio
+import csv
+import io
+import json
+import logging
+import time
+import zlib
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import IO, Any
+
+from minecraft_dashboard.archive import StatusArchive
+from minecraft_dashboard.const import HISTORY_EXPORT_CHUNK_SIZE
+from minecraft_dashboard.models import (
+    HistoryEntryData,
+    HistoryExportFormat,
+    Status,
+    WireFormat,
+)
+from minecraft_dashboard.stats import UniquePlayersStore
+from minecraft_dashboard.utils import WireUtils
+
+logger = logging.getLogger(__name__)
+
+HISTORY_FIELDS = list(HistoryEntryData.model_fields)
+
+
+class HistoryStore:
+    """Append-only status history, one NDJSON file per UTC day.
+
+    Exports read the files in fixed-size chunks and only open the days that
+    overlap the requested time range, so memory stays constant. The player
+    samples additionally feed the unique player sketches and every full
+    status is kept in the snapshot archive.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the history store."""
+        self.path = path
+        self.unique_players = UniquePlayersStore(path / "unique_players")
+        self.snapshots = StatusArchive(path / "snapshots")
+
+    @staticmethod
+    def get_day(timestamp: float) -> str:
+        """Get the UTC day a timestamp belongs to."""
+        return datetime.fromtimestamp(timestamp, UTC).date().isoformat()
+
+    async def append(self, status: Status, timestamp: float | None = None) -> None:
+        """Record a probe result."""
+        timestamp = timestamp or time.time()
+        data = status.data
+        data_external = status.data_external
+        entry = HistoryEntryData(
+            timestamp=timestamp,
+            online=data is not None,
+            players_online=data.players.online if data and data.players else None,
+            players_max=data.players.max if data and data.players else None,
+            latency=data.latency if data else None,
+            version=data.version if data else None,
+            online_external=data_external is not None,
+            latency_external=data_external.latency if data_external else None,
+        )
+        await asyncio.to_thread(self._write, entry)
+        await self.snapshots.append(status, timestamp)
+
+        if data and data.players and data.players.player_list:
+            await self.unique_players.add(
+                (player.uuid for player in data.players.player_list), timestamp
+            )
+
+    async def flush(self) -> None:
+        """Persist the state kept in memory."""
+        await self.unique_players.save()
+        await self.snapshots.flush()
+
+    def _write(self, entry: HistoryEntryData) -> None:
+        """Append an entry to the file of its day."""
+        self.path.mkdir(parents=True, exist_ok=True)
+        day_path = self.path / f"{self.get_day(entry.timestamp)}.ndjson"
+        with day_path.open("a", encoding="utf-8") as day_file:
+            day_file.write(entry.model_dump_json() + "\n")
+
+    def get_day_paths(self, start: float | None, end: float | None) -> list[Path]:
+        """Get the files of all days overlapping the time range, oldest first."""
+        if not self.path.is_dir():
+            return []
+
+        first_day = self.get_day(start) if start is not None else None
+        last_day = self.get_day(end) if end is not None else None
+
+        return [
+            day_path
+            for day_path in sorted(self.path.glob("*.ndjson"))
+            if (first_day is None or day_path.stem >= first_day)
+            and (last_day is None or day_path.stem <= last_day)
+        ]
+
+    async def read(
+        self, start: float | None = None, end: float | None = None
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Read the entries within the time range in chunks."""
+        for day_path in self.get_day_paths(start, end):
+            day_file = await asyncio.to_thread(day_path.open, "r", encoding="utf-8")
+            try:
+                while lines := await asyncio.to_thread(self._read_lines, day_file):
+                    entries = []
+                    for line in lines:
+                        try:
+                            entry = json.loads(line)
+                        except ValueError:
+                            # A partially written last line after a crash.
+                            continue
+                        if start is not None and entry["timestamp"] < start:
+                            continue
+                        if end is not None and entry["timestamp"] > end:
+                            continue
+                        entries.append(entry)
+                    if entries:
+                        yield entries
+            finally:
+                day_file.close()
+
+    @staticmethod
+    def _read_lines(day_file: IO[str]) -> list[str]:
+        """Read the next chunk of lines from a day file."""
+        lines = []
+        for line in day_file:
+            lines.append(line)
+            if len(lines) >= HISTORY_EXPORT_CHUNK_SIZE:
+                break
+        return lines
+
+    async def export(
+        self,
+        export_format: HistoryExportFormat,
+        fields: list[str],
+        start: float | None = None,
+        end: float | None = None,
+        compress: bool = False,
+    ) -> AsyncIterator[bytes]:
+        """Stream the entries within the time range as text or binary records."""
+        compressor = zlib.compressobj(wbits=31) if compress else None
+
+        def encode(text: str) -> bytes:
+            data = text.encode("utf-8")
+            return compressor.compress(data) if compressor else data
+
+        if export_format in (HistoryExportFormat.MSGPACK, HistoryExportFormat.CBOR):
+            wire_format = (
+                WireFormat.MSGPACK
+                if export_format == HistoryExportFormat.MSGPACK
+                else WireFormat.CBOR
+            )
+            # A stream of concatenated records, a CBOR sequence for CBOR.
+            async for entries in self.read(start, end):
+                chunk = b"".join(
+                    WireUtils.encode(
+                        {field: entry.get(field) for field in fields}, wire_format
+                    )
+                    for entry in entries
+                )
+                yield compressor.compress(chunk) if compressor else chunk
+            if compressor:
+                yield compressor.flush()
+            return
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+
+        if export_format == HistoryExportFormat.CSV:
+            writer.writerow(fields)
+            yield encode(buffer.getvalue())
+
+        async for entries in self.read(start, end):
+            buffer.seek(0)
+            buffer.truncate()
+
+            if export_format == HistoryExportFormat.CSV:
+                writer.writerows(
+                    [entry.get(field) for field in fields] for entry in entries
+                )
+            else:
+                for entry in entries:
+                    buffer.write(
+                        json.dumps(
+                            {field: entry.get(field) for field in fields},
+                            separators=(",", ":"),
+                        )
+                    )
+                    buffer.write("\n")
+
+            if chunk := encode(buffer.getvalue()):
+                yield chunk
+
+        if compressor:
+            yield compressor.flush()
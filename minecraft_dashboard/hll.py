@@ -0,0 +1,73 @@
+"""HyperLogLog cardinality estimator module for minecraft-dashboard."""
+
+import hashlib
+import math
+import zlib
+
+from minecraft_dashboard.const import HYPERLOGLOG_PRECISION
+
+
+class HyperLogLog:
+    """Estimates the number of distinct values in a fixed amount of memory.
+
+    With the default precision of 12 a sketch takes 4 KiB and has a standard
+    error of about 1.6%. Sketches of the same precision merge losslessly.
+    """
+
+    def __init__(
+        self, precision: int = HYPERLOGLOG_PRECISION, registers: bytes | None = None
+    ) -> None:
+        """Initialize an empty sketch or restore one from its registers."""
+        self.precision = precision
+        self.size = 1 << precision
+        self.registers = bytearray(registers or self.size)
+        if len(self.registers) != self.size:
+            raise ValueError(f"Expected {self.size} registers")
+
+    def add(self, value: str) -> bool:
+        """Add a value, returning whether the sketch changed."""
+        hashed = int.from_bytes(
+            hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest()
+        )
+        remaining_bits = 64 - self.precision
+        index = hashed >> remaining_bits
+        rest = hashed & ((1 << remaining_bits) - 1)
+        rank = remaining_bits - rest.bit_length() + 1
+
+        if rank <= self.registers[index]:
+            return False
+        self.registers[index] = rank
+        return True
+
+    def merge(self, other: "HyperLogLog") -> None:
+        """Merge another sketch into this one."""
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge sketches of different precision")
+        self.registers = bytearray(map(max, self.registers, other.registers))
+
+    def count(self) -> int:
+        """Estimate the number of distinct values added."""
+        alpha = 0.7213 / (1 + 1.079 / self.size)
+        estimate = (
+            alpha
+            * self.size**2
+            / math.fsum(2.0**-register for register in self.registers)
+        )
+
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * self.size and zeros:
+            # Linear counting is more accurate for small cardinalities.
+            estimate = self.size * math.log(self.size / zeros)
+
+        return round(estimate)
+
+    def to_bytes(self) -> bytes:
+        """Serialize the sketch, mostly empty registers compress well."""
+        return zlib.compress(bytes(self.registers))
+
+    @classmethod
+    def from_bytes(
+        cls, data: bytes, precision: int = HYPERLOGLOG_PRECISION
+    ) -> "HyperLogLog":
+        """Restore a sketch serialized with to_bytes."""
+        return cls(precision, zlib.decompress(data))
@@ -0,0 +1,98 @@
+"""API rate limiting and load shedding module for minecraft-dashboard."""
+
+import logging
+import math
+import time
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from minecraft_dashboard.cache import LruCache
+from minecraft_dashboard.config import Config
+from minecraft_dashboard.const import RATE_LIMIT_MAX_CLIENTS
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """ASGI wrapper applying a token bucket per client and a concurrency cap.
+
+    Buckets live in an LRU bounded to a fixed number of clients, a client
+    evicted from it simply starts over with a full bucket. Long-poll
+    requests only count against the rate limit, they spend their time
+    parked and would otherwise exhaust the concurrency cap.
+    """
+
+    def __init__(self, app: ASGIApp, config: Config) -> None:
+        """Initialize the rate limiter."""
+        self.app = app
+        self.config = config
+        self.buckets: LruCache[str, tuple[float, float]] = LruCache(
+            RATE_LIMIT_MAX_CLIENTS
+        )
+        self.active = 0
+        self.rate_limited = 0
+        self.shed = 0
+
+    def reload_configuration(self, new_configuration: Config) -> None:
+        """Reload the configuration."""
+        self.config = new_configuration
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        client = scope.get("client")
+        retry_after = self.take(client[0] if client else "")
+        if retry_after:
+            self.rate_limited += 1
+            await self._reject(scope, receive, send, 429, retry_after)
+            return
+
+        max_concurrency = self.config.api_max_concurrency
+        if not max_concurrency or scope["path"].endswith("/status/wait"):
+            await self.app(scope, receive, send)
+            return
+
+        if self.active >= max_concurrency:
+            self.shed += 1
+            await self._reject(scope, receive, send, 503, 1.0)
+            return
+
+        self.active += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.active -= 1
+
+    def take(self, client: str) -> float:
+        """Take a token for a request, returning the seconds to wait if empty."""
+        rate = self.config.api_rate_limit
+        burst = self.config.api_rate_limit_burst
+        if rate <= 0 or burst <= 0:
+            return 0.0
+
+        now = time.monotonic()
+        bucket = self.buckets.get(client)
+        tokens = burst if bucket is None else bucket[0] + (now - bucket[1]) * rate
+        tokens = min(tokens, burst)
+
+        if tokens < 1:
+            self.buckets.put(client, (tokens, now))
+            return (1 - tokens) / rate
+
+        self.buckets.put(client, (tokens - 1, now))
+        return 0.0
+
+    @staticmethod
+    async def _reject(
+        scope: Scope, receive: Receive, send: Send, status_code: int, retry_after: float
+    ) -> None:
+        """Answer with an error asking the client to retry later."""
+        response = JSONResponse(
+            {"detail": "Too many requests" if status_code == 429 else "Overloaded"},
+            status_code=status_code,
+            headers={"Retry-After": str(math.ceil(retry_after))},
+        )
+        await response(scope, receive, send)
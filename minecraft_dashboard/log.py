@@ -0,0 +1,66 @@
+"""Non-blocking logging pipeline module for minecraft-dashboard."""
+
+import logging
+import queue
+import time
+from logging.handlers import QueueHandler
+
+
+class DroppingQueueHandler(QueueHandler):
+    """Hands records to a bounded queue and drops them when it is full."""
+
+    def __init__(self, maxsize: int) -> None:
+        """Initialize the queue handler."""
+        super().__init__(queue.Queue(maxsize))
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Merge the arguments but leave formatting to the listener thread."""
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Put the record into the queue without ever blocking the caller."""
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class RateLimitFilter(logging.Filter):
+    """Lets each distinct message through at most once per window.
+
+    The first record passing after a window with suppressed repeats reports
+    how many identical messages were swallowed.
+    """
+
+    def __init__(self, window: float, max_keys: int = 1024) -> None:
+        """Initialize the rate limit filter."""
+        super().__init__()
+        self.window = window
+        self.max_keys = max_keys
+        self.windows: dict[tuple[str, int, str], tuple[float, int]] = {}
+        self.suppressed = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Return whether the record should be logged."""
+        message = record.getMessage()
+        key = (record.name, record.levelno, message)
+        now = time.monotonic()
+
+        window = self.windows.get(key)
+        if window and now - window[0] < self.window:
+            self.windows[key] = (window[0], window[1] + 1)
+            self.suppressed += 1
+            return False
+
+        if len(self.windows) >= self.max_keys:
+            self.windows.clear()
+        self.windows[key] = (now, 0)
+
+        if window and window[1]:
+            record.msg = f"{message} (suppressed {window[1]} identical messages)"
+            record.args = None
+
+        return True
@@ -1,5 +1,7 @@
 """Models module for minecraft-dashboard."""
 
+from enum import StrEnum
+
 from dataclass_wizard import JSONWizard, YAMLWizard
 from pydantic import BaseModel
 from pydantic.dataclasses import dataclass
@@ -120,6 +122,51 @@ class FrontendLinkData(YAMLWizard, JSONWizard):
     icon: str | None = None
 
 
+class AlertRuleType(StrEnum):
+    """Alert rule condition."""
+
+    OFFLINE = "offline"
+    LATENCY = "latency"
+    PLAYERS_DROP = "players_drop"
+
+
+class AlertSinkType(StrEnum):
+    """Alert notification channel."""
+
+    WEBHOOK = "webhook"
+    FILE = "file"
+    STDOUT = "stdout"
+
+
+@dataclass
+class AlertRuleData(YAMLWizard, JSONWizard):
+    """Alert rule configuration data model.
+
+    `offline` fires after `checks` consecutive offline probes, `latency` when
+    the `percentile` of the latency over `window` seconds exceeds `threshold`
+    milliseconds and `players_drop` when the player count fell by more than
+    the `threshold` fraction of its peak within `window` seconds.
+    """
+
+    name: str
+    type: str
+    threshold: float = 0.0
+    checks: int = 3
+    window: float = 300.0
+    percentile: float = 0.95
+
+
+@dataclass
+class AlertSinkData(YAMLWizard, JSONWizard):
+    """Alert sink configuration data model.
+
+    The target is the URL of a webhook or the path of a file.
+    """
+
+    type: str
+    target: str | None = None
+
+
 class ConfigData(BaseModel):
     """Configuration data model."""
 
@@ -158,8 +205,177 @@ class StatusData(BaseModel):
     info: InfoData | None = None
 
 
+class CircuitState(StrEnum):
+    """Probe circuit breaker state."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitData(BaseModel):
+    """Probe circuit breaker data model.
+
+    Only holds fields that change when a probe reports back, so an open
+    circuit does not change the published status on every refresh.
+    """
+
+    name: str
+    state: CircuitState
+    consecutive_failures: int
+    retry_at: float | None = None
+    opened: int = 0
+
+
+class CircuitMetricsData(CircuitData):
+    """Probe circuit breaker metrics data model."""
+
+    short_circuited: int | None = None
+
+
 class Status(BaseModel):
     """Minecraft server status model."""
 
     data: StatusData | None = None
     data_external: StatusData | None = None
+    stale: bool = False
+    circuits: list[CircuitData] = []
+    polling_interval: int | None = None
+
+
+class FederationPeerData(BaseModel):
+    """Last status pulled from a peer dashboard."""
+
+    url: str
+    status: Status | None = None
+    updated_at: float | None = None
+    stale: bool = True
+    error: str | None = None
+
+
+class FederationData(BaseModel):
+    """Network-wide status merged from this dashboard and its peers."""
+
+    local: Status
+    peers: list[FederationPeerData] = []
+    servers: int = 0
+    servers_online: int = 0
+    players_online: int = 0
+    players_max: int = 0
+
+
+class HedgeData(BaseModel):
+    """Hedged request statistics of an upstream."""
+
+    name: str
+    requests: int
+    hedges: int
+    hedge_wins: int
+    hedge_rate: float
+    delay: float | None = None
+
+
+class AlertState(StrEnum):
+    """Alert notification state."""
+
+    FIRING = "firing"
+    RESOLVED = "resolved"
+
+
+class AlertData(BaseModel):
+    """Alert notification data model."""
+
+    rule: str
+    state: AlertState
+    message: str
+    timestamp: float
+
+
+class MetricsData(BaseModel):
+    """Dashboard metrics data model."""
+
+    circuits: list[CircuitMetricsData] = []
+    hedges: list[HedgeData] = []
+    log_records_dropped: int = 0
+    log_records_suppressed: int = 0
+    requests_rate_limited: int = 0
+    requests_shed: int = 0
+    alerts_dropped: int = 0
+
+
+class DnsCacheEntryData(BaseModel):
+    """Resolved host cache entry."""
+
+    host: str
+    ip: str
+    expires_at: float
+
+
+class McSrvStatusCacheEntryData(BaseModel):
+    """McSrvStat API response cache entry."""
+
+    url: str
+    data: McSrvStatusData
+    expires_at: float
+
+
+class WarmStartData(BaseModel):
+    """State persisted across restarts to serve a last-known-good response."""
+
+    saved_at: float
+    status: Status | None = None
+    dns_cache: list[DnsCacheEntryData] = []
+    mcsrvstat_cache: list[McSrvStatusCacheEntryData] = []
+
+
+class HistoryEntryData(BaseModel):
+    """A single probe result in the status history."""
+
+    timestamp: float
+    online: bool
+    players_online: int | None = None
+    players_max: int | None = None
+    latency: int | None = None
+    version: str | None = None
+    online_external: bool = False
+    latency_external: int | None = None
+
+
+class HistoryExportFormat(StrEnum):
+    """Status history export format."""
+
+    CSV = "csv"
+    NDJSON = "ndjson"
+    MSGPACK = "msgpack"
+    CBOR = "cbor"
+
+
+class WireFormat(StrEnum):
+    """Media type of an API response body."""
+
+    JSON = "application/json"
+    MSGPACK = "application/msgpack"
+    CBOR = "application/cbor"
+
+
+class StatsPeriod(StrEnum):
+    """Statistics bucket period."""
+
+    HOUR = "hour"
+    DAY = "day"
+    MONTH = "month"
+
+
+class UniquePlayersBucketData(BaseModel):
+    """Estimated unique players within a single bucket."""
+
+    start: float
+    unique_players: int
+
+
+class UniquePlayersData(BaseModel):
+    """Estimated unique players per bucket and across all returned buckets."""
+
+    period: StatsPeriod
+    buckets: list[UniquePlayersBucketData]
+    unique_players: int
@@ -0,0 +1,76 @@
+"""Index page rendering module for minecraft-dashboard."""
+
+import hashlib
+from pathlib import Path
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+from minecraft_dashboard.api import DashboardApi
+
+
+class IndexPage:
+    """Serves index.html with the current configuration and status inlined.
+
+    The frontend reads both from the inline script on its first render
+    instead of requesting them after the bundle loaded. The page is only
+    rendered again once the configuration or the status changed.
+    """
+
+    def __init__(self, template_path: Path, api: DashboardApi) -> None:
+        """Initialize the index page."""
+        self.template_path = template_path
+        self.api = api
+        self.template: tuple[bytes, bytes] | None = None
+        self.key: tuple[str, str] | None = None
+        self.html = b""
+        self.etag = ""
+
+    def render(self) -> tuple[bytes, str]:
+        """Get the rendered page and its entity tag, rendering it if stale."""
+        prober = self.api.prober
+        is_ready = prober.ready.is_set()
+        key = (self.api.config_etag, prober.status_etag if is_ready else "")
+        if key == self.key:
+            return self.html, self.etag
+
+        head, tail = self.get_template()
+        initial_state = (
+            b'<script id="initial-state" type="application/json">{"config":'
+            + self.escape(self.api.config_json)
+            + b',"status":'
+            + (self.escape(prober.status_json) if is_ready else b"null")
+            + b"}</script>"
+        )
+
+        self.html = head + initial_state + tail
+        self.etag = (
+            f'"{hashlib.blake2b("".join(key).encode(), digest_size=8).hexdigest()}"'
+        )
+        self.key = key
+        return self.html, self.etag
+
+    def get_template(self) -> tuple[bytes, bytes]:
+        """Get the built page split where the initial state is inserted."""
+        if self.template is None:
+            html = self.template_path.read_bytes()
+            position = html.find(b"</head>")
+            if position < 0:
+                position = len(html)
+            self.template = html[:position], html[position:]
+        return self.template
+
+    @staticmethod
+    def escape(data: bytes) -> bytes:
+        """Escape JSON so no string in it can close the script element."""
+        return data.replace(b"<", b"\\u003c")
+
+    def response(self, request: Request) -> Response:
+        """Answer a request for the index page."""
+        html, etag = self.render()
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=headers)
+
+        return Response(content=html, media_type="text/html", headers=headers)
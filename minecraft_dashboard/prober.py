@@ -0,0 +1,437 @@
+"""Background status prober module."""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from typing import TYPE_CHECKING
+
+from minecraft_dashboard.alerts import AlertEngine
+from minecraft_dashboard.circuit import CircuitBreaker
+from minecraft_dashboard.config import Config
+from minecraft_dashboard.const import (
+    POLLING_INTERVAL_STABLE_STEP,
+    SHARED_SNAPSHOT_SYNC_INTERVAL,
+)
+from minecraft_dashboard.history import HistoryStore
+from minecraft_dashboard.models import (
+    CircuitData,
+    CircuitMetricsData,
+    Status,
+    StatusData,
+    WireFormat,
+)
+from minecraft_dashboard.shared import SharedSnapshot
+from minecraft_dashboard.snapshot import StatusSnapshot
+from minecraft_dashboard.utils import MinecraftUtils, WireUtils
+
+if TYPE_CHECKING:
+    from mcstatus.responses import JavaStatusResponse, QueryResponse
+
+logger = logging.getLogger(__name__)
+
+
+class StatusProber:
+    """Probes the Minecraft server in the background and keeps the latest status.
+
+    The status ping, the UDP query and the mcsrvstat lookup are scheduled
+    independently: player counts and latency change every few seconds while
+    plugins and the map name rarely change at all.
+
+    With a shared snapshot, only the worker holding the prober lock probes
+    and publishes the serialized status, all other workers follow it.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        shared_snapshot: SharedSnapshot | None = None,
+        history: HistoryStore | None = None,
+        alerts: AlertEngine | None = None,
+    ) -> None:
+        """Initialize the status prober."""
+        self.config = config
+        self.history = history
+        self.alerts = alerts
+        self.status: StatusSnapshot | None = None
+        self.status_json = b""
+        self.status_etag = ""
+        self.status_encoded: dict[WireFormat, bytes] = {}
+        self.version = 0
+        self.ready = asyncio.Event()
+        self.changed = asyncio.Condition()
+        self.shared_snapshot = shared_snapshot
+        self.is_leader = shared_snapshot is None
+        self.is_running = False
+        self.probe_task: asyncio.Task | None = None
+
+        self.java_status: JavaStatusResponse | None = None
+        self.was_offline = False
+        self.query: QueryResponse | None = None
+        self.status_data_external: StatusData | None = None
+
+        self.next_status_probe = 0.0
+        self.next_query_probe = 0.0
+        self.next_external_probe = 0.0
+
+        self.activity_fingerprint: tuple | None = None
+        self.last_activity = time.monotonic()
+
+        self.circuit_breaker = self._create_circuit_breaker("minecraft")
+        self.circuit_breaker_query = self._create_circuit_breaker("minecraft_query")
+        self.circuit_breaker_external = self._create_circuit_breaker("mcsrvstat")
+
+    @property
+    def circuit_breakers(self) -> list[CircuitBreaker]:
+        """Get the circuit breakers of all probe targets."""
+        return [
+            self.circuit_breaker,
+            self.circuit_breaker_query,
+            self.circuit_breaker_external,
+        ]
+
+    def _create_circuit_breaker(self, name: str) -> CircuitBreaker:
+        """Create a circuit breaker from the configured thresholds."""
+        return CircuitBreaker(
+            name,
+            self.config.circuit_failure_threshold,
+            self.config.circuit_backoff_base,
+            self.config.circuit_backoff_max,
+        )
+
+    def reload_configuration(self, new_configuration: Config) -> None:
+        """Reload the configuration and probe again with the new settings."""
+        self.config = new_configuration
+        if self.alerts:
+            self.alerts.reload_configuration(new_configuration)
+        for circuit_breaker in self.circuit_breakers:
+            circuit_breaker.configure(
+                new_configuration.circuit_failure_threshold,
+                new_configuration.circuit_backoff_base,
+                new_configuration.circuit_backoff_max,
+            )
+
+        self.next_status_probe = 0.0
+        self.next_query_probe = 0.0
+        self.next_external_probe = 0.0
+
+    def get_circuits(self) -> list[CircuitData]:
+        """Get the circuit states of the process that is probing."""
+        if self.is_leader:
+            return [
+                circuit_breaker.to_data() for circuit_breaker in self.circuit_breakers
+            ]
+        if not self.status:
+            return []
+        return [circuit.to_model() for circuit in self.status.circuits]
+
+    def get_circuit_metrics(self) -> list[CircuitMetricsData]:
+        """Get the circuit states, with the counters only known to the prober."""
+        if self.is_leader:
+            return [
+                circuit_breaker.to_metrics()
+                for circuit_breaker in self.circuit_breakers
+            ]
+        return [
+            CircuitMetricsData(**circuit.model_dump())
+            for circuit in self.get_circuits()
+        ]
+
+    def restore_status(self, status: Status) -> None:
+        """Serve a persisted status, marked stale, until the first probe completes."""
+        status = status.model_copy(update={"stale": True})
+        self.status = StatusSnapshot.from_model(status)
+        self._set_status_json(status.model_dump_json().encode("utf-8"))
+        self.ready.set()
+
+    async def start(self) -> None:
+        """Start probing in the background."""
+        self.is_running = True
+        if self.alerts:
+            await self.alerts.start()
+        self.probe_task = asyncio.create_task(self._probe_loop())
+        logger.info("Started probing the Minecraft server")
+
+    async def stop(self) -> None:
+        """Stop probing."""
+        self.is_running = False
+        if self.probe_task:
+            self.probe_task.cancel()
+            try:
+                await self.probe_task
+            except asyncio.CancelledError:
+                pass
+        MinecraftUtils.close_query_clients()
+        if self.history and self.is_leader:
+            await self.history.flush()
+        if self.alerts:
+            await self.alerts.stop()
+        logger.info("Stopped probing the Minecraft server")
+
+    async def get_status(self) -> Status:
+        """Get the latest status, waiting for the first probe if necessary."""
+        await self.ready.wait()
+        return self.status.to_model() if self.status else Status()
+
+    async def get_status_json(self) -> bytes:
+        """Get the latest status serialized as JSON."""
+        await self.ready.wait()
+        return self.status_json
+
+    def get_status_encoded(self, wire_format: WireFormat) -> bytes:
+        """Get the latest status in a format, encoded once per status."""
+        encoded = self.status_encoded.get(wire_format)
+        if encoded is None:
+            encoded = WireUtils.encode(json.loads(self.status_json), wire_format)
+            self.status_encoded[wire_format] = encoded
+        return encoded
+
+    def get_status_etag(self, wire_format: WireFormat) -> str:
+        """Get the entity tag of the latest status in a format."""
+        if wire_format == WireFormat.JSON:
+            return self.status_etag
+        return f'{self.status_etag[:-1]}-{wire_format.name.lower()}"'
+
+    async def wait_for_change(self, since: int, timeout: float) -> bool:
+        """Wait until the status version differs from the given one.
+
+        Return False if it did not change within the timeout.
+        """
+        await self.ready.wait()
+
+        try:
+            async with asyncio.timeout(timeout):
+                async with self.changed:
+                    await self.changed.wait_for(lambda: self.version != since)
+        except TimeoutError:
+            return False
+
+        return True
+
+    async def _notify(self) -> None:
+        """Wake up all requests waiting for a new status."""
+        async with self.changed:
+            self.changed.notify_all()
+
+    async def refresh(self) -> Status:
+        """Run all probes that are due and publish the merged status."""
+        now = time.monotonic()
+        probes = []
+
+        is_status_due = now >= self.next_status_probe
+        if is_status_due:
+            self.next_status_probe = now + self.config.minecraft_server_status_interval
+            probes.append(self._probe_status())
+        if now >= self.next_query_probe:
+            self.next_query_probe = now + self.config.minecraft_server_query_interval
+            probes.append(self._probe_query())
+        if now >= self.next_external_probe:
+            self.next_external_probe = now + self.config.mcsrvstat_interval
+            probes.append(self._probe_external())
+
+        results = await asyncio.gather(*probes)
+        # Only a ping that was actually sent counts as a check for the alerts.
+        is_status_checked = is_status_due and results[0]
+
+        status_data = None
+        if self.java_status:
+            status_data = await MinecraftUtils.build_status_data(
+                self.config.minecraft_server_host,
+                self.config.minecraft_server_port,
+                self.java_status,
+                self.query,
+            )
+
+        status = Status(
+            data=status_data,
+            data_external=self.status_data_external,
+            circuits=self.get_circuits(),
+            polling_interval=self._get_polling_interval(status_data),
+        )
+        if self._publish(status):
+            await self._notify()
+
+        if self.alerts and is_status_checked:
+            self.alerts.evaluate(status)
+
+        if self.history:
+            try:
+                await self.history.append(status)
+            except OSError as exception:
+                logger.warning(f"Failed to record status history: {exception}")
+
+        return status
+
+    def _publish(self, status: Status) -> bool:
+        """Make a new status available to the API, serialized once.
+
+        Return whether it differs from the previous one.
+        """
+        status_json = status.model_dump_json().encode("utf-8")
+        if status_json == self.status_json:
+            return False
+
+        self.status = StatusSnapshot.from_model(status)
+        self._set_status_json(status_json)
+
+        if self.shared_snapshot:
+            self.version = self.shared_snapshot.write(self.status_json)
+        else:
+            self.version += 1
+
+        self.ready.set()
+        return True
+
+    def _follow(self) -> bool:
+        """Pick up the status the elected prober published to shared memory.
+
+        Return whether a new status was published.
+        """
+        if not self.shared_snapshot:
+            return False
+
+        snapshot = self.shared_snapshot.read(self.version)
+        if not snapshot:
+            return False
+
+        self.version, status_json = snapshot
+        self._set_status_json(status_json)
+        self.status = StatusSnapshot.from_model(
+            Status.model_validate_json(self.status_json)
+        )
+        self.ready.set()
+        return True
+
+    def _set_status_json(self, status_json: bytes) -> None:
+        """Store the serialized status and tag it for conditional requests."""
+        self.status_json = status_json
+        self.status_encoded = {WireFormat.JSON: status_json}
+        self.status_etag = (
+            f'"{hashlib.blake2b(status_json, digest_size=8).hexdigest()}"'
+        )
+
+    def _get_polling_interval(self, status_data: StatusData | None) -> int:
+        """Recommend a frontend polling interval from how often the status changes.
+
+        The interval starts at the configured polling interval and doubles for
+        every minute without player activity, up to the configured maximum.
+        """
+        base_interval = self.config.frontend_polling_interval
+        max_interval = max(self.config.frontend_polling_interval_max, base_interval)
+
+        if not status_data or not status_data.players:
+            self.activity_fingerprint = None
+            return max_interval
+
+        now = time.monotonic()
+        fingerprint = (
+            status_data.players.online,
+            tuple(player.name for player in status_data.players.player_list or []),
+            status_data.version,
+            status_data.motd.plain if status_data.motd else None,
+        )
+        if fingerprint != self.activity_fingerprint:
+            self.activity_fingerprint = fingerprint
+            self.last_activity = now
+
+        stable_steps = int((now - self.last_activity) / POLLING_INTERVAL_STABLE_STEP)
+        return min(base_interval * 2 ** min(stable_steps, 16), max_interval)
+
+    async def _probe_status(self) -> bool:
+        """Ping the server for players, latency and MOTD.
+
+        Return whether the server was pinged, False while the circuit is open.
+        """
+        if not self.circuit_breaker.allow():
+            self.java_status = None
+            self.was_offline = True
+            return False
+
+        try:
+            self.java_status = await MinecraftUtils.get_java_status(
+                self.config.minecraft_server_host,
+                self.config.minecraft_server_port,
+                self.config.minecraft_server_timeout,
+            )
+        except Exception as exception:
+            logger.debug(f"Status probe failed: {exception}")
+            self.java_status = None
+            self.query = None
+            self.was_offline = True
+            self.circuit_breaker.record_failure()
+            return True
+
+        self.circuit_breaker.record_success()
+
+        if self.was_offline:
+            # The server just came back up, its plugins may have changed.
+            self.was_offline = False
+            self.next_query_probe = 0.0
+
+        return True
+
+    async def _probe_query(self) -> None:
+        """Query the server for plugins, software version and map name."""
+        if not self.circuit_breaker_query.allow():
+            return
+
+        try:
+            self.query = await MinecraftUtils.get_java_query(
+                self.config.minecraft_server_host,
+                self.config.minecraft_server_port,
+                self.config.minecraft_server_timeout,
+            )
+        except Exception as exception:
+            # Keep the last query result, plugins and map rarely change and
+            # most servers have the query protocol disabled anyway.
+            logger.debug(f"Query probe failed: {exception}")
+            self.circuit_breaker_query.record_failure()
+            return
+
+        self.circuit_breaker_query.record_success()
+
+    async def _probe_external(self) -> None:
+        """Get the status as seen from outside through mcsrvstat."""
+        try:
+            self.status_data_external = await MinecraftUtils.get_status_external(
+                self.config.mcsrvstat_url,
+                self.config.effective_minecraft_server_host_external,
+                self.config.effective_minecraft_server_port_external,
+                self.config.minecraft_server_timeout,
+                self.config.ping_host_external,
+                self.config.ping_port_external,
+                self.circuit_breaker_external,
+            )
+        except Exception as exception:
+            logger.debug(f"External status probe failed: {exception}")
+            self.status_data_external = None
+
+    async def _probe_loop(self) -> None:
+        """Main probe loop that runs every probe when it is due."""
+        while self.is_running:
+            try:
+                if not self.is_leader:
+                    if self._follow():
+                        await self._notify()
+                    if not self.shared_snapshot.try_acquire_leadership():
+                        await asyncio.sleep(SHARED_SNAPSHOT_SYNC_INTERVAL)
+                        continue
+
+                    logger.info("Elected as the prober process")
+                    self.is_leader = True
+
+                await self.refresh()
+
+                next_probe = min(
+                    self.next_status_probe,
+                    self.next_query_probe,
+                    self.next_external_probe,
+                )
+                await asyncio.sleep(max(next_probe - time.monotonic(), 0.1))
+
+            except asyncio.CancelledError:
+                break
+            except Exception as exception:
+                logger.error(f"Error in probe loop: {exception}", exc_info=True)
+                await asyncio.sleep(5.0)
@@ -0,0 +1,80 @@
+"""Persistent UDP Query client module for minecraft-dashboard."""
+
+import logging
+import time
+from typing import TYPE_CHECKING
+
+from minecraft_dashboard.const import QUERY_CHALLENGE_TTL
+
+if TYPE_CHECKING:
+    from mcstatus.protocol.connection import UDPAsyncSocketConnection
+    from mcstatus.querier import AsyncServerQuerier
+    from mcstatus.responses import QueryResponse
+
+logger = logging.getLogger(__name__)
+
+
+class QueryClient:
+    """Keeps the UDP socket to a server open and reuses its challenge token.
+
+    A full-stat request needs a challenge token from a handshake first. The
+    server accepts a token for about 30 seconds, so within that window a
+    probe takes a single round trip instead of two.
+    """
+
+    def __init__(self, ip: str, port: int, timeout: float) -> None:
+        """Initialize the query client."""
+        self.ip = ip
+        self.port = port
+        self.timeout = timeout
+        self.connection: UDPAsyncSocketConnection | None = None
+        self.querier: AsyncServerQuerier | None = None
+        self.challenge_expires_at = 0.0
+        self.handshakes = 0
+        self.queries = 0
+
+    async def query(self) -> "QueryResponse":
+        """Query the server, handshaking only if the token expired."""
+        reused_challenge = time.monotonic() < self.challenge_expires_at
+
+        try:
+            return await self._query()
+        except Exception as exception:
+            self.close()
+            if not reused_challenge:
+                raise
+
+            # The server may have rotated its tokens early, retry once.
+            logger.debug(f"Query with a cached challenge failed: {exception}")
+            return await self._query()
+
+    async def _query(self) -> "QueryResponse":
+        """Send a full-stat request over the open connection."""
+        from mcstatus.address import Address
+        from mcstatus.protocol.connection import UDPAsyncSocketConnection
+        from mcstatus.querier import AsyncServerQuerier
+
+        if self.querier is None:
+            connection = UDPAsyncSocketConnection(
+                Address(self.ip, self.port), self.timeout
+            )
+            await connection.connect()
+            self.connection = connection
+            self.querier = AsyncServerQuerier(connection)
+        self.querier.connection.timeout = self.timeout
+
+        if time.monotonic() >= self.challenge_expires_at:
+            await self.querier.handshake()
+            self.handshakes += 1
+            self.challenge_expires_at = time.monotonic() + QUERY_CHALLENGE_TTL
+
+        self.queries += 1
+        return await self.querier.read_query()
+
+    def close(self) -> None:
+        """Close the socket and forget the challenge token."""
+        if self.connection:
+            self.connection.close()
+        self.connection = None
+        self.querier = None
+        self.challenge_expires_at = 0.0
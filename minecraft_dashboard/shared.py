@@ -0,0 +1,111 @@
+"""Shared-memory status snapshot module for multi-worker deployments."""
+
+import logging
+import os
+import struct
+import tempfile
+from pathlib import Path
+from typing import IO
+
+from minecraft_dashboard.const import SHARED_SNAPSHOT_SIZE
+
+logger = logging.getLogger(__name__)
+
+SEQUENCE = struct.Struct("<Q")
+LENGTH = struct.Struct("<Q")
+HEADER_SIZE = SEQUENCE.size + LENGTH.size
+
+
+class SharedSnapshot:
+    """A serialized status in shared memory, guarded by a sequence lock.
+
+    Exactly one process, the elected prober, writes the snapshot. The
+    sequence number is odd while a write is in progress, readers retry until
+    they copied the payload between two identical even sequence numbers.
+    The snapshot generation is half the sequence number.
+    """
+
+    def __init__(self, name: str, create: bool = False) -> None:
+        """Attach to the shared memory segment, creating it if requested."""
+        from multiprocessing.shared_memory import SharedMemory
+
+        if create:
+            self.memory = SharedMemory(
+                name=name, create=True, size=SHARED_SNAPSHOT_SIZE
+            )
+        else:
+            self.memory = SharedMemory(name=name, track=False)
+
+        self.name = name
+        self.is_owner = create
+        self.lock_path = Path(tempfile.gettempdir()) / f"{name}.lock"
+        self.lock_file: IO[bytes] | None = None
+
+    @classmethod
+    def create(cls, suffix: str = "") -> "SharedSnapshot":
+        """Create a new shared memory segment for this deployment."""
+        return cls(f"minecraft_dashboard_{os.getpid()}{suffix}", create=True)
+
+    def try_acquire_leadership(self) -> bool:
+        """Try to become the single prober process, without blocking."""
+        import fcntl
+
+        if self.lock_file is None:
+            self.lock_file = self.lock_path.open("a+b")
+
+        try:
+            fcntl.flock(self.lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return False
+
+        return True
+
+    def write(self, payload: bytes) -> int:
+        """Publish a new snapshot and return its generation."""
+        buffer = self.memory.buf
+        if HEADER_SIZE + len(payload) > len(buffer):
+            raise ValueError(
+                f"Snapshot of {len(payload)} bytes does not fit into shared memory"
+            )
+
+        (sequence,) = SEQUENCE.unpack_from(buffer, 0)
+        SEQUENCE.pack_into(buffer, 0, sequence + 1)
+        LENGTH.pack_into(buffer, SEQUENCE.size, len(payload))
+        buffer[HEADER_SIZE : HEADER_SIZE + len(payload)] = payload
+        SEQUENCE.pack_into(buffer, 0, sequence + 2)
+
+        return (sequence + 2) // 2
+
+    def read(self, generation: int, attempts: int = 100) -> tuple[int, bytes] | None:
+        """Read the snapshot if it is newer than the given generation."""
+        buffer = self.memory.buf
+
+        for _ in range(attempts):
+            (sequence,) = SEQUENCE.unpack_from(buffer, 0)
+            if sequence % 2:
+                continue
+            if sequence // 2 == generation:
+                return None
+
+            (length,) = LENGTH.unpack_from(buffer, SEQUENCE.size)
+            if HEADER_SIZE + length > len(buffer):
+                continue
+            payload = bytes(buffer[HEADER_SIZE : HEADER_SIZE + length])
+
+            if SEQUENCE.unpack_from(buffer, 0)[0] == sequence:
+                return sequence // 2, payload
+
+        logger.debug("Gave up reading the shared snapshot during a write")
+        return None
+
+    def close(self) -> None:
+        """Detach from the segment, removing it if this process created it."""
+        if self.lock_file:
+            self.lock_file.close()
+            self.lock_file = None
+
+        self.memory.close()
+
+        if self.is_owner:
+            self.memory.unlink()
+            self.lock_path.unlink(missing_ok=True)
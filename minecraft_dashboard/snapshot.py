@@ -0,0 +1,220 @@
+"""Compact internal status snapshot module for minecraft-dashboard."""
+
+import sys
+from dataclasses import dataclass
+from typing import Self
+
+from minecraft_dashboard.models import (
+    CircuitData,
+    CircuitState,
+    InfoData,
+    ModData,
+    MotdData,
+    PlayerData,
+    PlayersData,
+    PluginData,
+    ProtocolData,
+    Status,
+    StatusData,
+)
+
+
+def intern_string(value: str | None) -> str | None:
+    """Intern a string so equal values share one object across snapshots."""
+    return None if value is None else sys.intern(value)
+
+
+@dataclass(slots=True, frozen=True)
+class ProtocolSnapshot:
+    """Protocol of a server."""
+
+    version: int
+    name: str | None
+
+    @classmethod
+    def from_model(cls, model: ProtocolData) -> Self:
+        """Create the snapshot of a protocol model."""
+        return cls(model.version, intern_string(model.name))
+
+
+@dataclass(slots=True, frozen=True)
+class MotdSnapshot:
+    """Message of the day of a server."""
+
+    plain: str
+    html: str
+
+    @classmethod
+    def from_model(cls, model: MotdData) -> Self:
+        """Create the snapshot of a motd model."""
+        return cls(sys.intern(model.plain), sys.intern(model.html))
+
+
+@dataclass(slots=True, frozen=True)
+class PlayerSnapshot:
+    """Player listed by a server."""
+
+    name: str
+    uuid: str
+
+    @classmethod
+    def from_model(cls, model: PlayerData) -> Self:
+        """Create the snapshot of a player model."""
+        return cls(sys.intern(model.name), sys.intern(model.uuid))
+
+
+@dataclass(slots=True, frozen=True)
+class PlayersSnapshot:
+    """Player counts and sample of a server."""
+
+    online: int
+    max: int
+    player_list: tuple[PlayerSnapshot, ...] | None
+
+    @classmethod
+    def from_model(cls, model: PlayersData) -> Self:
+        """Create the snapshot of a players model."""
+        player_list = None
+        if model.player_list is not None:
+            player_list = tuple(
+                PlayerSnapshot.from_model(player) for player in model.player_list
+            )
+        return cls(model.online, model.max, player_list)
+
+
+@dataclass(slots=True, frozen=True)
+class PackageSnapshot:
+    """Plugin or mod installed on a server."""
+
+    name: str
+    version: str
+
+    @classmethod
+    def from_model(cls, model: PluginData | ModData) -> Self:
+        """Create the snapshot of a plugin or mod model."""
+        return cls(sys.intern(model.name), sys.intern(model.version))
+
+
+@dataclass(slots=True, frozen=True)
+class InfoSnapshot:
+    """Hover text of a server."""
+
+    raw: tuple[str, ...]
+    clean: tuple[str, ...]
+    html: tuple[str, ...]
+
+    @classmethod
+    def from_model(cls, model: InfoData) -> Self:
+        """Create the snapshot of an info model."""
+        return cls(
+            tuple(map(sys.intern, model.raw)),
+            tuple(map(sys.intern, model.clean)),
+            tuple(map(sys.intern, model.html)),
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class StatusDataSnapshot:
+    """Status of a server as seen by one probe."""
+
+    latency: int | None
+    ip: str | None
+    port: int | None
+    hostname: str | None
+    version: str | None
+    protocol: ProtocolSnapshot | None
+    icon: str | None
+    software: str | None
+    map: str | None
+    motd: MotdSnapshot | None
+    players: PlayersSnapshot | None
+    plugins: tuple[PackageSnapshot, ...] | None
+    mods: tuple[PackageSnapshot, ...] | None
+    info: InfoSnapshot | None
+
+    @classmethod
+    def from_model(cls, model: StatusData) -> Self:
+        """Create the snapshot of a status data model."""
+        return cls(
+            latency=model.latency,
+            ip=intern_string(model.ip),
+            port=model.port,
+            hostname=intern_string(model.hostname),
+            version=intern_string(model.version),
+            protocol=ProtocolSnapshot.from_model(model.protocol)
+            if model.protocol
+            else None,
+            icon=intern_string(model.icon),
+            software=intern_string(model.software),
+            map=intern_string(model.map),
+            motd=MotdSnapshot.from_model(model.motd) if model.motd else None,
+            players=PlayersSnapshot.from_model(model.players)
+            if model.players
+            else None,
+            plugins=tuple(map(PackageSnapshot.from_model, model.plugins))
+            if model.plugins is not None
+            else None,
+            mods=tuple(map(PackageSnapshot.from_model, model.mods))
+            if model.mods is not None
+            else None,
+            info=InfoSnapshot.from_model(model.info) if model.info else None,
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class CircuitSnapshot:
+    """Circuit breaker state of a probe."""
+
+    name: str
+    state: CircuitState
+    consecutive_failures: int
+    retry_at: float | None
+    opened: int
+
+    @classmethod
+    def from_model(cls, model: CircuitData) -> Self:
+        """Create the snapshot of a circuit model."""
+        return cls(
+            sys.intern(model.name),
+            model.state,
+            model.consecutive_failures,
+            model.retry_at,
+            model.opened,
+        )
+
+    def to_model(self) -> CircuitData:
+        """Convert the snapshot to its API model."""
+        return CircuitData.model_validate(self, from_attributes=True)
+
+
+@dataclass(slots=True, frozen=True)
+class StatusSnapshot:
+    """Merged status of the probes, the form statuses are kept in memory.
+
+    Snapshots are slotted and immutable and intern their strings, so the
+    versions, plugins and players that repeat across snapshots are stored
+    once. The pydantic models are only built at the API boundary.
+    """
+
+    data: StatusDataSnapshot | None
+    data_external: StatusDataSnapshot | None
+    stale: bool
+    circuits: tuple[CircuitSnapshot, ...]
+    polling_interval: int | None
+
+    @classmethod
+    def from_model(cls, model: Status) -> Self:
+        """Create the snapshot of a status model."""
+        return cls(
+            data=StatusDataSnapshot.from_model(model.data) if model.data else None,
+            data_external=StatusDataSnapshot.from_model(model.data_external)
+            if model.data_external
+            else None,
+            stale=model.stale,
+            circuits=tuple(map(CircuitSnapshot.from_model, model.circuits)),
+            polling_interval=model.polling_interval,
+        )
+
+    def to_model(self) -> Status:
+        """Convert the snapshot to its API model."""
+        return Status.model_validate(self, from_attributes=True)
@@ -0,0 +1,204 @@
+"""Unique player statistics module for minecraft-dashboard."""
+
+import asyncio
+import logging
+import time
+from collections.abc import Iterable
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from minecraft_dashboard.const import (
+    UNIQUE_PLAYERS_DAYS,
+    UNIQUE_PLAYERS_HOURS,
+    UNIQUE_PLAYERS_MONTHS,
+    UNIQUE_PLAYERS_SAVE_INTERVAL,
+)
+from minecraft_dashboard.hll import HyperLogLog
+from minecraft_dashboard.models import (
+    StatsPeriod,
+    UniquePlayersBucketData,
+    UniquePlayersData,
+)
+
+logger = logging.getLogger(__name__)
+
+RETENTION = {
+    StatsPeriod.HOUR: UNIQUE_PLAYERS_HOURS,
+    StatsPeriod.DAY: UNIQUE_PLAYERS_DAYS,
+    StatsPeriod.MONTH: UNIQUE_PLAYERS_MONTHS,
+}
+KEY_FORMATS = {
+    StatsPeriod.HOUR: "%Y-%m-%dT%H",
+    StatsPeriod.DAY: "%Y-%m-%d",
+    StatsPeriod.MONTH: "%Y-%m",
+}
+
+
+class UniquePlayersStore:
+    """Counts unique players per hour, day and month with HyperLogLog sketches.
+
+    Every player sample updates the sketch of its hour, day and month at
+    once, so rollups need no merging. Only the sketches within the retention
+    of each period are kept, each one has a fixed size however many players
+    join. Processes that do not probe themselves re-read the persisted
+    sketches once they are older than the save interval.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the unique players store."""
+        self.path = path
+        self.sketches: dict[tuple[StatsPeriod, str], tuple[HyperLogLog, float]] = {}
+        self.dirty: set[tuple[StatsPeriod, str]] = set()
+        self.is_writer = False
+        self.last_saved = time.monotonic()
+
+    @staticmethod
+    def get_bucket_start(period: StatsPeriod, moment: datetime) -> datetime:
+        """Get the start of the bucket a moment belongs to."""
+        start = moment.replace(minute=0, second=0, microsecond=0)
+        if period != StatsPeriod.HOUR:
+            start = start.replace(hour=0)
+        if period == StatsPeriod.MONTH:
+            start = start.replace(day=1)
+        return start
+
+    @staticmethod
+    def get_previous_bucket_start(period: StatsPeriod, start: datetime) -> datetime:
+        """Get the start of the bucket before the given one."""
+        if period == StatsPeriod.HOUR:
+            return start - timedelta(hours=1)
+        if period == StatsPeriod.DAY:
+            return start - timedelta(days=1)
+        return (start - timedelta(days=1)).replace(day=1)
+
+    def get_bucket_starts(
+        self, period: StatsPeriod, count: int, timestamp: float
+    ) -> list[datetime]:
+        """Get the starts of the latest buckets of a period, oldest first."""
+        start = self.get_bucket_start(period, datetime.fromtimestamp(timestamp, UTC))
+        starts = [start]
+        for _ in range(count - 1):
+            start = self.get_previous_bucket_start(period, start)
+            starts.append(start)
+        return starts[::-1]
+
+    def get_sketch_path(self, period: StatsPeriod, key: str) -> Path:
+        """Get the file a sketch is persisted to."""
+        return self.path / period / f"{key}.hll"
+
+    async def add(self, uuids: Iterable[str], timestamp: float) -> None:
+        """Count the players of a sample in their hour, day and month."""
+        self.is_writer = True
+        uuids = list(uuids)
+        moment = datetime.fromtimestamp(timestamp, UTC)
+
+        for period in StatsPeriod:
+            key = self.get_bucket_start(period, moment).strftime(KEY_FORMATS[period])
+            sketch = await self._get_sketch(period, key)
+
+            changed = False
+            for uuid in uuids:
+                changed |= sketch.add(uuid)
+            if changed:
+                self.dirty.add((period, key))
+
+        self._evict(timestamp)
+
+        if time.monotonic() - self.last_saved >= UNIQUE_PLAYERS_SAVE_INTERVAL:
+            await self.save()
+
+    async def get(
+        self, period: StatsPeriod, count: int, timestamp: float | None = None
+    ) -> UniquePlayersData:
+        """Estimate the unique players of the latest buckets of a period."""
+        count = min(max(count, 1), RETENTION[period])
+        total = HyperLogLog()
+        buckets = []
+
+        timestamp = timestamp or time.time()
+        for start in self.get_bucket_starts(period, count, timestamp):
+            sketch = await self._get_sketch(period, start.strftime(KEY_FORMATS[period]))
+            total.merge(sketch)
+            buckets.append(
+                UniquePlayersBucketData(
+                    start=start.timestamp(), unique_players=sketch.count()
+                )
+            )
+
+        self._evict(timestamp)
+        return UniquePlayersData(
+            period=period, buckets=buckets, unique_players=total.count()
+        )
+
+    async def save(self) -> None:
+        """Persist the changed sketches and delete the expired ones."""
+        dirty = [
+            (period, key, self.sketches[(period, key)][0].to_bytes())
+            for period, key in self.dirty
+            if (period, key) in self.sketches
+        ]
+        self.dirty.clear()
+        self.last_saved = time.monotonic()
+
+        try:
+            await asyncio.to_thread(self._write, dirty)
+        except OSError as exception:
+            logger.warning(f"Failed to save unique player sketches: {exception}")
+
+    async def _get_sketch(self, period: StatsPeriod, key: str) -> HyperLogLog:
+        """Get a sketch from memory, loading it from disk if necessary."""
+        entry = self.sketches.get((period, key))
+        now = time.monotonic()
+        if entry and (self.is_writer or now - entry[1] < UNIQUE_PLAYERS_SAVE_INTERVAL):
+            return entry[0]
+
+        sketch = await asyncio.to_thread(self._read, period, key)
+        self.sketches[(period, key)] = (sketch, now)
+        return sketch
+
+    def _read(self, period: StatsPeriod, key: str) -> HyperLogLog:
+        """Read a persisted sketch, starting empty if there is none."""
+        try:
+            return HyperLogLog.from_bytes(
+                self.get_sketch_path(period, key).read_bytes()
+            )
+        except FileNotFoundError:
+            return HyperLogLog()
+        except Exception as exception:
+            logger.warning(f"Ignoring unreadable sketch {period}/{key}: {exception}")
+            return HyperLogLog()
+
+    def _write(self, sketches: list[tuple[StatsPeriod, str, bytes]]) -> None:
+        """Write sketches to disk and remove the files beyond the retention."""
+        for period, key, data in sketches:
+            sketch_path = self.get_sketch_path(period, key)
+            sketch_path.parent.mkdir(parents=True, exist_ok=True)
+            temporary_path = sketch_path.with_suffix(".tmp")
+            temporary_path.write_bytes(data)
+            temporary_path.replace(sketch_path)
+
+        cutoffs = self._get_cutoffs(time.time())
+        for period in StatsPeriod:
+            period_path = self.path / period
+            if not period_path.is_dir():
+                continue
+            for sketch_path in period_path.glob("*.hll"):
+                if sketch_path.stem < cutoffs[period]:
+                    sketch_path.unlink(missing_ok=True)
+
+    def _get_cutoffs(self, timestamp: float) -> dict[StatsPeriod, str]:
+        """Get the key of the oldest bucket kept for every period."""
+        return {
+            period: self.get_bucket_starts(period, RETENTION[period], timestamp)[
+                0
+            ].strftime(KEY_FORMATS[period])
+            for period in StatsPeriod
+        }
+
+    def _evict(self, timestamp: float) -> None:
+        """Drop the sketches beyond the retention from memory."""
+        cutoffs = self._get_cutoffs(timestamp)
+        for period, key in list(self.sketches):
+            if key < cutoffs[period]:
+                del self.sketches[(period, key)]
+                self.dirty.discard((period, key))
@@ -1,23 +1,38 @@
 """Utility functions for minecraft-dashboard."""
 
 import asyncio
+import atexit
+import functools
+import gzip
+import importlib.util
 import ipaddress
 import json
 import logging
 import os
 import sys
+import time
+from logging.handlers import QueueListener
 from pathlib import Path
-from typing import Any, Callable, TypeVar, cast
+from typing import TYPE_CHECKING, Any, Callable, TypeVar, cast
 
-import colorlog
-import httpx
 from dataclass_wizard import json_field
 from dotenv import load_dotenv
-from mcstatus import JavaServer
-from tcp_latency import measure_latency
 
+from minecraft_dashboard.cache import LruCache
+from minecraft_dashboard.circuit import CircuitBreaker
+from minecraft_dashboard.const import (
+    DNS_CACHE_TTL,
+    LOG_QUEUE_SIZE,
+    LOG_RATE_LIMIT_WINDOW,
+    MCSRVSTAT_CACHE_TTL,
+    MEMO_CACHE_SIZE,
+)
+from minecraft_dashboard.hedge import HedgedRequest
+from minecraft_dashboard.log import DroppingQueueHandler, RateLimitFilter
 from minecraft_dashboard.models import (
+    DnsCacheEntryData,
     InfoData,
+    McSrvStatusCacheEntryData,
     McSrvStatusData,
     McSrvStatusDebugData,
     McSrvStatusMapData,
@@ -30,7 +45,16 @@ from minecraft_dashboard.models import (
     ProtocolData,
     Status,
     StatusData,
+    WarmStartData,
+    WireFormat,
 )
+from minecraft_dashboard.query import QueryClient
+
+if TYPE_CHECKING:
+    from mcstatus import JavaServer
+    from mcstatus.responses import JavaStatusResponse, QueryResponse
+
+    from minecraft_dashboard.config import Config
 
 T = TypeVar("T")
 
@@ -40,6 +64,17 @@ logger = logging.getLogger(__name__)
 class EnvUtils:
     """Utility functions for environment variables."""
 
+    _dotenv_loaded = False
+
+    @staticmethod
+    def load() -> None:
+        """Load the .env file into the environment, once per process."""
+        if EnvUtils._dotenv_loaded:
+            return
+
+        load_dotenv()
+        EnvUtils._dotenv_loaded = True
+
     @staticmethod
     def read(
         name: str,
@@ -47,7 +82,7 @@ class EnvUtils:
         parser: Callable[[str], T] | None = None,
     ) -> T:
         """Get an environment variable or return a default value."""
-        load_dotenv()
+        EnvUtils.load()
 
         value = os.getenv(name)
         if value is None:
@@ -118,7 +153,7 @@ class DataclassUtils:
     @staticmethod
     def check_config_env_mismatch(instance: Any) -> None:
         """Check for mismatches between config file values and environment variables."""
-        load_dotenv()
+        EnvUtils.load()
 
         for field in instance.__dataclass_fields__.values():
             metadata = field.metadata
@@ -144,7 +179,16 @@ class DataclassUtils:
 
 
 class LoggingUtils:
-    """Utility functions for logging."""
+    """Utility functions for logging.
+
+    Records are only rate limited and queued on the calling thread, the
+    handlers format and write them on a background listener thread.
+    """
+
+    queue_handler: DroppingQueueHandler | None = None
+    rate_limit_filter: RateLimitFilter | None = None
+    listener: QueueListener | None = None
+    is_stop_registered = False
 
     @staticmethod
     def init(
@@ -156,6 +200,7 @@ class LoggingUtils:
         log_file_mode: str,
     ) -> None:
         """Initialize logging configuration."""
+        import colorlog
 
         color_formatter = colorlog.ColoredFormatter(
             fmt=log_format_console,
@@ -186,103 +231,318 @@ class LoggingUtils:
             except PermissionError:
                 pass
 
+        LoggingUtils.stop()
+
+        rate_limit_filter = RateLimitFilter(LOG_RATE_LIMIT_WINDOW)
+        queue_handler = DroppingQueueHandler(LOG_QUEUE_SIZE)
+        queue_handler.addFilter(rate_limit_filter)
+
+        listener = QueueListener(
+            queue_handler.queue, *handlers, respect_handler_level=True
+        )
+        listener.start()
+
+        LoggingUtils.rate_limit_filter = rate_limit_filter
+        LoggingUtils.queue_handler = queue_handler
+        LoggingUtils.listener = listener
+
         logging.basicConfig(
             level=log_level.upper(),
-            handlers=handlers,
+            handlers=[queue_handler],
+            force=True,
         )
+        if not LoggingUtils.is_stop_registered:
+            atexit.register(LoggingUtils.stop)
+            LoggingUtils.is_stop_registered = True
+
+    @staticmethod
+    def stop() -> None:
+        """Flush the queued records and stop the listener thread."""
+        if LoggingUtils.listener:
+            LoggingUtils.listener.stop()
+            LoggingUtils.listener = None
+
+    @staticmethod
+    def get_dropped() -> int:
+        """Get the number of records dropped because the queue was full."""
+        return LoggingUtils.queue_handler.dropped if LoggingUtils.queue_handler else 0
+
+    @staticmethod
+    def get_suppressed() -> int:
+        """Get the number of repeated records swallowed by the rate limit."""
+        if not LoggingUtils.rate_limit_filter:
+            return 0
+        return LoggingUtils.rate_limit_filter.suppressed
+
+
+class RuntimeUtils:
+    """Utility functions for the uvicorn runtime profile."""
+
+    @staticmethod
+    def is_installed(module: str) -> bool:
+        """Check whether an optional module can be imported."""
+        return importlib.util.find_spec(module) is not None
+
+    @staticmethod
+    def resolve_loop(loop: str) -> str:
+        """Resolve the configured event loop to the one that will be used."""
+        has_uvloop = sys.platform != "win32" and RuntimeUtils.is_installed("uvloop")
+
+        if loop == "auto":
+            return "uvloop" if has_uvloop else "asyncio"
+        if loop == "uvloop" and not has_uvloop:
+            logger.warning("uvloop is not installed, falling back to asyncio")
+            return "asyncio"
+        return loop
+
+    @staticmethod
+    def resolve_http(http: str) -> str:
+        """Resolve the configured HTTP parser to the one that will be used."""
+        has_httptools = RuntimeUtils.is_installed("httptools")
+
+        if http == "auto":
+            return "httptools" if has_httptools else "h11"
+        if http == "httptools" and not has_httptools:
+            logger.warning("httptools is not installed, falling back to h11")
+            return "h11"
+        return http
+
+    @staticmethod
+    def get_uvicorn_options(config: "Config") -> dict[str, Any]:
+        """Get the uvicorn settings of the configured runtime profile."""
+        return {
+            "host": config.api_host,
+            "port": config.api_port,
+            "loop": RuntimeUtils.resolve_loop(config.api_loop),
+            "http": RuntimeUtils.resolve_http(config.api_http),
+            "timeout_keep_alive": config.api_keep_alive_timeout,
+            "backlog": config.api_backlog,
+            "limit_concurrency": config.api_limit_concurrency,
+            "access_log": config.api_access_log,
+            "log_config": None,
+        }
+
+    @staticmethod
+    def log_self_check(options: dict[str, Any]) -> None:
+        """Report which fast paths are active in this deployment."""
+        import yaml
+
+        yaml_loader = "libyaml" if hasattr(yaml, "CSafeLoader") else "pure Python"
+        limit_concurrency = options["limit_concurrency"] or "unlimited"
+
+        logger.info(
+            f"Runtime: event loop {options['loop']}, HTTP parser {options['http']}, "
+            f"YAML parser {yaml_loader}, keep-alive {options['timeout_keep_alive']}s, "
+            f"backlog {options['backlog']}, concurrency {limit_concurrency}, "
+            f"access log {'on' if options['access_log'] else 'off'}"
+        )
+
+        if not RuntimeUtils.is_installed("uvloop") or not RuntimeUtils.is_installed(
+            "httptools"
+        ):
+            logger.info(
+                "Install minecraft-dashboard[speedups] for uvloop and httptools"
+            )
+
+
+class WireUtils:
+    """Utility functions for binary response formats."""
+
+    MODULES = {WireFormat.MSGPACK: "msgpack", WireFormat.CBOR: "cbor2"}
+
+    @staticmethod
+    def is_available(wire_format: WireFormat) -> bool:
+        """Check whether the encoder of a format is installed."""
+        module = WireUtils.MODULES.get(wire_format)
+        return module is None or RuntimeUtils.is_installed(module)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=MEMO_CACHE_SIZE)
+    def negotiate(accept: str | None) -> WireFormat:
+        """Pick the most preferred available format of an Accept header.
+
+        Anything else, including a missing header, gets JSON.
+        """
+        best_format = WireFormat.JSON
+        best_quality = 0.0
+
+        for media_range in (accept or "").split(","):
+            media_type, *parameters = media_range.split(";")
+            media_type = media_type.strip().lower()
+            if media_type == "application/x-msgpack":
+                media_type = WireFormat.MSGPACK
+
+            quality = WireUtils.get_quality(parameters)
+            if quality <= best_quality:
+                continue
+            if media_type in ("*/*", "application/*", WireFormat.JSON):
+                best_format, best_quality = WireFormat.JSON, quality
+            elif media_type in WireUtils.MODULES and WireUtils.is_available(
+                WireFormat(media_type)
+            ):
+                best_format, best_quality = WireFormat(media_type), quality
+
+        return best_format
+
+    @staticmethod
+    @functools.lru_cache(maxsize=MEMO_CACHE_SIZE)
+    def accepts_encoding(accept_encoding: str | None, coding: str) -> bool:
+        """Check whether an Accept-Encoding header allows a content coding."""
+        qualities = {}
+        for element in (accept_encoding or "").split(","):
+            name, *parameters = element.split(";")
+            qualities[name.strip().lower()] = WireUtils.get_quality(parameters)
+        return qualities.get(coding, qualities.get("*", 0.0)) > 0
+
+    @staticmethod
+    def get_quality(parameters: list[str]) -> float:
+        """Get the q-value of the parameters of a header element, 1 if unset."""
+        for parameter in parameters:
+            name, _, value = parameter.partition("=")
+            if name.strip() == "q":
+                try:
+                    return float(value)
+                except ValueError:
+                    return 0.0
+        return 1.0
+
+    @staticmethod
+    def encode(data: Any, wire_format: WireFormat) -> bytes:
+        """Encode JSON-compatible data in a format."""
+        if wire_format == WireFormat.MSGPACK:
+            import msgpack
+
+            return msgpack.packb(data)
+        if wire_format == WireFormat.CBOR:
+            import cbor2
+
+            return cbor2.dumps(data)
+        return json.dumps(data, separators=(",", ":")).encode("utf-8")
 
 
 class MinecraftUtils:
     """Utility functions for Minecraft."""
 
+    mcsrvstat_cache: dict[str, McSrvStatusCacheEntryData] = {}
+    mcsrvstat_hedge: HedgedRequest[McSrvStatusData] = HedgedRequest("mcsrvstat")
+    server_cache: dict[str, tuple["JavaServer", float]] = {}
+    query_clients: dict[str, QueryClient] = {}
+    motd_cache: LruCache[str, MotdData] = LruCache(MEMO_CACHE_SIZE)
+    players_cache: LruCache[tuple, PlayersData] = LruCache(MEMO_CACHE_SIZE)
+    plugins_cache: LruCache[tuple[str, ...], list[PluginData]] = LruCache(
+        MEMO_CACHE_SIZE
+    )
+    mods_cache: LruCache[tuple, list[ModData]] = LruCache(MEMO_CACHE_SIZE)
+
     @staticmethod
-    async def get_status(
-        host: str,
-        port: int,
-        host_external: str,
-        port_external: int,
-        timeout: int,
-        ping_host_external: str,
-        ping_port_external: int,
-    ) -> Status:
-        """Get the status of the Minecraft server."""
-        status_data = await MinecraftUtils._get_status(
-            host,
-            port,
-            timeout,
-        )
-        status_data_external = await MinecraftUtils._get_status_external(
-            host_external,
-            port_external,
-            timeout,
-            ping_host_external,
-            ping_port_external,
-        )
+    async def lookup(host: str, port: int, timeout: float) -> "JavaServer":
+        """Resolve the server address, reusing SRV lookups until they expire."""
+        from mcstatus import JavaServer
 
-        return Status(
-            data=status_data,
-            data_external=status_data_external,
-        )
+        address = f"{host}:{port}"
+        now = time.time()
+
+        cache_entry = MinecraftUtils.server_cache.get(address)
+        if cache_entry and cache_entry[1] > now:
+            return cache_entry[0]
+
+        server = await JavaServer.async_lookup(address, timeout)
+        MinecraftUtils.server_cache[address] = (server, now + DNS_CACHE_TTL)
+        return server
 
     @staticmethod
-    async def _get_status(
-        host: str,
-        port: int,
-        timeout: int,
-    ) -> StatusData | None:
-        """Get the status of the Minecraft server."""
-        server = await JavaServer.async_lookup(f"{host}:{port}", timeout)
-        query = await JavaServer.async_query(server)
-        if not server:
-            return None
+    async def get_java_status(
+        host: str, port: int, timeout: float
+    ) -> "JavaStatusResponse":
+        """Ping the Minecraft server using the Server List Ping protocol."""
+        server = await MinecraftUtils.lookup(host, port, timeout)
+        return await server.async_status(tries=1)
 
-        try:
-            status = await server.async_status()
-        except Exception:
-            return None
+    @staticmethod
+    async def get_java_query(host: str, port: int, timeout: float) -> "QueryResponse":
+        """Query the Minecraft server using the UDP Query protocol."""
+        server = await MinecraftUtils.lookup(host, port, timeout)
+        ip = await NetUtils.resolve_host_to_ip(server.address.host)
 
-        if not status:
-            return None
+        key = f"{ip}:{server.query_port}"
+        query_client = MinecraftUtils.query_clients.get(key)
+        if query_client is None:
+            query_client = QueryClient(ip, server.query_port, timeout)
+            MinecraftUtils.query_clients[key] = query_client
+        query_client.timeout = timeout
+
+        return await query_client.query()
+
+    @staticmethod
+    def close_query_clients() -> None:
+        """Close the sockets of all persistent query clients."""
+        for query_client in MinecraftUtils.query_clients.values():
+            query_client.close()
+        MinecraftUtils.query_clients.clear()
 
-        players = PlayersData(
-            online=status.players.online,
-            max=status.players.max,
-            player_list=[
-                PlayerData(name=player.name, uuid=player.id)
-                for player in (status.players.sample or [])
-            ]
-            if status.players.sample
-            else None,
+    @staticmethod
+    async def build_status_data(
+        host: str,
+        port: int,
+        status: "JavaStatusResponse",
+        query: "QueryResponse | None",
+    ) -> StatusData:
+        """Merge a status ping and an optional query response into status data.
+
+        The MOTD, the player sample and the plugin and mod lists are memoized by
+        content, they usually come back unchanged for hours.
+        """
+        sample = tuple(
+            (player.name, player.id) for player in status.players.sample or []
+        )
+        players = MinecraftUtils.players_cache.get_or_create(
+            (status.players.online, status.players.max, sample),
+            lambda: PlayersData(
+                online=status.players.online,
+                max=status.players.max,
+                player_list=[PlayerData(name=name, uuid=uuid) for name, uuid in sample]
+                if sample
+                else None,
+            ),
         )
 
+        version = query.software.version if query else status.version.name
+
         protocol = ProtocolData(
-            name=query.software.version,
+            name=version,
             version=status.version.protocol,
         )
 
-        plugins = [
-            PluginData(
-                name=plugin.split(" ")[0],
-                version=plugin.split(" ")[-1],
+        plugins = (
+            MinecraftUtils.plugins_cache.get_or_create(
+                tuple(query.software.plugins),
+                lambda: MinecraftUtils.parse_plugins(query.software.plugins),
             )
-            for plugin in query.software.plugins
-        ]
+            if query
+            else None
+        )
 
         mods = (
-            [
-                ModData(
-                    name=mod.name,
-                    version=mod.marker,
-                )
-                for mod in status.forge_data.mods
-            ]
+            MinecraftUtils.mods_cache.get_or_create(
+                tuple((mod.name, mod.marker) for mod in status.forge_data.mods),
+                lambda: [
+                    ModData(name=mod.name, version=mod.marker)
+                    for mod in status.forge_data.mods
+                ],
+            )
             if status.forge_data and status.forge_data.mods
             else None
         )
 
-        motd = MotdData(
-            plain=status.motd.to_plain(),
-            html=status.motd.to_html(),
+        motd_raw = status.motd.raw
+        motd = MinecraftUtils.motd_cache.get_or_create(
+            motd_raw
+            if isinstance(motd_raw, str)
+            else json.dumps(motd_raw, sort_keys=True),
+            lambda: MotdData(
+                plain=status.motd.to_plain(),
+                html=status.motd.to_html(),
+            ),
         )
 
         ip = await NetUtils.resolve_host_to_ip(host)
@@ -292,11 +552,11 @@ class MinecraftUtils:
             ip=ip,
             port=port,
             hostname=host,
-            version=query.software.version,
+            version=version,
             protocol=protocol,
             icon=status.icon,
             software=status.version.name,
-            map=query.map_name,
+            map=query.map_name if query else None,
             motd=motd,
             players=players,
             plugins=plugins,
@@ -304,12 +564,27 @@ class MinecraftUtils:
         )
 
     @staticmethod
-    async def _get_status_external(
-        host: str, port: int, timeout: int, ping_host: str, ping_port: int
+    def parse_plugins(plugins: list[str]) -> list[PluginData]:
+        """Split the query plugin entries into names and versions."""
+        parsed = []
+        for plugin in plugins:
+            parts = plugin.split(" ")
+            parsed.append(PluginData(name=parts[0], version=parts[-1]))
+        return parsed
+
+    @staticmethod
+    async def get_status_external(
+        base_url: str,
+        host: str,
+        port: int,
+        timeout: int,
+        ping_host: str,
+        ping_port: int,
+        circuit_breaker: CircuitBreaker,
     ) -> StatusData | None:
         """Get the status from mcsrvstat API."""
         mcsrvstat_status = await MinecraftUtils._get_mcsrvstat_status(
-            host, port, timeout
+            base_url, host, port, timeout, circuit_breaker
         )
 
         if not mcsrvstat_status:
@@ -343,12 +618,47 @@ class MinecraftUtils:
 
     @staticmethod
     async def _get_mcsrvstat_status(
-        host: str, port: int, timeout: int
+        base_url: str,
+        host: str,
+        port: int,
+        timeout: int,
+        circuit_breaker: CircuitBreaker,
     ) -> McSrvStatusData | None:
-        base_url = "https://api.mcsrvstat.us"
         version = "3"
 
-        url = f"{base_url}/{version}/{host}:{port}"
+        url = f"{base_url.rstrip('/')}/{version}/{host}:{port}"
+
+        now = time.time()
+        cache_entry = MinecraftUtils.mcsrvstat_cache.get(url)
+        if cache_entry and cache_entry.expires_at > now:
+            return cache_entry.data
+
+        if not circuit_breaker.allow():
+            return None
+
+        mcsrvstat_status = await MinecraftUtils.mcsrvstat_hedge.run(
+            lambda: MinecraftUtils._fetch_mcsrvstat_status(url, timeout)
+        )
+        if not mcsrvstat_status:
+            circuit_breaker.record_failure()
+        else:
+            circuit_breaker.record_success()
+            # mcsrvstat.us serves the same cached answer until cacheexpire,
+            # asking again before that only costs a round trip.
+            expires_at = mcsrvstat_status.debug.cacheexpire
+            if expires_at <= now:
+                expires_at = now + MCSRVSTAT_CACHE_TTL
+            MinecraftUtils.mcsrvstat_cache[url] = McSrvStatusCacheEntryData(
+                url=url,
+                data=mcsrvstat_status,
+                expires_at=expires_at,
+            )
+
+        return mcsrvstat_status
+
+    @staticmethod
+    async def _fetch_mcsrvstat_status(url: str, timeout: int) -> McSrvStatusData | None:
+        import httpx
 
         headers = {"User-Agent": "minecraft-dashboard"}
 
@@ -441,9 +751,31 @@ class OpenApiUtils:
     """Utility functions for OpenAPI specification generation."""
 
     @staticmethod
-    def generate_openapi_spec(application: Any, output_path: Path) -> dict:
-        """Generate OpenAPI specification from a FastAPI application."""
-        openapi_schema = application.openapi()
+    def get_openapi_spec(application: Any, api_application: Any, prefix: str) -> dict:
+        """Generate the OpenAPI specification of an API mounted under a prefix."""
+        from fastapi.openapi.utils import get_openapi
+
+        openapi_schema = get_openapi(
+            title=application.title,
+            version=application.version,
+            description=application.description,
+            routes=api_application.routes,
+        )
+        openapi_schema["paths"] = {
+            f"{prefix}{path}": path_item
+            for path, path_item in openapi_schema.get("paths", {}).items()
+        }
+
+        return openapi_schema
+
+    @staticmethod
+    def generate_openapi_spec(
+        application: Any, api_application: Any, prefix: str, output_path: Path
+    ) -> dict:
+        """Write the OpenAPI specification of an API mounted under a prefix."""
+        openapi_schema = OpenApiUtils.get_openapi_spec(
+            application, api_application, prefix
+        )
 
         output_path.parent.mkdir(parents=True, exist_ok=True)
         with output_path.open("w", encoding="utf-8") as file:
@@ -455,14 +787,20 @@ class OpenApiUtils:
 
 
 class NetUtils:
+    dns_cache: dict[str, DnsCacheEntryData] = {}
+
     @staticmethod
     async def get_latency(host: str, port: int, timeout: float = 1.5) -> float:
         """Get the network latency to a host using TCP connection time with multiple measurements."""
-        latencies = measure_latency(
+        from tcp_latency import measure_latency
+
+        latencies = await asyncio.to_thread(
+            measure_latency,
             host=host,
             port=port,
             runs=3,
             timeout=timeout,
+            wait=0,
         )
 
         if not latencies:
@@ -482,6 +820,11 @@ class NetUtils:
         except ValueError:
             pass
 
+        now = time.time()
+        cache_entry = NetUtils.dns_cache.get(host)
+        if cache_entry and cache_entry.expires_at > now:
+            return cache_entry.ip
+
         try:
             try:
                 loop = asyncio.get_running_loop()
@@ -494,7 +837,61 @@ class NetUtils:
 
             sockaddr = infos[0][4]
             ip = sockaddr[0]
+            NetUtils.dns_cache[host] = DnsCacheEntryData(
+                host=host,
+                ip=ip,
+                expires_at=now + DNS_CACHE_TTL,
+            )
             return ip
         except Exception as exception:
             logger.debug(f"DNS resolution failed for host '{host}': {exception}")
             return host
+
+
+class StateUtils:
+    """Utility functions for persisting state across restarts."""
+
+    @staticmethod
+    def save(state_path: Path, status: Status | None) -> None:
+        """Write the latest status and the probe caches to a compressed file."""
+        state = WarmStartData(
+            saved_at=time.time(),
+            status=status,
+            dns_cache=list(NetUtils.dns_cache.values()),
+            mcsrvstat_cache=list(MinecraftUtils.mcsrvstat_cache.values()),
+        )
+
+        state_path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = state_path.with_name(f"{state_path.name}.tmp")
+        temporary_path.write_bytes(
+            gzip.compress(state.model_dump_json(exclude_none=True).encode("utf-8"))
+        )
+        temporary_path.replace(state_path)
+
+        logger.info(f"Saved warm-start state to {state_path}")
+
+    @staticmethod
+    def load(state_path: Path) -> Status | None:
+        """Restore the probe caches and return the last persisted status."""
+        if not state_path.exists():
+            return None
+
+        try:
+            state = WarmStartData.model_validate_json(
+                gzip.decompress(state_path.read_bytes())
+            )
+        except Exception as exception:
+            logger.warning(f"Ignoring unreadable state file {state_path}: {exception}")
+            return None
+
+        now = time.time()
+        for dns_entry in state.dns_cache:
+            if dns_entry.expires_at > now:
+                NetUtils.dns_cache[dns_entry.host] = dns_entry
+        for mcsrvstat_entry in state.mcsrvstat_cache:
+            if mcsrvstat_entry.expires_at > now:
+                MinecraftUtils.mcsrvstat_cache[mcsrvstat_entry.url] = mcsrvstat_entry
+
+        logger.info(f"Loaded warm-start state from {state_path}")
+
+        return state.status